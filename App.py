@@ -1,16 +1,51 @@
 from flask import request
 from flaskapp import create_app
 from flask_cors import CORS
-from swagger_ui import flask_api_doc
 from markupsafe import escape
-import json
-from datetime import datetime, timedelta, MAXYEAR
+from datetime import date, timedelta, MAXYEAR
 from honbasho_calendar import HonbashoCalendar
+from honbasho_ical import HonbashoICalendar
+from date_calculator import DateCalculator
+from date_codec import DateCodec
+from integer_batch import IntegerBatch
 from devtest_helper import DevtestHelper
+from worker_roster import WorkerRoster
+from worker_store import WorkerStore
+from worker_query import WorkerQuery
+from api_doc import ApiDoc
+from response_compression import ResponseCompression
+from response_cache import ResponseCache
 
 application = create_app()
-flask_api_doc(application, config_path='./api/doc/swagger.yaml', url_prefix='/api/doc', title='Python Web Service Demo | API doc')
+api_doc = ApiDoc(config_path='./api/doc/swagger.yaml', url_prefix='/api/doc', title='Python Web Service Demo | API doc',
+                 static_dir=application.config['API_DOC_STATIC_DIR'])
+api_doc.init_app(application, application.config['API_DOC_MODE'])
 CORS(application)
+if application.config['METRICS_ENABLED']:
+    from request_metrics import RequestMetrics # prometheus_client is only imported if the metrics are enabled.
+    RequestMetrics.init_app(application)
+if application.config['COMPRESSION_ENABLED']:
+    application.wsgi_app = ResponseCompression(application.wsgi_app, min_size=application.config['COMPRESSION_MIN_SIZE'],
+                                               gzip_level=application.config['COMPRESSION_GZIP_LEVEL'],
+                                               brotli_quality=application.config['COMPRESSION_BROTLI_QUALITY'])
+response_cache = ResponseCache.create(application.config)
+
+# The endpoints with a simulated delay (see `DevtestHelper`), and the key of the delay.
+# The delay is simulated before the view is called, so that it also applies to responses from the cache.
+delayed_endpoints = {
+    'get_honbasho_schedule' : 'HONBASHO_SCHEDULE',
+    'get_honbasho_schedule_range' : 'HONBASHO_SCHEDULE',
+    'find_honbasho' : 'HONBASHO_SCHEDULE'
+}
+
+@application.before_request
+def simulate_delay():
+    """
+    Simulates the delay of the requested endpoint, if it has one (only in development environments).
+    """
+    delay_key = delayed_endpoints.get(request.endpoint)
+    if delay_key is not None:
+        DevtestHelper.simulate_delay(delay_key)
 
 @application.route('/')
 def hello_world():
@@ -21,6 +56,7 @@ def hello_world():
     return '<h1>Hello World!</h1>'
 
 @application.route('/greeting/<name>')
+@response_cache.cached()
 def personal_greeting(name):
     """
     Prints a personalized greeting.
@@ -38,7 +74,7 @@ def healthcheck():
     application.logger.debug("Healthcheck triggered.")
     return "OK";
 
-days_of_week = { "MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY" }
+worker_store = WorkerStore.create(application.config)
 
 @application.route('/getWorkers', methods=["POST"])
 def get_workers():
@@ -47,30 +83,83 @@ def get_workers():
 
     If a set of work days (as day of week) is provided in the request data,
     only workers whose work days include all the specified days of week will be returned.
+
+    The list comes from the configured `worker_store`.
+    By default, the file is held in memory by a `WorkerRoster` and is re-read only when it changes,
+    and filtering is a lookup in the roster's index by the day mask of `work_days`.
+
+    The list may also be filtered by `age_min`/`age_max` (inclusive), `sex` and `is_reg_member`,
+    and sorted by `sort_by` ("name" or "age") in `order` ("asc" or "desc").
+    These are answered from the precomputed indexes of the roster (see `WorkerIndex`).
+
+    The encoded response body of each distinct query is cached until the roster reloads,
+    and is returned with a strong ETag.
+    A request with a matching `If-None-Match` header is answered with 304 (Not Modified).
+
+    The list may be paginated by `limit` (page size) and `cursor` (returned as `next_cursor`
+    by the previous page) in the request data.
+    If the request accepts `application/x-ndjson` ahead of JSON, the (page of) workers is streamed
+    as newline-delimited JSON instead, with the next cursor in response header `X-Next-Cursor`.
     """
 
-    with open("data/worker_list.json", encoding="utf8") as data_file:
-        worker_list = json.load(data_file)
+    snapshot = worker_store.get_snapshot()
 
+    if not isinstance(request.json, dict):
+        application.logger.error("[get_workers] The request data is not a JSON object!")
+        return unsuccessful_response_json(400, "The request data must be a JSON object!")
     work_days = set([] if "work_days" not in request.json else request.json["work_days"])
-    application.logger.debug(f"[get_workers] Request param work_days: {work_days}.\nRequest data: {request.json}")
-    if len(work_days) > 0:
-        if not work_days.issubset(days_of_week): # "work_days" includes an invalid value
-            application.logger.error(f"[get_workers] Invalid value(s) in work_days!")
-            return unsuccessful_response_json(400, "Invalid value for parameter work_days!")
-        return {
-            "workers" : [
-                worker for worker in worker_list["workers"] if work_days.issubset(worker["work_days"])
-            ]
-        }
-    return worker_list
+    application.logger.debug("[get_workers] Request param work_days: %s.\nRequest data: %s", work_days, request.json)
+    if not work_days.issubset(WorkerRoster.days_of_week): # "work_days" includes an invalid value
+        application.logger.error("[get_workers] Invalid value(s) in work_days!")
+        return unsuccessful_response_json(400, "Invalid value for parameter work_days!")
+    try:
+        query = WorkerQuery.from_request(request.json, WorkerRoster.encode_days(work_days))
+    except ValueError as e:
+        application.logger.error("[get_workers] %s", e)
+        return unsuccessful_response_json(400, str(e))
+
+    stream = request.accept_mimetypes.best_match([ application.json.mimetype, ndjson_mimetype ]) == ndjson_mimetype
+    if stream or "limit" in request.json or "cursor" in request.json:
+        limit = request.json.get("limit")
+        if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool) or limit < 1):
+            return unsuccessful_response_json(400, "'limit' must be a positive integer!")
+        cursor = request.json.get("cursor", "0")
+        if not isinstance(cursor, str) or not cursor.isascii() or not cursor.isdigit(): # As `next_cursor`.
+            application.logger.error('[get_workers] Invalid value for parameter "cursor": %r', cursor)
+            return unsuccessful_response_json(400, "Invalid value for parameter cursor!")
+        start = int(cursor)
+
+        workers, next_start = snapshot.find_page(query, start, limit)
+        next_cursor = str(next_start) if next_start is not None else None
+        if stream:
+            response = ndjson_response(workers)
+            if next_cursor is not None:
+                response.headers["X-Next-Cursor"] = next_cursor
+            return response
+        result = { "workers" : list(workers) }
+        if next_cursor is not None:
+            result["next_cursor"] = next_cursor
+        return result
+
+    body, etag = snapshot.get_encoded(query, encode_response_json)
+    if request.if_none_match.contains(etag):
+        response = application.response_class(status=304)
+    else:
+        response = application.response_class(body, mimetype=application.json.mimetype)
+    response.set_etag(etag)
+    return response
 
 @application.route('/timestwo', methods=["POST"])
+@response_cache.cached()
 def multiply_by_two():
     """
     Multiplies a given integer by 2.
+
+    In batch mode, multiplies each of a batch of integers by 2 (see `multiply_by_two_batch()`).
     """
 
+    if request.mimetype in (application.json.mimetype, packed_int64_mimetype):
+        return multiply_by_two_batch()
     if 'num' not in request.form:
         application.logger.error("[multiply_by_two] 'num' not present in request parameters.")
         return unsuccessful_response_json(400, "'num' not present in request parameters.")
@@ -78,18 +167,48 @@ def multiply_by_two():
     try:
         num = int(request.form['num'])
     except ValueError as e:
-        application.logger.error(f'[multiply_by_two] Invalid value for parameter "num": {e}')
+        application.logger.error('[multiply_by_two] Invalid value for parameter "num": %s', e)
         return unsuccessful_response_json(400, "'num' must be an integer.")
     result = num * 2
-    application.logger.debug(f"[multiply_by_two] result = {num} * 2 = {result}")
+    application.logger.debug("[multiply_by_two] result = %d * 2 = %d", num, result)
     return {
         "num" : num,
         "result" : result
     }
 
-json_date_format = "%Y-%m-%d"
+packed_int64_mimetype = "application/octet-stream"
+timestwo_max_items = 1000000
+
+def multiply_by_two_batch():
+    '''
+    Batch mode of `/timestwo`, in the same format as the request data:
+    1. `application/json`: A JSON array of integers, answered with a JSON array of the results.
+    2. `application/octet-stream`: Packed little-endian signed 64-bit integers, answered with the results packed the same way.
+
+    At most `timestwo_max_items` integers may be sent at once.
+    '''
+    if request.mimetype == packed_int64_mimetype:
+        data = request.get_data()
+        if len(data) > timestwo_max_items * IntegerBatch.item_size:
+            return unsuccessful_response_json(400, f'At most {timestwo_max_items} integers can be sent at once.')
+        try:
+            results = IntegerBatch.double_packed(data)
+        except ValueError as e:
+            return unsuccessful_response_json(400, str(e))
+        return application.response_class(results, mimetype=packed_int64_mimetype)
+
+    nums = request.get_json(silent=True)
+    if not isinstance(nums, list):
+        return unsuccessful_response_json(400, "The request data must be a JSON array of integers.")
+    if len(nums) > timestwo_max_items:
+        return unsuccessful_response_json(400, f'At most {timestwo_max_items} integers can be sent at once.')
+    if not all(isinstance(num, int) and not isinstance(num, bool) for num in nums):
+        return unsuccessful_response_json(400, "'num' must be an integer.")
+    return application.response_class(application.json.dumps(IntegerBatch.double(nums), separators=compact_separators),
+                                      mimetype=application.json.mimetype)
 
 @application.route('/calculateDate', methods=["POST"])
+@response_cache.cached()
 def calculate_date():
     """
     Calculates the date a specified number of weeks
@@ -97,7 +216,7 @@ def calculate_date():
     """
 
     try:
-        orig_date = datetime.strptime(request.json["date"], json_date_format)
+        orig_date = DateCodec.parse(request.json["date"])
     except KeyError:
         return unsuccessful_response_json(400, "'date' is missing from request!")
     except ValueError:
@@ -112,39 +231,226 @@ def calculate_date():
     time_delta = timedelta(weeks=num_of_weeks)
 
     new_time = orig_date + time_delta
-    application.logger.debug(f'[calculate_date] orig_date: {orig_date}, new_time: {new_time}\n(time_delta: {time_delta}))')
+    application.logger.debug('[calculate_date] orig_date: %s, new_time: %s\n(time_delta: %s))', orig_date, new_time, time_delta)
     return {
-        "result" : new_time.strftime(json_date_format)
+        "result" : DateCodec.format(new_time)
     }
 
-honbasho_schedule_minyear = 2012
+calculate_dates_max_items = 1000000
+
+@application.route('/calculateDates', methods=["POST"])
+def calculate_dates():
+    """
+    Batch version of `/calculateDate`, which calculates the date a specified number of weeks
+    before/after each of a batch of dates.
+
+    The request data is either:
+    1. `{ "items": [ { "date": ..., "weeks": ... }, ... ] }`, ie. an array of `/calculateDate` requests, or
+    2. `{ "date": ..., "weeks": [ ... ] }`, ie. one date with an array of numbers of weeks.
+
+    Each item of the response's `results` is `{ "result": ... }`, or `{ "error": ... }` if the item is invalid.
+    At most `calculate_dates_max_items` items may be requested at once.
+    """
+
+    data = request.json
+    if isinstance(data, dict) and isinstance(data.get("items"), list):
+        items = data["items"]
+        dates = [ item.get("date") if isinstance(item, dict) else None for item in items ]
+        weeks = [ item.get("weeks") if isinstance(item, dict) else None for item in items ]
+    elif isinstance(data, dict) and "date" in data and isinstance(data.get("weeks"), list):
+        weeks = data["weeks"]
+        dates = [ data["date"] ] * len(weeks)
+    else:
+        return unsuccessful_response_json(400, "Either 'items' or 'date' and an array of 'weeks' must be provided!")
+    if len(dates) > calculate_dates_max_items:
+        return unsuccessful_response_json(400, f'At most {calculate_dates_max_items} items can be requested at once!')
+
+    results = DateCalculator.add_weeks(dates, weeks)
+    return {
+        "results" : [ { "error" : str(result) } if isinstance(result, ValueError) else { "result" : result }
+                      for result in results ]
+    }
+
+honbasho_schedule_minyear = HonbashoCalendar.min_year
+if application.config['HONBASHO_PRECOMPUTE']:
+    HonbashoCalendar.precompute()
+
 @application.route('/getSumoHonbashoSchedule', methods=["GET"])
+@response_cache.cached(vary=("Accept",))
 def get_honbasho_schedule():
     """
     Calculates and returns the Grand Sumo Tournament schedule for a given year.
 
     Requires an argument "year", which is an year number (integer).
     The year must be between 2012 and 2100, inclusive.
+
+    If the argument "format" is "ics", or the request accepts `text/calendar` ahead of JSON,
+    the schedule is returned as an iCalendar feed instead (see `honbasho_ical_response()`).
+    Either response varies by `Accept`, so that a shared cache never returns one for a request of the other.
+    """
+
+    try:
+        year = parse_year_argument("year", "get_honbasho_schedule")
+    except ValueError as e:
+        return unsuccessful_response_json(400, str(e))
+    if request.args.get("format") == "ics" \
+            or request.accept_mimetypes.best_match([ application.json.mimetype, HonbashoICalendar.mimetype ]) == HonbashoICalendar.mimetype:
+        response = honbasho_ical_response(year)
+    else:
+        schedule = HonbashoCalendar.calculate_schedule(year)
+        response = application.json.response({
+            "result" : format_honbasho_schedule(schedule)
+        })
+    response.vary.add("Accept")
+    return response
+
+honbasho_schedule_max_years = 100
+
+@application.route('/getSumoHonbashoScheduleRange', methods=["GET"])
+def get_honbasho_schedule_range():
     """
+    Calculates and returns the Grand Sumo Tournament schedules for a range of years.
 
-    DevtestHelper.simulate_delay("HONBASHO_SCHEDULE")
+    Requires arguments "from_year" and "to_year" (inclusive), which are year numbers (integers)
+    in the same range as the argument "year" of `/getSumoHonbashoSchedule`.
+    At most `honbasho_schedule_max_years` years may be requested at once.
 
-    if not "year" in request.args:
-        return unsuccessful_response_json(400, "'year' must be provided in the request arguments!")
-    
+    The schedules are calculated in one batch and streamed year by year,
+    as a JSON object `{ "results": [...] }`, or as newline-delimited JSON (one year per line)
+    if the request accepts `application/x-ndjson` ahead of JSON.
+    """
+
+    try:
+        from_year = parse_year_argument("from_year", "get_honbasho_schedule_range")
+        to_year = parse_year_argument("to_year", "get_honbasho_schedule_range")
+    except ValueError as e:
+        return unsuccessful_response_json(400, str(e))
+    if to_year < from_year:
+        return unsuccessful_response_json(400, "Request argument 'to_year' cannot be before 'from_year'!")
+    if to_year - from_year + 1 > honbasho_schedule_max_years:
+        return unsuccessful_response_json(400, f'At most {honbasho_schedule_max_years} years can be requested at once!')
+    schedules = HonbashoCalendar.calculate_schedule_range(from_year, to_year)
+
+    results = ({
+        "year" : year,
+        "result" : format_honbasho_schedule(schedule)
+    } for year, schedule in zip(range(from_year, to_year + 1), schedules))
+    if request.accept_mimetypes.best_match([ application.json.mimetype, ndjson_mimetype ]) == ndjson_mimetype:
+        return ndjson_response(results)
+
+    def generate():
+        yield '{"results":['
+        for i, result in enumerate(results):
+            yield ("," if i > 0 else "") + application.json.dumps(result, separators=compact_separators)
+        yield ']}\n'
+    ResponseCompression.allow_streaming(request.environ)
+    return application.response_class(generate(), mimetype=application.json.mimetype)
+
+honbasho_lookup_max_dates = 1000
+
+@application.route('/findSumoHonbasho', methods=["GET", "POST"])
+def find_honbasho():
+    """
+    Finds the Grand Sumo Tournament held on each of a batch of dates (with its day number),
+    and the next tournament after each date.
+
+    The dates are in YYYY-MM-DD format, either as one or more arguments "date" (GET)
+    or as an array "dates" in the request data (POST).
+    At most `honbasho_lookup_max_dates` dates may be requested at once.
+    """
+
+    if request.method == "POST":
+        if request.json is not None and not isinstance(request.json, dict):
+            return unsuccessful_response_json(400, "The request data must be a JSON object!")
+        dates = (request.json or {}).get("dates")
+        if not isinstance(dates, list) or not dates:
+            return unsuccessful_response_json(400, "'dates' must be a non-empty array!")
+    else:
+        dates = request.args.getlist("date")
+        if not dates:
+            return unsuccessful_response_json(400, "'date' must be provided in the request arguments!")
+    if len(dates) > honbasho_lookup_max_dates:
+        return unsuccessful_response_json(400, f'At most {honbasho_lookup_max_dates} dates can be requested at once!')
     try:
-        year = int(request.args["year"])
+        days = [ DateCodec.parse(value) for value in dates ]
+    except (TypeError, ValueError) as e:
+        application.logger.error('[find_honbasho] Invalid date.\nMessage: %s', e)
+        return unsuccessful_response_json(400, "'date' must be in YYYY-MM-DD format!")
+
+    return {
+        "results" : [ {
+            "date" : DateCodec.format(day),
+            "current" : format_honbasho_lookup(lookup["current"]),
+            "next" : format_honbasho_lookup(lookup["next"])
+        } for day, lookup in zip(days, HonbashoCalendar.find_bashos(days)) ]
+    }
+
+def format_honbasho_lookup(lookup: dict) -> dict:
+    '''
+    Formats a tournament found by `HonbashoCalendar.find_basho()` for the response data.
+    '''
+    if lookup is None:
+        return None
+    basho = lookup["basho"]
+    result = {
+        "year" : lookup["year"],
+        "basho" : basho.get_name(),
+        "month" : basho.get_month(),
+        "month_name" : basho.get_month_name(),
+        "start_date" : DateCodec.format(lookup["day_one"]),
+        "end_date" : DateCodec.format(lookup["day_one"] + timedelta(days=HonbashoCalendar.days - 1))
+    }
+    if "day" in lookup:
+        result["day"] = lookup["day"]
+    return result
+
+def honbasho_ical_response(year: int):
+    '''
+    Builds the response of the iCalendar feed of a year, from the cached feed.
+
+    The response has a strong ETag and a Last-Modified time, and is answered with 304 (Not Modified)
+    if the request has a matching `If-None-Match` or `If-Modified-Since` header.
+    The feed of a past year never changes, so it may be cached as immutable.
+    '''
+    body, etag = HonbashoICalendar.get_feed(year)
+    response = application.response_class(body, mimetype=HonbashoICalendar.mimetype)
+    response.headers["Content-Disposition"] = f'inline; filename="honbasho-{year}.ics"'
+    response.set_etag(etag)
+    response.last_modified = HonbashoICalendar.last_modified
+    response.cache_control.public = True
+    if year < date.today().year:
+        response.cache_control.max_age = 365 * 24 * 60 * 60
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.max_age = 24 * 60 * 60
+    return response.make_conditional(request)
+
+def parse_year_argument(name: str, handler: str) -> int:
+    '''
+    Parses a year number request argument of the honbasho schedule endpoints.
+
+    Raises `ValueError` with the error message for the response if the argument is absent or invalid.
+    '''
+    if not name in request.args:
+        raise ValueError(f"'{name}' must be provided in the request arguments!")
+
+    try:
+        year = int(request.args[name])
     except ValueError as e:
-        application.logger.error(f'[get_honbasho_schedule] Invalid value for parameter "year".\nMessage: {e}')
-        return unsuccessful_response_json(400, "Request argument 'year' must be an integer!")
+        application.logger.error('[%s] Invalid value for parameter "%s".\nMessage: %s', handler, name, e)
+        raise ValueError(f"Request argument '{name}' must be an integer!")
     if year < honbasho_schedule_minyear:
-        application.logger.error(f'[get_honbasho_schedule] Invalid value for parameter "year": {year} < honbasho_schedule_minyear')
-        return unsuccessful_response_json(400, f'Request argument \'year\' cannot be before {honbasho_schedule_minyear}!')
+        application.logger.error('[%s] Invalid value for parameter "%s": %d < honbasho_schedule_minyear', handler, name, year)
+        raise ValueError(f'Request argument \'{name}\' cannot be before {honbasho_schedule_minyear}!')
     if year > MAXYEAR:
-        application.logger.error(f'[get_honbasho_schedule] Invalid value for parameter "year": {year} > MAXYEAR')
-        return unsuccessful_response_json(400, "Request argument 'year' exceeded maximum allowed year value!")
-    schedule = HonbashoCalendar.calculate_schedule(year)
+        application.logger.error('[%s] Invalid value for parameter "%s": %d > MAXYEAR', handler, name, year)
+        raise ValueError(f"Request argument '{name}' exceeded maximum allowed year value!")
+    return year
 
+def format_honbasho_schedule(schedule: list) -> list:
+    '''
+    Formats a schedule returned by `HonbashoCalendar` for the response data.
+    '''
     result = []
     for basho in schedule:
         label = basho["basho"]
@@ -152,11 +458,47 @@ def get_honbasho_schedule():
             "basho" : label.get_name(),
             "month" : label.get_month(),
             "month_name": label.get_month_name(),
-            "dates" : [ d .strftime(json_date_format) for d in basho["dates"] ]
+            "dates" : list(map(DateCodec.format, basho["dates"]))
         })
-    return {
-        "result" : result
-    }
+    return result
+
+@application.route('/getWorkerRosterStats', methods=["GET"])
+def get_worker_roster_stats():
+    """
+    Returns the counters of the worker store,
+    eg. the cache hit and reload counters of the in-memory worker roster.
+    """
+
+    return worker_store.stats()
+
+@application.route('/getResponseCacheStats', methods=["GET"])
+def get_response_cache_stats():
+    """
+    Returns the counters of the response cache of this process:
+    hits and misses by endpoint, and the entries, bytes, evictions and expirations of the cache.
+    """
+
+    return response_cache.stats()
+
+def encode_response_json(data) -> bytes:
+    '''
+    Encodes data into the same JSON response body that returning it from a view would produce.
+    '''
+    return application.json.response(data).get_data()
+
+ndjson_mimetype = "application/x-ndjson"
+compact_separators = ( ",", ":" ) # As in the response bodies of `application.json.response()`.
+
+def ndjson_response(items):
+    '''
+    Builds a streaming response with one JSON document per line (NDJSON) for each item.
+    Items are encoded only as the response body is being sent, and compressed as they are sent if the request accepts it.
+    '''
+    def generate():
+        for item in items:
+            yield application.json.dumps(item, separators=compact_separators) + "\n"
+    ResponseCompression.allow_streaming(request.environ)
+    return application.response_class(generate(), mimetype=ndjson_mimetype)
 
 def unsuccessful_response_json(status_code: int, message: str):
     '''
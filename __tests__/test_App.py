@@ -1,8 +1,11 @@
 import unittest
 from unittest.mock import patch, mock_open
-from App import application
+from App import application, worker_store, response_cache
 from honbasho_calendar import HonbashoCalendar
+from devtest_helper import DevtestHelper
+import gzip
 import json
+import struct
 from datetime import date
 import calendar
 
@@ -20,6 +23,7 @@ class TestWebApp(unittest.TestCase):
         self.appctx = application.app_context()
         self.appctx.push()
         self.client = application.test_client()
+        response_cache.clear()
     
     def tearDown(self):
         """
@@ -153,6 +157,113 @@ class TestWebApp(unittest.TestCase):
                                   self.get_expected_response_body(400,
                                                                   error_message="Invalid value for parameter work_days!"))
 
+    def test_get_workers_query(self):
+        """
+        Test case on endpoint `/getWorkers` with the age, sex, membership and sort parameters.
+        """
+        self.run_test_get_workers({ "age_min" : 30, "sex" : "M" }, 200, {
+            "workers" : TestWebApp.workers["workers"][0:2]
+        })
+        self.run_test_get_workers({ "is_reg_member" : False, "sort_by" : "age" }, 200, {
+            "workers" : [ TestWebApp.workers["workers"][2], TestWebApp.workers["workers"][1] ]
+        })
+        self.run_test_get_workers({ "work_days" : [ "MONDAY" ], "sort_by" : "name", "order" : "desc", "limit" : 1 }, 200, {
+            "workers" : [ TestWebApp.workers["workers"][2] ],
+            "next_cursor" : "1"
+        })
+
+    def test_get_workers_query_invalid(self):
+        """
+        Test case on endpoint `/getWorkers` where a query parameter is invalid.
+        """
+        self.run_test_get_workers({ "age_max" : "old" }, 400,
+                                  self.get_expected_response_body(400,
+                                                                  error_message="Invalid value for parameter age_max!"))
+
+    def test_get_workers_data_invalid(self):
+        """
+        Test case on endpoint `/getWorkers` where the request data is not a JSON object.
+        """
+        for data in [ [], [ "MONDAY" ], "x", 1 ]:
+            self.run_test_get_workers(data, 400,
+                                      self.get_expected_response_body(400,
+                                                                      error_message="The request data must be a JSON object!"))
+
+    def test_get_workers_paginated(self):
+        """
+        Test case on endpoint `/getWorkers` where the list is paginated by `limit` and `cursor`.
+        """
+        self.run_test_get_workers({ "limit" : 2 }, 200, {
+            "workers" : TestWebApp.workers["workers"][0:2],
+            "next_cursor" : "2"
+        })
+        self.run_test_get_workers({ "limit" : 2, "cursor" : "2" }, 200, {
+            "workers" : TestWebApp.workers["workers"][2:]
+        })
+        self.run_test_get_workers({ "work_days" : [ "MONDAY" ], "limit" : 1, "cursor" : "1" }, 200, {
+            "workers" : [ TestWebApp.workers["workers"][2] ]
+        })
+
+    def test_get_workers_limit_invalid(self):
+        """
+        Test case on endpoint `/getWorkers` where `limit` is not a positive integer.
+        """
+        for limit in [ 0, -1, 1.5, "2", True ]:
+            self.run_test_get_workers({ "limit" : limit }, 400,
+                                      self.get_expected_response_body(400,
+                                                                      error_message="'limit' must be a positive integer!"))
+
+    def test_get_workers_cursor_invalid(self):
+        """
+        Test case on endpoint `/getWorkers` where `cursor` is not a valid cursor.
+        """
+        for cursor in [ "-1", "abc", None, 1, 1.5, True, "1.5", " 1", "+1", "", "²" ]:
+            self.run_test_get_workers({ "limit" : 1, "cursor" : cursor }, 400,
+                                      self.get_expected_response_body(400,
+                                                                      error_message="Invalid value for parameter cursor!"))
+
+    @patch("builtins.open", new_callable=mock_open, read_data=workers_json_text)
+    def test_get_workers_ndjson(self, mock_file):
+        """
+        Test case on endpoint `/getWorkers` where the request accepts NDJSON.
+        """
+        worker_store.invalidate()
+        response = self.client.post('/getWorkers', json={ "work_days" : [ "FRIDAY" ], "limit" : 1 },
+                                    headers={ "Accept" : "application/x-ndjson" })
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        assert response.headers["X-Next-Cursor"] == "1"
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertEqual([ TestWebApp.workers["workers"][0] ], [ json.loads(line) for line in lines ])
+
+        response = self.client.post('/getWorkers', json={},
+                                    headers={ "Accept" : "application/x-ndjson" })
+        assert "X-Next-Cursor" not in response.headers
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertEqual(TestWebApp.workers["workers"], [ json.loads(line) for line in lines ])
+
+    @patch("builtins.open", new_callable=mock_open, read_data=workers_json_text)
+    def test_get_workers_etag(self, mock_file):
+        """
+        Test case on endpoint `/getWorkers` where the request has an `If-None-Match` header
+        with the ETag of a previous response.
+        """
+        worker_store.invalidate()
+        response = self.client.post('/getWorkers', json={ "work_days" : [ "MONDAY" ] })
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = self.client.post('/getWorkers', json={ "work_days" : [ "MONDAY" ] },
+                                    headers={ "If-None-Match" : etag })
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.get_data() == b""
+
+        response = self.client.post('/getWorkers', json={ "work_days" : [ "SUNDAY" ] },
+                                    headers={ "If-None-Match" : etag })
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
     @patch("builtins.open", new_callable=mock_open, read_data=workers_json_text)
     def run_test_get_workers(self,
                              param_work_days,
@@ -163,12 +274,35 @@ class TestWebApp(unittest.TestCase):
         Runs a test case on endpoint `/getWorkers`.
         """
         filename = "data/worker_list.json"
+        worker_store.invalidate() # Forces the mock data file to be loaded.
         response = self.client.post('/getWorkers', json=param_work_days)
         self.verify_endpoint_with_json_response_data(response, expected_status_code, expected_data)
 
         assert open(filename, "utf8").read() == TestWebApp.workers_json_text
         mock_file.assert_called_with(filename, "utf8")
 
+    def test_get_worker_roster_stats(self):
+        """
+        Test case on endpoint `/getWorkerRosterStats`.
+        """
+        response = self.client.get('/getWorkerRosterStats')
+        assert response.status_code == 200
+        data = json.loads(response.get_data())
+        self.assertEqual(worker_store.stats(), data)
+
+    def test_get_response_cache_stats(self):
+        """
+        Test case on endpoint `/getResponseCacheStats`, after requests to a cached endpoint.
+        """
+        for _ in range(2):
+            response = self.client.post('/timestwo', json=[ 1, 2 ])
+            assert response.json == [ 2, 4 ]
+        response = self.client.get('/getResponseCacheStats')
+        assert response.status_code == 200
+        data = json.loads(response.get_data())
+        assert data["endpoints"]["multiply_by_two"] == { "hits" : 1, "shared_hits" : 0, "misses" : 1 }
+        assert data["local"]["entries"] == 1
+
     def test_multiply_by_two_normal(self):
         """
         Happy path test case on endpoint `/timestwo`.
@@ -205,6 +339,34 @@ class TestWebApp(unittest.TestCase):
                 "message" : "'num' not present in request parameters."
             }, data)
 
+    def test_multiply_by_two_batch_json(self):
+        """
+        Test case on endpoint `/timestwo` with a JSON array of integers.
+        """
+        response = self.client.post('/timestwo', json=[ 3, -7, 2 ** 70 ])
+        assert response.status_code == 200
+        assert json.loads(response.get_data()) == [ 6, -14, 2 ** 71 ]
+
+        for request_data, message in [ ([ 3, "4" ], "'num' must be an integer."),
+                                       ([ 3, True ], "'num' must be an integer."),
+                                       ({ "num" : 3 }, "The request data must be a JSON array of integers.") ]:
+            response = self.client.post('/timestwo', json=request_data)
+            self.verify_endpoint_with_json_response_data(response, 400, self.get_expected_response_body(400, message))
+
+    def test_multiply_by_two_batch_packed(self):
+        """
+        Test case on endpoint `/timestwo` with packed binary 64-bit integers.
+        """
+        response = self.client.post('/timestwo', data=struct.pack("<3q", 3, -7, 2 ** 61),
+                                    content_type="application/octet-stream")
+        assert response.status_code == 200
+        assert response.mimetype == "application/octet-stream"
+        assert struct.unpack("<3q", response.get_data()) == (6, -14, 2 ** 62)
+
+        response = self.client.post('/timestwo', data=struct.pack("<q", 2 ** 62), content_type="application/octet-stream")
+        self.verify_endpoint_with_json_response_data(response, 400, self.get_expected_response_body(
+            400, "The results must fit in 64-bit integers."))
+
     def test_calculate_date_future(self):
         """
         Test case on endpoint `/calculateDate` for calculating future date.
@@ -294,6 +456,45 @@ class TestWebApp(unittest.TestCase):
         }
         self.run_test_calculate_date(request_data, 400, expected_error_message="'weeks' must be an integer!")
 
+    def test_calculate_dates_items(self):
+        """
+        Test case on endpoint `/calculateDates` with an array of `/calculateDate` requests.
+        """
+        response = self.client.post('/calculateDates', json={ "items" : [
+            { "date" : "2024-05-27", "weeks" : 10 },
+            { "date" : "2024-03-24", "weeks" : -2 },
+            { "date" : "2024/666/21", "weeks" : 10 },
+            { "weeks" : 10 },
+            { "date" : "2024-05-27", "weeks" : "asdf10" }
+        ] })
+        self.verify_endpoint_with_json_response_data(response, 200, { "results" : [
+            { "result" : "2024-08-05" },
+            { "result" : "2024-03-10" },
+            { "error" : "'date' must be in YYYY-MM-DD format!" },
+            { "error" : "'date' is missing from request!" },
+            { "error" : "'weeks' must be an integer!" }
+        ] })
+
+    def test_calculate_dates_offsets(self):
+        """
+        Test case on endpoint `/calculateDates` with one date and an array of numbers of weeks.
+        """
+        response = self.client.post('/calculateDates', json={ "date" : "2024-05-27", "weeks" : [ 10, -2, 0, 10.7 ] })
+        self.verify_endpoint_with_json_response_data(response, 200, { "results" : [
+            { "result" : "2024-08-05" },
+            { "result" : "2024-05-13" },
+            { "result" : "2024-05-27" },
+            { "error" : "'weeks' must be an integer!" }
+        ] })
+
+    def test_calculate_dates_invalid_request(self):
+        """
+        Test case on endpoint `/calculateDates` where the request data is not a batch.
+        """
+        response = self.client.post('/calculateDates', json={ "date" : "2024-05-27", "weeks" : 10 })
+        self.verify_endpoint_with_json_response_data(response, 400, self.get_expected_response_body(
+            400, "Either 'items' or 'date' and an array of 'weeks' must be provided!"))
+
     def run_test_calculate_date(self, request_data,
                                 expected_status_code,
                                 expected_error_message=None,
@@ -433,6 +634,167 @@ class TestWebApp(unittest.TestCase):
                                         expected_error_message="Request argument 'year' exceeded maximum allowed year value!")
         mock_calculate.assert_not_called()
 
+    def test_get_honbasho_schedule_range(self):
+        """
+        Normal test case on endpoint /getSumoHonbashoScheduleRange.
+        """
+        response = self.client.get('/getSumoHonbashoScheduleRange', query_string={ "from_year" : 2024, "to_year" : 2026 })
+        assert response.status_code == 200
+        data = json.loads(response.get_data())
+        assert [ result["year"] for result in data["results"] ] == [ 2024, 2025, 2026 ]
+        for result in data["results"]:
+            expected = self.client.get('/getSumoHonbashoSchedule', query_string={ "year" : result["year"] })
+            assert result["result"] == json.loads(expected.get_data())["result"]
+
+    def test_get_honbasho_schedule_range_ndjson(self):
+        """
+        Test case on endpoint /getSumoHonbashoScheduleRange where the request accepts NDJSON.
+        """
+        response = self.client.get('/getSumoHonbashoScheduleRange', query_string={ "from_year" : 2099, "to_year" : 2100 },
+                                   headers={ "Accept" : "application/x-ndjson" })
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        lines = [ json.loads(line) for line in response.get_data(as_text=True).splitlines() ]
+        assert [ line["year"] for line in lines ] == [ 2099, 2100 ]
+        assert lines[1]["result"][0]["dates"][0] == "2100-01-10"
+
+    def test_get_honbasho_schedule_range_compressed(self):
+        """
+        Test case on endpoint /getSumoHonbashoScheduleRange where the request accepts gzip.
+        The streamed response is opted in to compression.
+        """
+        query = { "from_year" : 2024, "to_year" : 2030 }
+        expected = self.client.get('/getSumoHonbashoScheduleRange', query_string=query)
+        assert expected.content_encoding is None
+        response = self.client.get('/getSumoHonbashoScheduleRange', query_string=query, headers={ "Accept-Encoding" : "gzip" })
+        assert response.status_code == 200
+        assert response.content_encoding == "gzip"
+        assert gzip.decompress(response.get_data()) == expected.get_data()
+
+    def test_get_honbasho_schedule_range_streamed(self):
+        """
+        Test case on endpoint /getSumoHonbashoScheduleRange, whose response is streamed year by year
+        (with the request metrics enabled, as they are by default), compressed or not.
+        """
+        assert application.config['METRICS_ENABLED']
+        query = { "from_year" : 2024, "to_year" : 2033 }
+        for headers in [ {}, { "Accept-Encoding" : "gzip" } ]:
+            response = self.client.get('/getSumoHonbashoScheduleRange', query_string=query, headers=headers, buffered=False)
+            assert response.status_code == 200
+            assert response.content_length is None
+            assert len(list(response.response)) > 10
+            response.close()
+
+    def test_get_honbasho_schedule_range_invalid(self):
+        """
+        Test case on endpoint /getSumoHonbashoScheduleRange with invalid arguments.
+        """
+        for args, message in [
+            ({ "to_year" : 2024 }, "'from_year' must be provided in the request arguments!"),
+            ({ "from_year" : 2024, "to_year" : "x" }, "Request argument 'to_year' must be an integer!"),
+            ({ "from_year" : 2000, "to_year" : 2024 }, "Request argument 'from_year' cannot be before 2012!"),
+            ({ "from_year" : 2024, "to_year" : 2023 }, "Request argument 'to_year' cannot be before 'from_year'!"),
+            ({ "from_year" : 2012, "to_year" : 2200 }, "At most 100 years can be requested at once!")
+        ]:
+            response = self.client.get('/getSumoHonbashoScheduleRange', query_string=args)
+            self.verify_endpoint_with_json_response_data(response, 400, self.get_expected_response_body(400, message))
+
+    @patch('devtest_helper.time.sleep')
+    def test_get_honbasho_schedule_delay_simulated(self, mock_sleep):
+        """
+        Test case on the simulated delay of endpoint /getSumoHonbashoSchedule, which also applies to cached responses.
+        """
+        with patch.dict(DevtestHelper.mock_delay_times, { "HONBASHO_SCHEDULE" : 2 }):
+            for _ in range(2):
+                response = self.client.get('/getSumoHonbashoSchedule', query_string={ "year" : 2024 })
+                assert response.status_code == 200
+        assert mock_sleep.call_count == 2
+        assert response_cache.stats()["endpoints"]["get_honbasho_schedule"]["hits"] == 1
+
+    def test_get_honbasho_schedule_ics(self):
+        """
+        Test case on endpoint /getSumoHonbashoSchedule where the schedule is requested as an iCalendar feed.
+        """
+        response = self.client.get('/getSumoHonbashoSchedule', query_string={ "year" : 2020, "format" : "ics" })
+        assert response.status_code == 200
+        assert response.mimetype == "text/calendar"
+        assert response.get_data(as_text=True).startswith("BEGIN:VCALENDAR\r\n")
+        assert response.headers["ETag"]
+        assert response.headers["Last-Modified"]
+        assert response.cache_control.immutable
+        assert "Accept" in response.vary
+
+        accepted = self.client.get('/getSumoHonbashoSchedule', query_string={ "year" : 2020 },
+                                   headers={ "Accept" : "text/calendar" })
+        assert accepted.get_data() == response.get_data()
+        assert "Accept" in accepted.vary
+        json_response = self.client.get('/getSumoHonbashoSchedule', query_string={ "year" : 2020 })
+        assert json_response.mimetype == "application/json"
+        assert "Accept" in json_response.vary
+
+        response = self.client.get('/getSumoHonbashoSchedule', query_string={ "year" : 2100, "format" : "ics" })
+        assert not response.cache_control.immutable
+        assert response.cache_control.max_age == 86400
+
+    def test_get_honbasho_schedule_ics_not_modified(self):
+        """
+        Test case on endpoint /getSumoHonbashoSchedule where the cached iCalendar feed is still valid.
+        """
+        response = self.client.get('/getSumoHonbashoSchedule', query_string={ "year" : 2020, "format" : "ics" })
+        for headers in [ { "If-None-Match" : response.headers["ETag"] },
+                         { "If-Modified-Since" : response.headers["Last-Modified"] } ]:
+            not_modified = self.client.get('/getSumoHonbashoSchedule',
+                                           query_string={ "year" : 2020, "format" : "ics" }, headers=headers)
+            assert not_modified.status_code == 304
+            assert not_modified.get_data() == b""
+            assert "Accept" in not_modified.vary
+
+    def test_find_honbasho(self):
+        """
+        Normal test case on endpoint /findSumoHonbasho.
+        """
+        response = self.client.get('/findSumoHonbasho', query_string={ "date" : [ "2024-01-20", "2024-02-01" ] })
+        self.verify_endpoint_with_json_response_data(response, 200, {
+            "results" : [
+                {
+                    "date" : "2024-01-20",
+                    "current" : {
+                        "year" : 2024, "basho" : "HATSU", "month" : 1, "month_name" : "January",
+                        "start_date" : "2024-01-14", "end_date" : "2024-01-28", "day" : 7
+                    },
+                    "next" : {
+                        "year" : 2024, "basho" : "HARU", "month" : 3, "month_name" : "March",
+                        "start_date" : "2024-03-10", "end_date" : "2024-03-24"
+                    }
+                },
+                {
+                    "date" : "2024-02-01",
+                    "current" : None,
+                    "next" : {
+                        "year" : 2024, "basho" : "HARU", "month" : 3, "month_name" : "March",
+                        "start_date" : "2024-03-10", "end_date" : "2024-03-24"
+                    }
+                }
+            ]
+        })
+        posted = self.client.post('/findSumoHonbasho', json={ "dates" : [ "2024-01-20", "2024-02-01" ] })
+        assert json.loads(posted.get_data()) == json.loads(response.get_data())
+
+    def test_find_honbasho_invalid(self):
+        """
+        Test case on endpoint /findSumoHonbasho with invalid dates.
+        """
+        for response, message in [
+            (self.client.get('/findSumoHonbasho'), "'date' must be provided in the request arguments!"),
+            (self.client.get('/findSumoHonbasho', query_string={ "date" : "2024/01/20" }), "'date' must be in YYYY-MM-DD format!"),
+            (self.client.post('/findSumoHonbasho', json={ "dates" : [] }), "'dates' must be a non-empty array!"),
+            (self.client.post('/findSumoHonbasho', json=[ "2024-01-20" ]), "The request data must be a JSON object!"),
+            (self.client.post('/findSumoHonbasho', json="2024-01-20"), "The request data must be a JSON object!"),
+            (self.client.post('/findSumoHonbasho', json={ "dates" : [ "2024-01-20", 20240120 ] }), "'date' must be in YYYY-MM-DD format!"),
+            (self.client.post('/findSumoHonbasho', json={ "dates" : [ "2024-01-20" ] * 1001 }), "At most 1000 dates can be requested at once!")
+        ]:
+            self.verify_endpoint_with_json_response_data(response, 400, self.get_expected_response_body(400, message))
+
     def run_get_honbasho_schedule(self, args={},
                                   expected_status_code=200, expected_error_message=None,
                                   expected_data={}):
@@ -0,0 +1,117 @@
+import unittest
+import json
+import os
+import re
+import tempfile
+import yaml
+from flask import Flask
+from api_doc import ApiDoc
+from static_assets import StaticAssets
+
+
+class TestApiDoc(unittest.TestCase):
+    """
+    Test case(s) for the module `ApiDoc`.
+    """
+
+    config_path = './api/doc/swagger.yaml'
+
+    def create_client(self, mode: str, static_dir: str = None):
+        """
+        Returns a test client of an app with the API documentation added in a mode, and the `ApiDoc`.
+        """
+
+        app = Flask(__name__)
+        api_doc = ApiDoc(config_path=TestApiDoc.config_path, url_prefix='/api/doc/', title='Test API doc', static_dir=static_dir)
+        api_doc.init_app(app, mode)
+        return app.test_client(), api_doc
+
+    def test_lazy(self):
+        """
+        Test case on mode "lazy", where the documentation is loaded on its first request.
+        """
+
+        client, api_doc = self.create_client("lazy")
+        assert api_doc.document is None
+
+        response = client.get('/api/doc')
+        assert response.status_code == 200
+        assert api_doc.document is not None
+        html = response.get_data(as_text=True)
+        assert '<title> Test API doc </title>' in html
+        version = api_doc.static_assets.get_version('swagger-ui-bundle.js')
+        assert f'"/api/doc/static/swagger-ui-bundle.js?v={version}"' in html
+        assert '"/api/doc/swagger.json"' in html
+        assert client.get('/api/doc/').get_data(as_text=True) == html
+
+        response = client.get('/api/doc/swagger.json')
+        assert response.status_code == 200
+        with open(TestApiDoc.config_path, 'rb') as config_file:
+            expected = yaml.safe_load(config_file)
+        expected["host"] = "localhost"
+        assert response.json == json.loads(json.dumps(expected))
+
+        response = client.get('/api/doc/static/swagger-ui.css')
+        assert response.status_code == 200
+        assert response.mimetype == "text/css"
+        assert client.get('/api/doc/static/missing.js').status_code == 404
+        assert client.get('/api/doc/static/../core.py').status_code == 404
+
+    def test_static_dir(self):
+        """
+        Test case on the static files served from a build directory.
+        """
+
+        with tempfile.TemporaryDirectory() as source_dir, tempfile.TemporaryDirectory() as build_dir:
+            with open(os.path.join(source_dir, 'swagger-ui.css'), 'w') as source_file:
+                source_file.write('.swagger-ui { color: #3b4151; }\n' * 100)
+            StaticAssets.build(source_dir, build_dir)
+            client, api_doc = self.create_client("lazy", build_dir)
+
+            html = client.get('/api/doc').get_data(as_text=True)
+            version = api_doc.static_assets.get_version('swagger-ui.css')
+            assert f'"/api/doc/static/swagger-ui.css?v={version}"' in html
+            assert '"/api/doc/static/swagger-ui-bundle.js"' in html # Not in the build directory.
+
+            url = re.search(r'/api/doc/static/swagger-ui.css\?v=\w+', html)[0]
+            response = client.get(url, headers={ 'Accept-Encoding' : 'gzip' })
+            assert response.status_code == 200
+            assert response.content_encoding == 'gzip'
+            assert response.cache_control.immutable
+            assert client.get('/api/doc/static/swagger-ui-bundle.js').status_code == 404
+
+    def test_lazy_static(self):
+        """
+        Test case on mode "lazy" where the first request is for a static file.
+        """
+
+        client, api_doc = self.create_client("lazy")
+        assert client.get('/api/doc/static/index.css').status_code == 200
+        assert api_doc.document is not None
+
+    def test_eager(self):
+        """
+        Test case on mode "eager", where the documentation is loaded at once.
+        """
+
+        client, api_doc = self.create_client("eager")
+        assert api_doc.document is not None
+        assert client.get('/api/doc').status_code == 200
+
+    def test_disabled(self):
+        """
+        Test case on mode "disabled", where the documentation is not served.
+        """
+
+        client, api_doc = self.create_client("disabled")
+        for path in [ '/api/doc', '/api/doc/swagger.json', '/api/doc/static/swagger-ui.css' ]:
+            assert client.get(path).status_code == 404
+        assert api_doc.document is None
+
+    def test_invalid_mode(self):
+        """
+        Test case on an invalid mode.
+        """
+
+        with self.assertRaises(ValueError):
+            self.create_client("sometimes")
@@ -0,0 +1,99 @@
+import unittest
+import asyncio
+import json
+from asgi import application
+from devtest_helper import DevtestHelper
+from unittest.mock import patch, AsyncMock
+
+
+class TestAsgiApp(unittest.TestCase):
+    """
+    Test cases on serving the app under an ASGI server, in `asgi.py`.
+    """
+
+    def call(self, method, path, query_string=b"", body=b"", headers=[]):
+        """
+        Calls the ASGI app with an HTTP request, and returns the status code and the response body.
+        """
+        scope = {
+            "type" : "http", "asgi" : { "version" : "3.0" }, "http_version" : "1.1",
+            "method" : method, "scheme" : "http", "path" : path, "raw_path" : path.encode(),
+            "query_string" : query_string, "root_path" : "", "headers" : headers,
+            "client" : ("127.0.0.1", 12345), "server" : ("127.0.0.1", 5000)
+        }
+        messages = [ { "type" : "http.request", "body" : body, "more_body" : False } ]
+        sent = []
+        async def receive():
+            return messages.pop(0)
+        async def send(message):
+            sent.append(message)
+        asyncio.run(application(scope, receive, send))
+        status = sent[0]["status"]
+        return status, b"".join(message.get("body", b"") for message in sent[1:])
+
+    def test_get(self):
+        """
+        Test case on a GET request.
+        """
+        status, body = self.call("GET", "/getSumoHonbashoSchedule", b"year=2024")
+        assert status == 200
+        assert json.loads(body)["result"][0]["dates"][0] == "2024-01-14"
+
+    def test_post(self):
+        """
+        Test case on a POST request with a JSON body.
+        """
+        request_body = b'{"date": "2024-05-27", "weeks": 10}'
+        status, body = self.call("POST", "/calculateDate", body=request_body,
+                                 headers=[ (b"content-type", b"application/json"),
+                                           (b"content-length", str(len(request_body)).encode()) ])
+        assert status == 200
+        assert json.loads(body) == { "result" : "2024-08-05" }
+
+    def test_streamed(self):
+        """
+        Test case on a streamed response, and on a request with too many duplicate headers.
+        """
+        status, body = self.call("GET", "/getSumoHonbashoScheduleRange", b"from_year=2024&to_year=2030")
+        assert status == 200
+        assert len(json.loads(body)["results"]) == 7
+        status, body = self.call("GET", "/", headers=[ (b"x-test", b"1") ] * 101)
+        assert status == 400
+
+    @patch('devtest_helper.time.sleep')
+    @patch('devtest_helper.asyncio.sleep', new_callable=AsyncMock)
+    def test_delay_simulated_async(self, mock_async_sleep, mock_sleep):
+        """
+        Test case on an endpoint with a simulated delay, which is awaited instead of blocking a thread.
+        """
+        with patch.dict(DevtestHelper.mock_delay_times, { "HONBASHO_SCHEDULE" : 3 }):
+            status, _ = self.call("GET", "/getSumoHonbashoSchedule", b"year=2024")
+        assert status == 200
+        mock_async_sleep.assert_awaited_once_with(3)
+        mock_sleep.assert_not_called()
+
+    def test_get_delay_key(self):
+        """
+        Test case on function `get_delay_key(scope)`, which matches the endpoints with a simulated delay in the URL map.
+        """
+        assert application.get_delay_key({ "path" : "/getSumoHonbashoSchedule", "method" : "GET" }) == "HONBASHO_SCHEDULE"
+        assert application.get_delay_key({ "path" : "/findSumoHonbasho", "method" : "POST" }) == "HONBASHO_SCHEDULE"
+        assert application.get_delay_key({ "path" : "/getSumoHonbashoSchedule", "method" : "PUT" }) is None
+        assert application.get_delay_key({ "path" : "/greeting/Taro", "method" : "GET" }) is None
+        assert application.get_delay_key({ "path" : "/notFound", "method" : "GET" }) is None
+
+    def test_lifespan(self):
+        """
+        Test case on the lifespan events of the ASGI server.
+        """
+        messages = [ { "type" : "lifespan.startup" }, { "type" : "lifespan.shutdown" } ]
+        sent = []
+        async def receive():
+            return messages.pop(0)
+        async def send(message):
+            sent.append(message["type"])
+        asyncio.run(application({ "type" : "lifespan" }, receive, send))
+        assert sent == [ "lifespan.startup.complete", "lifespan.shutdown.complete" ]
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import importlib.util
+from date_calculator import DateCalculator
+from unittest.mock import patch
+
+
+class TestDateCalculator(unittest.TestCase):
+    """
+    Test case(s) for the module `DateCalculator`.
+    """
+
+    def test_add_weeks(self):
+        """
+        Test case on function `add_weeks(dates, weeks)`, with valid and invalid pairs in the same batch.
+        """
+
+        results = DateCalculator.add_weeks(
+            [ "2024-05-27", "2024-03-24", "2024-05-27", "2024/666/21", None, "2024-05-27", "2024-05-27", "9999-12-30", 20240527 ],
+            [ 10, -2, 0, 10, 10, None, 10.7, 1, 1 ])
+        assert results[:3] == [ "2024-08-05", "2024-03-10", "2024-05-27" ]
+        assert [ str(result) for result in results[3:] ] == [
+            "'date' must be in YYYY-MM-DD format!",
+            "'date' is missing from request!",
+            "'weeks' is missing from request!",
+            "'weeks' must be an integer!",
+            "The calculated date is out of range!",
+            "'date' must be in YYYY-MM-DD format!"
+        ]
+        assert all(isinstance(result, ValueError) for result in results[3:])
+
+    def test_add_weeks_out_of_range(self):
+        """
+        Test case on function `add_weeks(dates, weeks)` where the calculated dates are out of range.
+        """
+
+        results = DateCalculator.add_weeks([ "0001-01-14", "0001-01-14", "2024-05-27" ], [ -2, -1, 10 ** 30 ])
+        assert results[0].args == ("The calculated date is out of range!",)
+        assert results[1] == "0001-01-07"
+        assert results[2].args == ("The calculated date is out of range!",)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "NumPy is not installed.")
+    def test_add_weeks_vectorized(self):
+        """
+        Test case on function `add_weeks(dates, weeks)`, where the vectorized calculation gives the same results.
+        """
+
+        dates = [ "2024-02-29", "0001-01-01", "9999-12-31", "2024-05-27" ] * 50
+        weeks = [ 1, -1, 1, -5000 ] * 50
+        expected = [ DateCalculator.add_days(DateCalculator.parse_ordinal(value), num_of_weeks * 7)
+                     for value, num_of_weeks in zip(dates, weeks) ]
+        results = DateCalculator.add_weeks(dates, weeks)
+        assert [ str(result) for result in results ] == [ str(result) for result in expected ]
+        assert results[0] == "2024-03-07"
+        assert isinstance(results[1], ValueError) and isinstance(results[2], ValueError)
+        assert results[3] == "1928-07-30"
+
+    def test_add_weeks_without_numpy(self):
+        """
+        Test case on function `add_weeks(dates, weeks)` for a large batch where NumPy is not installed.
+        """
+
+        with patch('date_calculator.DateCalculator.add_days_vectorized', side_effect=ImportError):
+            results = DateCalculator.add_weeks([ "2024-05-27" ] * 100, list(range(100)))
+        assert results[0] == "2024-05-27"
+        assert results[99] == "2026-04-20"
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from date_codec import DateCodec
+from datetime import date, datetime
+
+
+class TestDateCodec(unittest.TestCase):
+    """
+    Test case(s) for the module `DateCodec`.
+    """
+
+    def test_parse(self):
+        """
+        Test case on function `parse(value)`, which accepts the same strings as `datetime.strptime()`.
+        """
+
+        for value in [ "2024-05-27", "2024-02-29", "0001-01-01", "9999-12-31", "2024-5-7", "2024-05-7", "2024-5-27" ]:
+            assert DateCodec.parse(value) == datetime.strptime(value, "%Y-%m-%d").date()
+
+    def test_parse_invalid(self):
+        """
+        Test case on function `parse(value)` with strings that `datetime.strptime()` rejects.
+        """
+
+        for value in [ "2024/666/21", "2023-02-29", "2024-13-01", "2024-00-10", "20240527", "2024-W01-1",
+                       "24-05-27", "2024-05-27 ", " 2024-05-27", "2024-05-27T00:00", "2024-0５-27", "" ]:
+            with self.assertRaises(ValueError):
+                datetime.strptime(value, "%Y-%m-%d")
+            with self.assertRaises(ValueError):
+                DateCodec.parse(value)
+        with self.assertRaises(TypeError):
+            DateCodec.parse(20240527)
+
+    def test_format(self):
+        """
+        Test case on function `format(day)`.
+        """
+
+        assert DateCodec.format(date(2024, 5, 27)) == "2024-05-27"
+        assert DateCodec.format(date(500, 1, 2)) == "0500-01-02"
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import io
+import logging
+import os
+from logging.handlers import QueueHandler
+from unittest.mock import patch
+import flaskapp
+from flaskapp import create_app
+from flask.json.provider import DefaultJSONProvider
+
+
+class TestFlaskApp(unittest.TestCase):
+    """
+    Test case(s) for the application factory in `flaskapp`.
+    """
+
+    def setUp(self):
+        """
+        Setup before test run.
+        """
+
+        self.root_handlers = logging.getLogger().handlers[:]
+        self.root_level = logging.getLogger().level
+
+    def tearDown(self):
+        """
+        Tear down after test run.
+        """
+
+        flaskapp.stop_queue_logging()
+        root = logging.getLogger()
+        root.handlers = self.root_handlers
+        root.setLevel(self.root_level)
+
+    def test_log_level(self):
+        """
+        Test case on the log level, and on log messages that are not formatted below it.
+        """
+
+        with patch.dict(os.environ, { 'LOG_LEVEL' : 'INFO', 'LOG_QUEUE' : 'false' }):
+            create_app()
+        root = logging.getLogger()
+        assert root.level == logging.INFO
+        assert not any(isinstance(handler, QueueHandler) for handler in root.handlers)
+
+        class Message():
+            formatted = False
+            def __str__(self):
+                Message.formatted = True
+                return "message"
+        logging.debug("Not logged: %s", Message())
+        assert not Message.formatted
+
+    def test_log_queue(self):
+        """
+        Test case on writing the log messages in the thread of a queue listener.
+        """
+
+        with patch.dict(os.environ, { 'LOG_LEVEL' : 'INFO', 'LOG_QUEUE' : 'true' }):
+            create_app()
+        root = logging.getLogger()
+        assert len(root.handlers) == 1
+        assert isinstance(root.handlers[0], QueueHandler)
+
+        stream = io.StringIO()
+        handler = flaskapp.queue_listener.handlers[0]
+        with patch.object(handler, 'stream', stream):
+            logging.info("Logged: %d", 42)
+            flaskapp.stop_queue_logging()
+        assert "INFO" in stream.getvalue()
+        assert "Logged: 42" in stream.getvalue()
+
+    def test_json_provider(self):
+        """
+        Test case on the JSON provider of the app.
+        """
+
+        with patch.dict(os.environ, { 'JSON_PROVIDER' : 'stdlib' }):
+            assert type(create_app().json) is DefaultJSONProvider
+        with patch.dict(os.environ, { 'JSON_PROVIDER' : 'invalid' }):
+            self.assertRaises(ValueError, create_app)
+        with patch.dict(os.environ, { 'JSON_PROVIDER' : 'auto' }), patch.dict('sys.modules', { 'orjson' : None,
+                                                                                             'json_provider' : None }):
+            assert type(create_app().json) is DefaultJSONProvider
+        with patch.dict(os.environ, { 'JSON_PROVIDER' : 'orjson' }), patch.dict('sys.modules', { 'orjson' : None,
+                                                                                               'json_provider' : None }):
+            self.assertRaises(ImportError, create_app)
+
+    def test_response_cache_endpoints(self):
+        """
+        Test case on the configured endpoints of the response cache.
+        """
+
+        with patch.dict(os.environ, { 'RESPONSE_CACHE_ENDPOINTS' : 'all' }):
+            assert create_app().config['RESPONSE_CACHE_ENDPOINTS'] is None
+        with patch.dict(os.environ, { 'RESPONSE_CACHE_ENDPOINTS' : ' calculate_date, personal_greeting ,' }):
+            assert create_app().config['RESPONSE_CACHE_ENDPOINTS'] == [ 'calculate_date', 'personal_greeting' ]
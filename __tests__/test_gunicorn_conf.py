@@ -0,0 +1,86 @@
+import unittest
+import os
+import runpy
+import tempfile
+from unittest.mock import patch
+
+
+class TestGunicornConf(unittest.TestCase):
+    """
+    Test case(s) for the gunicorn configurations in `gunicorn.conf.py`.
+    """
+
+    real_open = open
+
+    def load(self, env={}):
+        """
+        Loads `gunicorn.conf.py` with some environment variables set, and returns its settings.
+        """
+        with patch.dict(os.environ, env):
+            return runpy.run_path("gunicorn.conf.py")
+
+    def test_config_ini(self):
+        """
+        Test case on the settings read from config.ini.
+        """
+        with patch('os.sched_getaffinity', return_value={ 0, 1, 2 }, create=True), \
+                patch('builtins.open', side_effect=self.open_without_cgroup):
+            settings = self.load()
+        assert settings["bind"] == "0.0.0.0:5000"
+        assert settings["workers"] == 7
+        assert settings["worker_class"] == "gthread"
+        assert settings["threads"] == 4
+        assert settings["preload_app"] is True
+        assert settings["keepalive"] == 5
+        assert settings["max_requests"] == 1000
+
+    def open_without_cgroup(self, file, *args, **kwargs):
+        """
+        `open()` as if this process had no cgroup files.
+        """
+        if str(file).startswith("/sys/fs/cgroup"):
+            raise FileNotFoundError(file)
+        return TestGunicornConf.real_open(file, *args, **kwargs)
+
+    def test_cgroup_cpu_limit(self):
+        """
+        Test case on the number of CPUs limited by the cgroup CPU quota.
+        """
+        settings = self.load()
+        with tempfile.TemporaryDirectory() as cgroup_dir:
+            get_cgroup_cpu_limit = settings["get_cgroup_cpu_limit"]
+            assert get_cgroup_cpu_limit(cgroup_dir) is None
+            for content, expected in [ ("max 100000\n", None), ("100000 100000\n", 1), ("150000 100000\n", 2),
+                                       ("10000 100000\n", 1) ]:
+                with open(os.path.join(cgroup_dir, "cpu.max"), "w") as limit_file:
+                    limit_file.write(content)
+                assert get_cgroup_cpu_limit(cgroup_dir) == expected
+            os.remove(os.path.join(cgroup_dir, "cpu.max"))
+
+            os.makedirs(os.path.join(cgroup_dir, "cpu"))
+            for quota, expected in [ ("-1", None), ("300000", 3) ]:
+                for filename, content in [ ("cpu.cfs_quota_us", quota), ("cpu.cfs_period_us", "100000") ]:
+                    with open(os.path.join(cgroup_dir, "cpu", filename), "w") as limit_file:
+                        limit_file.write(content + "\n")
+                assert get_cgroup_cpu_limit(cgroup_dir) == expected
+
+        with patch('os.sched_getaffinity', return_value=set(range(64)), create=True):
+            with patch.dict(settings["get_cgroup_cpu_limit"].__globals__, { "get_cgroup_cpu_limit" : lambda: 1 }):
+                assert settings["get_cpu_count"]() == 1
+            with patch.dict(settings["get_cgroup_cpu_limit"].__globals__, { "get_cgroup_cpu_limit" : lambda: None }):
+                assert settings["get_cpu_count"]() == 64
+
+    def test_environment_variables(self):
+        """
+        Test case on the settings overridden by environment variables.
+        """
+        settings = self.load({ "GUNICORN_WORKERS" : "2", "GUNICORN_WORKER_CLASS" : "sync", "GUNICORN_THREADS" : "1",
+                               "GUNICORN_PRELOAD_APP" : "false", "GUNICORN_MAX_REQUESTS" : "0" })
+        assert settings["workers"] == 2
+        assert settings["worker_class"] == "sync"
+        assert settings["threads"] == 1
+        assert settings["preload_app"] is False
+        assert settings["max_requests"] == 0
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 from honbasho_calendar import HonbashoCalendar
-from datetime import date
+from datetime import date, timedelta
+import importlib.util
+from unittest.mock import patch
 
 
 class TestHonbashoCalendar(unittest.TestCase):
@@ -41,4 +43,105 @@ class TestHonbashoCalendar(unittest.TestCase):
             }
         ]
         result = HonbashoCalendar.calculate_schedule(year)
-        assert expected == result
\ No newline at end of file
+        assert expected == result
+
+    def test_calculate_schedule_memoized(self):
+        """
+        Test case on function `calculate_schedule(year)` called repeatedly for the same year.
+        """
+
+        result = HonbashoCalendar.calculate_schedule(2031)
+        assert HonbashoCalendar.calculate_schedule(2031) is result
+        assert HonbashoCalendar.calculate_schedule(2032) is not result
+
+    def test_precompute(self):
+        """
+        Test case on function `precompute()`.
+        """
+
+        years = [ 2012, 2024, 2100, 5000, 9999 ]
+        expected = { year : [ HonbashoCalendar.calculate_dates(year, basho) for basho in HonbashoCalendar.Basho ]
+                     for year in years }
+        table = HonbashoCalendar.day_one_table
+        try:
+            HonbashoCalendar.precompute()
+            assert len(HonbashoCalendar.day_one_table) == (9999 - 2012 + 1) * 6
+            for year in years:
+                assert [ HonbashoCalendar.get_dates(year, basho) for basho in HonbashoCalendar.Basho ] == expected[year]
+            assert HonbashoCalendar.get_dates(2011, HonbashoCalendar.Basho.HATSU) \
+                == [ date(2011, 1, d) for d in range(9, 24) ]
+        finally:
+            HonbashoCalendar.day_one_table = table
+
+    def test_find_basho(self):
+        """
+        Test case on function `find_basho(day)`.
+        """
+
+        hatsu = { "year" : 2024, "basho" : HonbashoCalendar.Basho.HATSU, "day_one" : date(2024, 1, 14) }
+        haru = { "year" : 2024, "basho" : HonbashoCalendar.Basho.HARU, "day_one" : date(2024, 3, 10) }
+        assert HonbashoCalendar.find_basho(date(2024, 1, 13)) == { "current" : None, "next" : hatsu }
+        assert HonbashoCalendar.find_basho(date(2024, 1, 14)) == { "current" : { **hatsu, "day" : 1 }, "next" : haru }
+        assert HonbashoCalendar.find_basho(date(2024, 1, 28)) == { "current" : { **hatsu, "day" : 15 }, "next" : haru }
+        assert HonbashoCalendar.find_basho(date(2024, 1, 29)) == { "current" : None, "next" : haru }
+        assert HonbashoCalendar.find_basho(date(2011, 12, 31))["next"]["day_one"] == date(2012, 1, 8)
+        assert HonbashoCalendar.find_basho(date(9999, 12, 31)) == { "current" : None, "next" : None }
+
+    def test_find_bashos(self):
+        """
+        Test case on function `find_bashos(days)`, against the calculated schedules.
+        """
+
+        days = [ date(2030, 1, 1) + timedelta(days=n) for n in range(366) ]
+        expected = {}
+        for basho in HonbashoCalendar.calculate_schedule(2030):
+            for number, day in enumerate(basho["dates"], start=1):
+                expected[day] = (basho["basho"], number)
+        for day, result in zip(days, HonbashoCalendar.find_bashos(days)):
+            current = result["current"]
+            assert (current and (current["basho"], current["day"])) == expected.get(day)
+            assert result["next"]["day_one"] > day
+
+    def test_calculate_dates_every_month_start(self):
+        """
+        Test case on function `calculate_dates(year, basho)` for months starting on each day of week.
+        """
+
+        # 1st day of the month: 2023-01 Sunday, 2024-01 Monday, 2019-01 Tuesday, 2020-01 Wednesday,
+        # 2026-01 Thursday, 2021-01 Friday, 2022-01 Saturday.
+        expected_day_one = { 2023 : 8, 2024 : 14, 2019 : 13, 2020 : 12, 2026 : 11, 2021 : 10, 2022 : 9 }
+        for year, day_one in expected_day_one.items():
+            assert HonbashoCalendar.calculate_dates(year, HonbashoCalendar.Basho.HATSU) \
+                == [ date(year, 1, d) for d in range(day_one, day_one + 15) ]
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "NumPy is not installed.")
+    def test_calculate_schedules(self):
+        """
+        Test case on function `calculate_schedules(from_year, to_year)`.
+        """
+
+        result = HonbashoCalendar.calculate_schedules(2012, 2100)
+        assert result.shape == (89, 6, 15)
+        for year in [ 2012, 2024, 2100 ]:
+            schedule = HonbashoCalendar.calculate_schedule(year)
+            assert [ [ d.item() for d in dates ] for dates in result[year - 2012] ] \
+                == [ basho["dates"] for basho in schedule ]
+
+    def test_calculate_schedule_range(self):
+        """
+        Test case on function `calculate_schedule_range(from_year, to_year)`, with and without NumPy.
+        """
+
+        expected = [ [ { "basho" : basho, "dates" : HonbashoCalendar.calculate_dates(year, basho) }
+                       for basho in HonbashoCalendar.Basho ] for year in range(3001, 3011) ]
+        schedules = HonbashoCalendar.schedules
+        try:
+            HonbashoCalendar.schedules = {}
+            assert HonbashoCalendar.calculate_schedule_range(3001, 3010) == expected
+            assert HonbashoCalendar.calculate_schedule_range(3001, 3001)[0] is HonbashoCalendar.calculate_schedule(3001)
+
+            HonbashoCalendar.schedules = {}
+            with patch('honbasho_calendar.HonbashoCalendar.calculate_schedules', side_effect=ImportError):
+                assert HonbashoCalendar.calculate_schedule_range(3001, 3010) == expected
+        finally:
+            HonbashoCalendar.schedules = schedules
@@ -0,0 +1,38 @@
+import unittest
+from honbasho_ical import HonbashoICalendar
+
+
+class TestHonbashoICalendar(unittest.TestCase):
+    """
+    Test case(s) for the module `HonbashoICalendar`.
+    """
+
+    def test_render(self):
+        """
+        Test case on function `render(year)`.
+        """
+
+        lines = HonbashoICalendar.render(2024).decode("utf8").split("\r\n")
+        assert lines[0] == "BEGIN:VCALENDAR"
+        assert lines[-2:] == [ "END:VCALENDAR", "" ]
+        assert lines.count("BEGIN:VEVENT") == 6
+        assert "UID:2024-HATSU@python-webservice-demo" in lines
+        assert "DTSTART;VALUE=DATE:20240114" in lines
+        assert "DTEND;VALUE=DATE:20240129" in lines # The day after day 15
+        assert "DTSTART;VALUE=DATE:20241110" in lines
+        assert "DTEND;VALUE=DATE:20241125" in lines
+        assert all(len(line.encode("utf8")) <= 75 for line in lines)
+
+    def test_get_feed(self):
+        """
+        Test case on function `get_feed(year)`, where the feed is rendered once per year.
+        """
+
+        HonbashoICalendar.feeds.clear()
+        body, etag = HonbashoICalendar.get_feed(2030)
+        assert body == HonbashoICalendar.render(2030)
+        assert HonbashoICalendar.get_feed(2030)[0] is body
+        assert HonbashoICalendar.get_feed(2031)[1] != etag
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import importlib.util
+import struct
+from integer_batch import IntegerBatch
+from unittest.mock import patch
+
+
+class TestIntegerBatch(unittest.TestCase):
+    """
+    Test case(s) for the module `IntegerBatch`.
+    """
+
+    def test_double(self):
+        """
+        Test case on function `double(nums)`.
+        """
+
+        assert IntegerBatch.double([]) == []
+        assert IntegerBatch.double([ 3, -7, 0, 2 ** 62 - 1, -2 ** 62 ]) == [ 6, -14, 0, 2 ** 63 - 2, -2 ** 63 ]
+        for nums in [ [ 1, 2 ** 62 ], [ -2 ** 62 - 1 ], [ 10 ** 30, -10 ** 30 ] ]:
+            results = IntegerBatch.double(nums)
+            assert results == [ num * 2 for num in nums ]
+            assert all(type(result) is int for result in results)
+
+    def test_double_without_numpy(self):
+        """
+        Test case on function `double(nums)` where NumPy is not installed.
+        """
+
+        with patch('integer_batch.IntegerBatch.double_int64', side_effect=ImportError):
+            assert IntegerBatch.double([ 3, -7 ]) == [ 6, -14 ]
+
+    def test_double_packed(self):
+        """
+        Test case on function `double_packed(data)`.
+        """
+
+        nums = [ 3, -7, 0, 2 ** 62 - 1, -2 ** 62 ]
+        results = IntegerBatch.double_packed(struct.pack("<5q", *nums))
+        assert struct.unpack("<5q", results) == tuple(num * 2 for num in nums)
+        assert IntegerBatch.double_packed(b"") == b""
+
+    def test_double_packed_invalid(self):
+        """
+        Test case on function `double_packed(data)` with invalid data.
+        """
+
+        with self.assertRaisesRegex(ValueError, "sequence of 64-bit integers"):
+            IntegerBatch.double_packed(b"\0" * 9)
+        with self.assertRaisesRegex(ValueError, "fit in 64-bit integers"):
+            IntegerBatch.double_packed(struct.pack("<2q", 1, 2 ** 62))
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "NumPy is not installed.")
+    def test_double_packed_without_numpy(self):
+        """
+        Test case on function `double_packed(data)` where NumPy is not installed, against the NumPy results.
+        """
+
+        data = struct.pack("<4q", 1, -1, 2 ** 62 - 1, -2 ** 62)
+        expected = IntegerBatch.double_packed(data)
+        with patch.dict('sys.modules', { "numpy" : None }):
+            assert IntegerBatch.double_packed(data) == expected
+            with self.assertRaises(ValueError):
+                IntegerBatch.double_packed(struct.pack("<q", -2 ** 62 - 1))
+
+if __name__ == '__main__':
+    unittest.main()
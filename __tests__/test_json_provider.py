@@ -0,0 +1,92 @@
+import unittest
+import importlib.util
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from flask import Flask, request
+from flask.json.provider import DefaultJSONProvider
+from markupsafe import Markup
+
+
+@dataclass
+class Point():
+    y: int
+    x: int
+
+
+@unittest.skipUnless(importlib.util.find_spec("orjson"), "orjson is not installed")
+class TestOrjsonProvider(unittest.TestCase):
+    """
+    Test case(s) for the module `OrjsonProvider`.
+    """
+
+    data = [
+        { "b" : 1, "a" : [ 1.5, None, True, "text" ], "c" : { "z" : 0, "y" : -(2 ** 63) } },
+        { "date" : date(2024, 1, 14), "datetime" : datetime(2024, 1, 14, 9, 30, tzinfo=timezone.utc) },
+        { "point" : Point(2, 1), "uuid" : uuid.UUID(int=1), "markup" : Markup("<b>") },
+        { "non_ascii" : "Sumō 大相撲" },
+        { "del" : "a\x7fb" },
+        { 2 : "non-string", 10 : "keys" },
+        [ 2 ** 64, -(2 ** 70) ]
+    ]
+
+    def setUp(self):
+        """
+        Setup before test run.
+        """
+
+        from json_provider import OrjsonProvider
+        self.app = Flask(__name__)
+        self.app.json = OrjsonProvider(self.app)
+        self.stdlib = DefaultJSONProvider(self.app)
+
+    def test_dumps(self):
+        """
+        Test case on function `dumps(obj)`, whose output must be the same as that of the stdlib.
+        """
+
+        for obj in TestOrjsonProvider.data:
+            for kwargs in [ {}, { "separators" : (",", ":") }, { "indent" : 2 } ]:
+                assert self.app.json.dumps(obj, **kwargs) == self.stdlib.dumps(obj, **kwargs)
+
+    def test_response(self):
+        """
+        Test case on function `response(obj)`, whose body must be the same as that of the stdlib.
+        """
+
+        for obj in TestOrjsonProvider.data:
+            response = self.app.json.response(obj)
+            assert response.mimetype == "application/json"
+            assert response.get_data() == self.stdlib.response(obj).get_data()
+        assert self.app.json.response(a=1, b=2).get_data() == b'{"a":1,"b":2}\n'
+
+        self.app.debug = True
+        assert self.app.json.response({ "b" : 1, "a" : 2 }).get_data() == self.stdlib.response({ "b" : 1, "a" : 2 }).get_data()
+
+    def test_loads(self):
+        """
+        Test case on function `loads(s)`.
+        """
+
+        for text in [ '{"b":1,"a":[1.5,null,true,"text"]}', '"Sum\\u014d"', '[18446744073709551616,-9223372036854775809]',
+                      '[9223372036854775807]', '[NaN]' ]:
+            expected = self.stdlib.loads(text)
+            for value in [ text, text.encode() ]:
+                assert repr(self.app.json.loads(value)) == repr(expected)
+
+        for text in [ '', '{"a":', "{'a':1}", b'\xff' ]:
+            self.assertRaises(ValueError, self.app.json.loads, text)
+
+    def test_request_json(self):
+        """
+        Test case on `request.json`, which is decoded by the provider.
+        """
+
+        @self.app.route('/echo', methods=["POST"])
+        def echo():
+            return { "json" : request.json }
+
+        client = self.app.test_client()
+        response = client.post('/echo', json={ "date" : "2024-01-14", "weeks" : 2 })
+        assert response.data == b'{"json":{"date":"2024-01-14","weeks":2}}\n'
+        assert client.post('/echo', data="{", content_type="application/json").status_code == 400
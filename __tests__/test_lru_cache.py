@@ -0,0 +1,40 @@
+import unittest
+from lru_cache import LruCache
+from unittest.mock import patch
+
+
+class TestLruCache(unittest.TestCase):
+    """
+    Test case(s) for the module `LruCache`.
+    """
+
+    def test_eviction(self):
+        """
+        Test case on the least recently used entries evicted beyond the number of entries and the size.
+        """
+        cache = LruCache(max_entries=2, max_bytes=10)
+        cache.set("a", 1, 3)
+        cache.set("b", 2, 3)
+        assert cache.get("a") == 1
+        cache.set("c", 3, 3)
+        assert cache.get("b") is None # Evicted, as "a" was used more recently.
+        cache.set(( "d", 1 ), 4, 6)
+        assert cache.get("a") is None # Evicted by size.
+        assert cache.get(( "d", 1 )) == 4
+        cache.set("e", 5, 11) # Larger than max_bytes.
+        assert cache.stats() == { "entries" : 2, "bytes" : 9, "evictions" : 2, "expirations" : 0 }
+
+    def test_expiry(self):
+        """
+        Test case on the expired entries.
+        """
+        cache = LruCache(max_entries=10, max_bytes=100)
+        with patch('time.time', return_value=1000.0):
+            cache.set("a", 1, 1, expires=1010.0)
+            cache.set("b", 2, 1)
+        with patch('time.time', return_value=1010.0):
+            assert cache.get("a") is None
+            assert cache.get("b") == 2
+        assert cache.stats()["expirations"] == 1
+        cache.clear()
+        assert cache.stats() == { "entries" : 0, "bytes" : 0, "evictions" : 0, "expirations" : 0 }
@@ -0,0 +1,143 @@
+import unittest
+import os
+import tempfile
+from flask import Flask, abort
+from werkzeug.test import EnvironBuilder, run_wsgi_app
+from prometheus_client import REGISTRY, CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest
+from prometheus_client import multiprocess
+from prometheus_client.mmap_dict import MmapedDict
+from request_metrics import RequestMetrics
+
+
+class TestRequestMetrics(unittest.TestCase):
+    """
+    Test case(s) for the module `RequestMetrics`.
+    """
+
+    def setUp(self):
+        """
+        Setup before test run.
+        """
+
+        app = Flask(__name__)
+
+        @app.route('/items/<name>')
+        def get_item(name):
+            return "item " + name
+
+        @app.route('/failure')
+        def get_failure():
+            raise RuntimeError("Failure")
+
+        @app.route('/forbidden')
+        def get_forbidden():
+            abort(403)
+
+        @app.route('/stream')
+        def get_stream():
+            return app.response_class((f"chunk {i}\n" for i in range(3)), mimetype="text/plain")
+
+        RequestMetrics.init_app(app)
+        self.app = app
+        self.client = app.test_client()
+
+    def get_sample(self, name: str, **labels) -> float:
+        """
+        Returns the current value of a metric sample, 0 if it has not been recorded yet.
+        """
+
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    def test_request_count(self):
+        """
+        Test case on the request count and the response size of matched routes.
+        """
+
+        labels = { 'method' : 'GET', 'route' : '/items/<name>' }
+        count = self.get_sample('http_requests_total', status='200', **labels)
+        size_count = self.get_sample('http_response_size_bytes_count', **labels)
+        size_sum = self.get_sample('http_response_size_bytes_sum', **labels)
+        duration_count = self.get_sample('http_request_duration_seconds_count', **labels)
+
+        assert self.client.get('/items/a').status_code == 200
+        assert self.client.get('/items/bc').status_code == 200
+        assert self.get_sample('http_requests_total', status='200', **labels) == count + 2
+        assert self.get_sample('http_response_size_bytes_count', **labels) == size_count + 2
+        assert self.get_sample('http_response_size_bytes_sum', **labels) == size_sum + len("item a") + len("item bc")
+        assert self.get_sample('http_request_duration_seconds_count', **labels) == duration_count + 2
+        assert self.get_sample('http_requests_in_progress', **labels) == 0
+
+    def test_streamed(self):
+        """
+        Test case on a streamed response, which must still be streamed, without recording its unknown size.
+        """
+
+        labels = { 'method' : 'GET', 'route' : '/stream' }
+        count = self.get_sample('http_requests_total', status='200', **labels)
+        size_count = self.get_sample('http_response_size_bytes_count', **labels)
+
+        app_iter, status, headers = run_wsgi_app(self.app, EnvironBuilder(path='/stream').get_environ())
+        assert "Content-Length" not in headers
+        assert list(app_iter) == [ b"chunk 0\n", b"chunk 1\n", b"chunk 2\n" ]
+        app_iter.close()
+        assert self.get_sample('http_requests_total', status='200', **labels) == count + 1
+        assert self.get_sample('http_response_size_bytes_count', **labels) == size_count
+
+    def test_error_status(self):
+        """
+        Test case on the request count of requests that failed, or matched no route.
+        """
+
+        unmatched = self.get_sample('http_requests_total', method='GET', route=RequestMetrics.unmatched_route, status='404')
+        forbidden = self.get_sample('http_requests_total', method='GET', route='/forbidden', status='403')
+        failure = self.get_sample('http_requests_total', method='GET', route='/failure', status='500')
+
+        assert self.client.get('/unknown/path').status_code == 404
+        assert self.client.get('/forbidden').status_code == 403
+        assert self.client.get('/failure').status_code == 500
+        assert self.get_sample('http_requests_total', method='GET', route=RequestMetrics.unmatched_route, status='404') == unmatched + 1
+        assert self.get_sample('http_requests_total', method='GET', route='/forbidden', status='403') == forbidden + 1
+        assert self.get_sample('http_requests_total', method='GET', route='/failure', status='500') == failure + 1
+        assert REGISTRY.get_sample_value('http_requests_total', { 'method' : 'GET', 'route' : '/unknown/path', 'status' : '404' }) is None
+
+    def test_metrics(self):
+        """
+        Test case on the metrics endpoint.
+        """
+
+        self.client.get('/items/a')
+        response = self.client.get('/metrics')
+        assert response.status_code == 200
+        assert response.content_type == CONTENT_TYPE_LATEST
+        body = response.get_data(as_text=True)
+        assert 'http_requests_total{method="GET",route="/items/<name>",status="200"}' in body
+        assert 'http_request_duration_seconds_bucket' in body
+
+    def test_mark_process_dead(self):
+        """
+        Test case on function `mark_process_dead(pid, path)`, which archives the metrics files of an exited process.
+        """
+
+        with tempfile.TemporaryDirectory() as path:
+            counter_key = '["requests_total", "requests_total", {"route": "/"}, "Requests."]'
+            gauge_key = '["in_progress", "in_progress", {"route": "/"}, "In progress."]'
+            for filename, file_key, value in [ ("counter_1.db", counter_key, 2.0), ("counter_2.db", counter_key, 3.0),
+                                               ("counter_archive.db", counter_key, 5.0),
+                                               ("gauge_livesum_1.db", gauge_key, 1.0) ]:
+                values = MmapedDict(os.path.join(path, filename))
+                values.write_value(file_key, value, 0.0)
+                values.close()
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry, path)
+            before = generate_latest(registry)
+            assert b'requests_total{route="/"} 10.0' in before
+            assert b'in_progress{route="/"} 1.0' in before
+
+            RequestMetrics.mark_process_dead(1, path)
+            assert sorted(os.listdir(path)) == [ "counter_2.db", "counter_archive.db" ]
+            after = generate_latest(registry)
+            assert b'requests_total{route="/"} 10.0' in after
+            assert b'in_progress{' not in after
+            RequestMetrics.mark_process_dead(2, path)
+            assert os.listdir(path) == [ "counter_archive.db" ]
+            assert b'requests_total{route="/"} 10.0' in generate_latest(registry)
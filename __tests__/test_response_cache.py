@@ -0,0 +1,231 @@
+import unittest
+import os
+import tempfile
+from flask import Flask, request
+from response_cache import ResponseCache, SharedDirectoryCache
+from unittest.mock import patch
+
+
+class TestResponseCache(unittest.TestCase):
+    """
+    Test case(s) for the module `ResponseCache`.
+    """
+
+    def create_client(self, cache: ResponseCache):
+        """
+        Returns a test client of an app with some endpoints cached by a response cache,
+        which count the calls of their views in `self.calls`.
+        """
+
+        app = Flask(__name__)
+        self.calls = 0
+
+        @app.route('/greeting/<name>')
+        @cache.cached()
+        def greeting(name):
+            self.calls += 1
+            return f"Hello, {name}! {request.args.get('a', '')}{request.args.get('b', '')}"
+
+        @app.route('/echo', methods=["POST"])
+        @cache.cached(ttl=10)
+        def echo():
+            self.calls += 1
+            if request.is_json:
+                return { "json" : request.json }
+            if "status" in request.form:
+                return "Error", int(request.form["status"])
+            return { "form" : request.form.to_dict() }
+
+        @app.route('/negotiated')
+        @cache.cached(vary=("Accept",))
+        def negotiated():
+            self.calls += 1
+            response = app.response_class(request.accept_mimetypes.best_match([ "application/json", "text/plain" ]))
+            response.set_etag(str(self.calls))
+            return response
+
+        @app.route('/cookie')
+        @cache.cached()
+        def cookie():
+            self.calls += 1
+            response = app.response_class("Cookie")
+            response.set_cookie("session", "1")
+            return response
+
+        return app.test_client()
+
+    def test_cached(self):
+        """
+        Test case on the responses of the cached views, and their cache keys.
+        """
+
+        cache = ResponseCache()
+        client = self.create_client(cache)
+        for query in [ { "a" : "1", "b" : "2" }, { "b" : "2", "a" : "1" } ]:
+            response = client.get('/greeting/World', query_string=query)
+            assert response.status_code == 200
+            assert response.get_data(as_text=True) == "Hello, World! 12"
+            assert response.mimetype == "text/html"
+        assert self.calls == 1
+        assert client.get('/greeting/Sumo').get_data(as_text=True) == "Hello, Sumo! "
+        assert client.head('/greeting/Sumo').status_code == 200
+        assert self.calls == 2
+
+        for data in [ '{"a":1,"b":[1,2]}', '{ "b" : [1, 2], "a" : 1 }' ]:
+            response = client.post('/echo', data=data, content_type="application/json")
+            assert response.json == { "json" : { "a" : 1, "b" : [ 1, 2 ] } }
+        client.post('/echo', data={ "x" : "1", "y" : "2" })
+        assert client.post('/echo', data={ "y" : "2", "x" : "1" }).json == { "form" : { "x" : "1", "y" : "2" } }
+        assert self.calls == 4
+
+        stats = cache.stats()
+        assert stats["hits"] == 4
+        assert stats["misses"] == 4
+        assert stats["endpoints"]["echo"] == { "hits" : 2, "shared_hits" : 0, "misses" : 2 }
+        assert stats["local"]["entries"] == 4
+
+    def test_not_cached(self):
+        """
+        Test case on responses that are not cached.
+        """
+
+        cache = ResponseCache()
+        client = self.create_client(cache)
+        for _ in range(2):
+            assert client.post('/echo', data={ "status" : "400" }).status_code == 400
+            assert client.post('/echo', data="{", content_type="application/json").status_code == 400
+            assert "Set-Cookie" in client.get('/cookie').headers
+        assert self.calls == 6
+        assert cache.stats()["local"]["entries"] == 0
+
+        for cache in [ ResponseCache(enabled=False), ResponseCache(endpoints=[ "echo" ]) ]:
+            client = self.create_client(cache)
+            client.get('/greeting/World')
+            client.get('/greeting/World')
+            assert self.calls == 2
+
+    def test_vary(self):
+        """
+        Test case on a cached view that depends on a request header, and conditional requests to it.
+        """
+
+        client = self.create_client(ResponseCache())
+        for _ in range(2): # Uncached, then cached.
+            response = client.get('/negotiated', headers={ "Accept" : "text/plain" })
+            assert response.get_data(as_text=True) == "text/plain"
+            assert response.headers["Vary"] == "Accept"
+        response = client.get('/negotiated', headers={ "Accept" : "application/json" })
+        assert response.get_data(as_text=True) == "application/json"
+        assert self.calls == 2
+
+        response = client.get('/negotiated', headers={ "Accept" : "application/json", "If-None-Match" : '"2"' })
+        assert response.status_code == 304
+        response = client.get('/negotiated', headers={ "Accept" : "application/json", "If-None-Match" : '"1"' })
+        assert response.status_code == 200
+        assert response.get_etag() == ("2", False)
+        assert self.calls == 2
+
+    def test_ttl(self):
+        """
+        Test case on the expiry of the cached responses.
+        """
+
+        cache = ResponseCache(ttl=100)
+        client = self.create_client(cache)
+        with patch('time.time', return_value=1000.0):
+            client.get('/greeting/World')
+            client.post('/echo', json={ "a" : 1 })
+        with patch('time.time', return_value=1050.0):
+            client.get('/greeting/World')
+            client.post('/echo', json={ "a" : 1 }) # Expired: TTL 10 s of the view.
+        assert self.calls == 3
+        with patch('time.time', return_value=1100.0):
+            client.get('/greeting/World')
+        assert self.calls == 4
+        assert cache.stats()["local"]["expirations"] == 2
+
+    def test_eviction(self):
+        """
+        Test case on the least recently used responses evicted beyond the limits.
+        """
+
+        cache = ResponseCache(max_entries=2)
+        client = self.create_client(cache)
+        for name in [ "A", "B", "A", "C", "A", "B" ]:
+            client.get(f'/greeting/{name}')
+        assert self.calls == 4 # B is evicted by C, as A was used more recently.
+        assert cache.stats()["local"] == { "entries" : 2, "bytes" : cache.local.bytes, "evictions" : 2, "expirations" : 0 }
+
+        cache = ResponseCache(max_bytes=200)
+        client = self.create_client(cache)
+        client.get('/greeting/A')
+        size = cache.local.bytes
+        assert 100 < size <= 200
+        client.get('/greeting/B')
+        assert cache.stats()["local"] == { "entries" : 1, "bytes" : size, "evictions" : 1, "expirations" : 0 }
+        client.get(f'/greeting/{"x" * 400}') # Larger than max_bytes.
+        assert cache.stats()["local"]["entries"] == 1
+
+    def test_shared(self):
+        """
+        Test case on responses shared by processes through a shared directory.
+        """
+
+        with tempfile.TemporaryDirectory() as shared_dir:
+            caches = [ ResponseCache(max_entries=3, ttl=100, shared_dir=shared_dir) for _ in range(2) ]
+            clients = [ self.create_client(cache) for cache in caches ]
+            with patch('time.time', return_value=1000.0):
+                assert clients[0].get('/greeting/World').get_data(as_text=True) == "Hello, World! "
+                assert clients[1].get('/greeting/World').get_data(as_text=True) == "Hello, World! "
+                assert clients[1].get('/greeting/World').status_code == 200
+            assert self.calls == 1 # The view of the second client has not been called.
+            assert caches[1].stats()["endpoints"]["greeting"] == { "hits" : 1, "shared_hits" : 1, "misses" : 0 }
+            assert caches[1].stats()["shared"]["entries"] == 1
+
+            with patch('time.time', return_value=1200.0):
+                clients[1].get('/greeting/World') # Expired.
+                assert self.calls == 2
+                for name in "ABCDEF":
+                    caches[1].shared.set(f"greeting-{name}", ( 200, "text/plain", [], b"" ))
+                caches[1].shared.prune()
+            stats = caches[1].stats()["shared"]
+            assert stats["entries"] == 3
+            assert stats["evictions"] == 4
+
+            caches[0].clear()
+            assert os.listdir(shared_dir) == []
+            assert caches[0].stats()["local"]["entries"] == 0
+
+    def test_shared_prune(self):
+        """
+        Test case on function `prune()` of `SharedDirectoryCache`, by expiry and by size.
+        """
+
+        with tempfile.TemporaryDirectory() as shared_dir:
+            shared = SharedDirectoryCache(shared_dir, max_entries=10, max_bytes=1000)
+            with patch('time.time', return_value=1000.0):
+                shared.set("expired", ( 200, "text/plain", [], b"" ), 1000.0)
+                for name in "ABC":
+                    shared.set(name, ( 200, "text/plain", [], b"x" * 300 ))
+                    os.utime(os.path.join(shared_dir, name), (ord(name), ord(name)))
+                shared.prune()
+            assert sorted(os.listdir(shared_dir)) == [ "B", "C" ]
+            assert shared.stats()["expirations"] == 1
+            assert shared.stats()["evictions"] == 1
+            assert shared.get("B")[0] == ( 200, "text/plain", [], b"x" * 300 )
+
+    def test_create(self):
+        """
+        Test case on function `create(config)`.
+        """
+
+        cache = ResponseCache.create({ "RESPONSE_CACHE_MAX_ENTRIES" : 5, "RESPONSE_CACHE_TTL" : 0,
+                                       "RESPONSE_CACHE_ENDPOINTS" : [ "greeting" ] })
+        assert cache.local.max_entries == 5
+        assert cache.ttl is None
+        assert cache.shared is None
+        assert cache.endpoints == { "greeting" }
+        with tempfile.TemporaryDirectory() as shared_dir:
+            cache = ResponseCache.create({ "RESPONSE_CACHE_BACKEND" : "shared", "RESPONSE_CACHE_SHARED_DIR" : shared_dir })
+            assert cache.shared.directory == shared_dir
+        self.assertRaises(ValueError, ResponseCache.create, { "RESPONSE_CACHE_BACKEND" : "redis" })
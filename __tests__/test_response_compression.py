@@ -0,0 +1,159 @@
+import unittest
+import gzip
+import importlib.util
+from flask import Flask, request
+from werkzeug.datastructures import Headers
+from response_compression import ResponseCompression
+
+
+class TestResponseCompression(unittest.TestCase):
+    """
+    Test case(s) for the module `ResponseCompression`.
+    """
+
+    text = "Hello, World! " * 100
+
+    def setUp(self):
+        """
+        Setup before test run.
+        """
+
+        app = Flask(__name__)
+
+        @app.route('/text')
+        def get_text():
+            return TestResponseCompression.text
+
+        @app.route('/short')
+        def get_short():
+            return "Hello, World!"
+
+        @app.route('/json')
+        def get_json():
+            response = app.json.response([ TestResponseCompression.text ])
+            response.set_etag("json")
+            response.vary.add("Origin")
+            return response.make_conditional(request)
+
+        @app.route('/binary')
+        def get_binary():
+            return app.response_class(TestResponseCompression.text, mimetype="application/octet-stream")
+
+        @app.route('/encoded')
+        def get_encoded():
+            response = app.response_class(gzip.compress(TestResponseCompression.text.encode()), mimetype="text/plain")
+            response.content_encoding = "gzip"
+            return response
+
+        @app.route('/stream')
+        def get_stream():
+            if "compress" in request.args:
+                ResponseCompression.allow_streaming(request.environ)
+            return app.response_class((TestResponseCompression.text for _ in range(3)), mimetype="text/plain")
+
+        self.app = app
+        app.wsgi_app = ResponseCompression(app.wsgi_app, min_size=100, gzip_level=6)
+        app.wsgi_app.encodings = [ "gzip" ] # Leaves out brotli, which may not be installed.
+        self.client = app.test_client()
+
+    def test_gzip(self):
+        """
+        Test case on a response compressed with gzip.
+        """
+
+        response = self.client.get('/text', headers={ "Accept-Encoding" : "gzip, deflate" })
+        assert response.status_code == 200
+        assert response.content_encoding == "gzip"
+        assert "Accept-Encoding" in response.vary
+        assert response.content_length == len(response.data)
+        assert gzip.decompress(response.data).decode() == TestResponseCompression.text
+
+    def test_not_compressed(self):
+        """
+        Test case on responses that are not compressed.
+        """
+
+        for path, headers in [ ('/text', {}), ('/text', { "Accept-Encoding" : "br, identity" }),
+                               ('/text', { "Accept-Encoding" : "gzip;q=0" }), ('/short', { "Accept-Encoding" : "gzip" }),
+                               ('/binary', { "Accept-Encoding" : "gzip" }), ('/stream', { "Accept-Encoding" : "gzip" }) ]:
+            response = self.client.get(path, headers=headers)
+            assert response.status_code == 200
+            assert response.content_encoding is None
+            assert response.get_data(as_text=True) in (TestResponseCompression.text, "Hello, World!",
+                                                        TestResponseCompression.text * 3)
+            # Only the responses that would be compressed for a request that accepts gzip vary on Accept-Encoding.
+            assert ("Accept-Encoding" in response.vary) == (path == '/text')
+
+        response = self.client.get('/encoded', headers={ "Accept-Encoding" : "gzip" })
+        assert response.content_encoding == "gzip"
+        assert gzip.decompress(response.data).decode() == TestResponseCompression.text
+
+        response = self.client.head('/text', headers={ "Accept-Encoding" : "gzip" })
+        assert response.content_encoding is None
+        assert response.content_length == len(TestResponseCompression.text)
+        assert "Accept-Encoding" in response.vary
+
+    def test_stream(self):
+        """
+        Test case on a streamed response that is opted in to compression.
+        """
+
+        response = self.client.get('/stream', query_string={ "compress" : "" }, headers={ "Accept-Encoding" : "gzip" })
+        assert response.status_code == 200
+        assert response.content_encoding == "gzip"
+        assert response.content_length is None
+        assert gzip.decompress(response.data).decode() == TestResponseCompression.text * 3
+
+        chunks = list(response.response)
+        assert len(chunks) == 4 # Each chunk is flushed as it is generated.
+
+    def test_etag(self):
+        """
+        Test case on the ETag of a compressed response, and conditional requests with it.
+        """
+
+        response = self.client.get('/json', headers={ "Accept-Encoding" : "gzip" })
+        assert response.get_etag() == ("json-gzip", False)
+        assert response.vary.as_set() == { "origin", "accept-encoding" }
+
+        response = self.client.get('/json', headers={ "Accept-Encoding" : "gzip", "If-None-Match" : '"json-gzip"' })
+        assert response.status_code == 304
+        assert response.get_etag() == ("json-gzip", False)
+        assert response.content_encoding is None
+
+        response = self.client.get('/json', headers={ "If-None-Match" : '"json-gzip"' })
+        assert response.status_code == 200
+        assert response.get_etag() == ("json", False)
+        assert response.vary.as_set() == { "origin", "accept-encoding" }
+        response = self.client.get('/json', headers={ "If-None-Match" : '"json"' })
+        assert response.status_code == 304
+
+    def test_add_vary(self):
+        """
+        Test case on function `add_vary(headers)`.
+        """
+
+        for vary, expected in [ (None, "Accept-Encoding"), ("Origin", "Origin, Accept-Encoding"),
+                                ("Origin, accept-encoding", "Origin, accept-encoding"), ("*", "*") ]:
+            headers = Headers({ "Vary" : vary } if vary else {})
+            ResponseCompression.add_vary(headers)
+            assert headers["Vary"] == expected
+
+    @unittest.skipUnless(importlib.util.find_spec("brotli"), "brotli is not installed")
+    def test_brotli(self):
+        """
+        Test case on a response compressed with brotli.
+        """
+
+        import brotli
+        self.app.wsgi_app.encodings = [ "br", "gzip" ]
+        response = self.client.get('/text', headers={ "Accept-Encoding" : "gzip, deflate, br" })
+        assert response.content_encoding == "br"
+        assert brotli.decompress(response.data).decode() == TestResponseCompression.text
+
+        response = self.client.get('/stream', query_string={ "compress" : "" }, headers={ "Accept-Encoding" : "br" })
+        assert response.content_encoding == "br"
+        assert brotli.decompress(response.data).decode() == TestResponseCompression.text * 3
+
+        response = self.client.get('/text', headers={ "Accept-Encoding" : "gzip" })
+        assert response.content_encoding == "gzip"
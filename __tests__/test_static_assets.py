@@ -0,0 +1,176 @@
+import unittest
+import gzip
+import importlib.util
+import json
+import os
+import tempfile
+from flask import Flask, request
+from static_assets import StaticAssets
+from unittest.mock import patch
+
+
+class TestStaticAssets(unittest.TestCase):
+    """
+    Test case(s) for the module `StaticAssets`.
+    """
+
+    script = ("function hello() { return 'Hello, World!'; }\n" * 100).encode()
+    image = bytes(range(256)) * 8
+
+    def setUp(self):
+        """
+        Setup before test run.
+        """
+
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.source_dir = os.path.join(self.tempdir.name, "source")
+        self.build_dir = os.path.join(self.tempdir.name, "build")
+        os.makedirs(os.path.join(self.source_dir, "lib"))
+        for filename, data in [ ("app.js", TestStaticAssets.script), ("lib/small.css", b"body {}"),
+                                ("image.png", TestStaticAssets.image) ]:
+            with open(os.path.join(self.source_dir, filename), "wb") as source_file:
+                source_file.write(data)
+
+    def tearDown(self):
+        """
+        Tear down after test run.
+        """
+
+        self.tempdir.cleanup()
+
+    def create_client(self, assets: StaticAssets):
+        """
+        Returns a test client of an app that serves some static assets at `/assets/`.
+        """
+
+        app = Flask(__name__)
+
+        @app.route('/assets/<path:filename>')
+        def get_static(filename):
+            return assets.send(filename, request.args.get('v'))
+
+        return app.test_client()
+
+    def test_build(self):
+        """
+        Test case on function `build(source_dir, build_dir)`.
+        """
+
+        manifest = StaticAssets.build(self.source_dir, self.build_dir)
+        with open(os.path.join(self.build_dir, StaticAssets.manifest_name), encoding="utf8") as manifest_file:
+            assert json.load(manifest_file) == manifest
+        assert sorted(manifest) == [ "app.js", "image.png", "lib/small.css" ]
+        assert manifest["app.js"]["hash"] == StaticAssets.hash(TestStaticAssets.script)
+        assert manifest["lib/small.css"]["encodings"] == [] # Too small to compress.
+        assert manifest["image.png"]["encodings"] == [] # Not a text file.
+
+        assert "gzip" in manifest["app.js"]["encodings"]
+        with open(os.path.join(self.build_dir, "app.js"), "rb") as built_file:
+            assert built_file.read() == TestStaticAssets.script
+        with gzip.open(os.path.join(self.build_dir, "app.js.gz"), "rb") as built_file:
+            assert built_file.read() == TestStaticAssets.script
+        assert not os.path.exists(os.path.join(self.build_dir, "lib", "small.css.gz"))
+
+    def test_build_exclude(self):
+        """
+        Test case on function `build(source_dir, build_dir, exclude)`.
+        """
+
+        manifest = StaticAssets.build(self.source_dir, self.build_dir, exclude=("lib/", "image"))
+        assert list(manifest) == [ "app.js" ]
+        assert not os.path.exists(os.path.join(self.build_dir, "image.png"))
+
+    @unittest.skipUnless(importlib.util.find_spec("brotli"), "brotli is not installed")
+    def test_build_brotli(self):
+        """
+        Test case on function `build(source_dir, build_dir)` with brotli installed.
+        """
+
+        import brotli
+        manifest = StaticAssets.build(self.source_dir, self.build_dir)
+        assert manifest["app.js"]["encodings"] == [ "br", "gzip" ]
+        with open(os.path.join(self.build_dir, "app.js.br"), "rb") as built_file:
+            assert brotli.decompress(built_file.read()) == TestStaticAssets.script
+
+    def test_build_without_brotli(self):
+        """
+        Test case on function `build(source_dir, build_dir)` where brotli is not installed.
+        """
+
+        compress = StaticAssets.compress
+        def compress_without_brotli(data, encoding):
+            if encoding == "br":
+                raise ImportError()
+            return compress(data, encoding)
+
+        with patch('static_assets.StaticAssets.compress', compress_without_brotli):
+            manifest = StaticAssets.build(self.source_dir, self.build_dir)
+        assert manifest["app.js"]["encodings"] == [ "gzip" ]
+        assert not os.path.exists(os.path.join(self.build_dir, "app.js.br"))
+
+    def test_send(self):
+        """
+        Test case on function `send(filename, version)` of a build directory.
+        """
+
+        manifest = StaticAssets.build(self.source_dir, self.build_dir)
+        manifest["app.js"]["encodings"] = [ "gzip" ] # Leaves out brotli, which may not be installed.
+        assets = StaticAssets(self.build_dir, built=True)
+        assets.manifest = manifest
+        client = self.create_client(assets)
+        version = manifest["app.js"]["hash"]
+
+        response = client.get('/assets/app.js', headers={ "Accept-Encoding" : "gzip, deflate" })
+        assert response.status_code == 200
+        assert response.content_encoding == "gzip"
+        assert gzip.decompress(response.data) == TestStaticAssets.script
+        assert response.mimetype == "text/javascript"
+        assert "Accept-Encoding" in response.vary
+        assert response.get_etag() == (version + "-gzip", False)
+        assert response.cache_control.no_cache
+
+        response = client.get('/assets/app.js', headers={ "Accept-Encoding" : "br;q=1.0, gzip;q=0" })
+        assert response.content_encoding is None
+        assert response.data == TestStaticAssets.script
+        assert response.get_etag() == (version, False)
+
+        response = client.get('/assets/app.js', query_string={ "v" : version })
+        assert response.content_encoding is None
+        assert response.cache_control.public
+        assert response.cache_control.max_age == StaticAssets.immutable_max_age
+        assert response.cache_control.immutable
+
+        response = client.get('/assets/app.js', query_string={ "v" : "outdated" })
+        assert not response.cache_control.immutable
+        assert response.cache_control.no_cache
+
+        response = client.get('/assets/app.js', headers={ "Accept-Encoding" : "gzip", "If-None-Match" : f'"{version}-gzip"' })
+        assert response.status_code == 304
+        assert response.content_encoding is None
+        assert client.get('/assets/app.js', headers={ "If-None-Match" : f'"{version}-gzip"' }).status_code == 200
+
+        response = client.get('/assets/lib/small.css', headers={ "Accept-Encoding" : "gzip" })
+        assert response.status_code == 200
+        assert response.data == b"body {}"
+        assert response.content_encoding is None
+        assert "Accept-Encoding" not in response.vary
+
+        for filename in [ "missing.js", "app.js.gz", StaticAssets.manifest_name, "../source/app.js" ]:
+            assert client.get('/assets/' + filename).status_code == 404
+
+    def test_send_unbuilt(self):
+        """
+        Test case on function `send(filename, version)` of a directory that has not been built.
+        """
+
+        assets = StaticAssets(self.source_dir)
+        client = self.create_client(assets)
+        assert assets.get_version("lib/small.css") == StaticAssets.hash(b"body {}")
+        assert assets.get_version("missing.css") is None
+
+        response = client.get('/assets/app.js', headers={ "Accept-Encoding" : "gzip" })
+        assert response.status_code == 200
+        assert response.content_encoding is None
+        assert response.data == TestStaticAssets.script
+        assert response.get_etag() == (StaticAssets.hash(TestStaticAssets.script), False)
+        assert client.get('/assets/../source/app.js').status_code == 404
@@ -0,0 +1,92 @@
+import unittest
+from worker_binary import WorkerBinary
+from worker_columns import WorkerColumns
+from worker_roster import WorkerRoster
+from worker_query import WorkerQuery, WorkerIndex
+import os
+import tempfile
+
+
+class TestWorkerBinary(unittest.TestCase):
+    """
+    Test case(s) for the module `WorkerBinary`.
+    """
+
+    workers = [
+        { "name" : "Chan Tai Man", "sex" : "M", "is_reg_member" : True, "age" : 56,
+          "work_days" : [ "MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY" ] },
+        { "name" : "陳小玲", "sex" : "F", "is_reg_member" : False, "age" : 22,
+          "work_days" : [ "MONDAY", "WEDNESDAY", "FRIDAY" ] },
+        { "name" : "", "sex" : "M", "is_reg_member" : False, "age" : 31,
+          "work_days" : [] },
+        { "name" : "Amy Wong", "sex" : "F", "is_reg_member" : True, "age" : 31,
+          "work_days" : [ "FRIDAY", "WEDNESDAY", "HOLIDAY" ], "phone" : "電話" }
+    ]
+
+    def setUp(self):
+        """
+        Setup before test run.
+        """
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "worker_list.bin")
+
+    def tearDown(self):
+        """
+        Tear down after test run.
+        """
+        self.tempdir.cleanup()
+
+    def test_compile_and_load(self):
+        """
+        Test case on functions `compile(columns, binary_path)` and `load(binary_path)`.
+        """
+        WorkerBinary.compile(WorkerColumns.from_workers(TestWorkerBinary.workers), self.path)
+        columns = WorkerBinary.load(self.path)
+        assert len(columns) == 4
+        assert list(columns.all()) == TestWorkerBinary.workers
+        assert columns.name[-2] == ""
+        assert list(columns.rows) == [ 3 ]
+
+        # The precomputed indexes are the same as those built from the worker list.
+        built = WorkerIndex(WorkerColumns.from_workers(TestWorkerBinary.workers))
+        loaded = WorkerIndex(columns)
+        assert loaded.bitmaps == built.bitmaps
+        for field in WorkerQuery.sort_fields:
+            assert list(loaded.sort_orders[field]) == list(built.sort_orders[field])
+            assert list(loaded.sort_ranks[field]) == list(built.sort_ranks[field])
+        assert [ list(positions) for positions in columns.indexes["day_masks"] ] \
+            == [ list(positions) for positions in WorkerRoster.build_index(columns.day_mask) ]
+        assert columns.sex_values == [ "M", "F" ]
+
+    def test_compile_empty(self):
+        """
+        Test case on functions `compile(columns, binary_path)` and `load(binary_path)` with an empty worker list.
+        """
+        WorkerBinary.compile(WorkerColumns(), self.path)
+        columns = WorkerBinary.load(self.path)
+        assert len(columns) == 0
+        assert list(columns.all()) == []
+
+    def test_load_invalid_file(self):
+        """
+        Test case on function `load(binary_path)` where the file is not a binary worker list.
+        """
+        with open(self.path, "wb") as binary_file:
+            binary_file.write(b"{ \"workers\" : [] }  ")
+        with self.assertRaises(ValueError):
+            WorkerBinary.load(self.path)
+
+    def test_roster(self):
+        """
+        Test case on a `WorkerRoster` with a binary file.
+        """
+        WorkerBinary.compile(WorkerColumns.from_workers(TestWorkerBinary.workers), self.path)
+        roster = WorkerRoster(self.path)
+        snapshot = roster.get_snapshot()
+        assert [ worker["age"] for worker in snapshot.find_workers(WorkerQuery(sort_by="name")) ] == [ 31, 31, 56, 22 ]
+        assert list(snapshot.find_workers(WorkerQuery(WorkerRoster.encode_days([ "WEDNESDAY" ])))) \
+            == TestWorkerBinary.workers[0:2] + TestWorkerBinary.workers[3:]
+
+        WorkerBinary.compile(WorkerColumns.from_workers(TestWorkerBinary.workers[0:1]), self.path)
+        assert roster.get() == { "workers" : TestWorkerBinary.workers[0:1] }
+        assert roster.stats()["reloads"] == 2
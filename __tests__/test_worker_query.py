@@ -0,0 +1,126 @@
+import unittest
+from worker_query import WorkerQuery, WorkerIndex
+from worker_columns import WorkerColumns
+
+
+class TestWorkerQuery(unittest.TestCase):
+    """
+    Test case(s) for the modules `WorkerQuery` and `WorkerIndex`.
+    """
+
+    workers = [
+        { "name" : "Chan Tai Man", "sex" : "M", "is_reg_member" : True, "age" : 56,
+          "work_days" : [ "MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY" ] },
+        { "name" : "Ma Siu Ling", "sex" : "F", "is_reg_member" : False, "age" : 22,
+          "work_days" : [ "MONDAY", "WEDNESDAY", "FRIDAY" ] },
+        { "name" : "Three Cheung", "sex" : "M", "is_reg_member" : False, "age" : 31,
+          "work_days" : [ "SATURDAY", "SUNDAY" ] },
+        { "name" : "Four Lee", "sex" : "M", "is_reg_member" : True, "age" : 18,
+          "work_days" : [ "TUESDAY", "THURSDAY", "SUNDAY" ] },
+        { "name" : "Amy Wong", "sex" : "F", "is_reg_member" : True, "age" : 31,
+          "work_days" : [ "MONDAY" ] }
+    ]
+
+    def setUp(self):
+        """
+        Setup before test run.
+        """
+        self.columns = WorkerColumns.from_workers(TestWorkerQuery.workers)
+        self.index = WorkerIndex(self.columns)
+
+    def find(self, **criteria):
+        """
+        Runs a query and returns the names of the workers found.
+        """
+        return [ self.columns.name[position] for position in self.index.find(WorkerQuery(**criteria)) ]
+
+    def test_find_no_criteria(self):
+        """
+        Test case on function `WorkerIndex.find(query)` without any criteria.
+        """
+        assert self.find() == [ worker["name"] for worker in TestWorkerQuery.workers ]
+
+    def test_find_age_range(self):
+        """
+        Test case on function `WorkerIndex.find(query)` with an age range.
+        """
+        assert self.find(age_min=22, age_max=31) == [ "Ma Siu Ling", "Three Cheung", "Amy Wong" ]
+        assert self.find(age_min=32) == [ "Chan Tai Man" ]
+        assert self.find(age_max=18) == [ "Four Lee" ]
+        assert self.find(age_min=40, age_max=50) == []
+        assert self.find(age_min=31, age_max=22) == []
+
+    def test_find_sex_and_membership(self):
+        """
+        Test case on function `WorkerIndex.find(query)` by sex and membership.
+        """
+        assert self.find(sex="F") == [ "Ma Siu Ling", "Amy Wong" ]
+        assert self.find(sex="M", is_reg_member=False) == [ "Three Cheung" ]
+        assert self.find(is_reg_member=True, age_min=20) == [ "Chan Tai Man", "Amy Wong" ]
+        assert self.find(sex="X") == []
+
+    def test_find_day_mask(self):
+        """
+        Test case on function `WorkerIndex.find(query)` with a day mask.
+        """
+        assert self.find(day_mask=0b0000001) == [ "Chan Tai Man", "Ma Siu Ling", "Amy Wong" ]
+        assert self.find(day_mask=0b1000000, sex="M") == [ "Three Cheung", "Four Lee" ]
+
+    def test_find_sorted(self):
+        """
+        Test case on function `WorkerIndex.find(query)` with a sort order.
+        """
+        assert self.find(sort_by="name") == [ "Amy Wong", "Chan Tai Man", "Four Lee", "Ma Siu Ling", "Three Cheung" ]
+        assert self.find(sort_by="age", order="desc", sex="M") == [ "Chan Tai Man", "Three Cheung", "Four Lee" ]
+        assert self.find(sort_by="age", age_min=30) == [ "Three Cheung", "Amy Wong", "Chan Tai Man" ]
+        assert self.find(order="desc", sex="F") == [ "Amy Wong", "Ma Siu Ling" ]
+
+    def test_find_large_list(self):
+        """
+        Test case on function `WorkerIndex.find(query)` against a linear scan on a larger list.
+        """
+        workers = [ { "name" : f"W{i:04d}", "sex" : "MF"[i % 2], "is_reg_member" : i % 3 == 0, "age" : 18 + i % 47,
+                      "work_days" : list(WorkerColumns.mask_days[i % 128]) }
+                    for i in range(1000) ]
+        columns = WorkerColumns.from_workers(workers)
+        index = WorkerIndex(columns)
+        result = index.find(WorkerQuery(day_mask=0b0000101, age_min=30, age_max=40, sex="F", is_reg_member=False))
+        expected = [ position for position, worker in enumerate(workers)
+                     if position % 128 & 0b0000101 == 0b0000101 and 30 <= worker["age"] <= 40
+                     and worker["sex"] == "F" and not worker["is_reg_member"] ]
+        assert list(result) == expected
+        assert list(columns.select(result)) == [ workers[position] for position in expected ]
+
+        # Few matches are sorted by rank, many are taken from the sort order: both are in the same order.
+        for criteria in [ { "age_min" : 30, "age_max" : 31, "sex" : "F" }, { "age_min" : 20 } ]:
+            for order in WorkerQuery.sort_orders:
+                result = index.find(WorkerQuery(sort_by="age", order=order, **criteria))
+                expected = sorted(( position for position, worker in enumerate(workers)
+                                    if criteria["age_min"] <= worker["age"] <= criteria.get("age_max", 100)
+                                    and worker["sex"] == criteria.get("sex", worker["sex"]) ),
+                                  key=lambda position: workers[position]["age"])
+                assert list(result) == (expected if order == "asc" else expected[::-1])
+
+    def test_from_request(self):
+        """
+        Test case on function `WorkerQuery.from_request(data, day_mask)`.
+        """
+        query = WorkerQuery.from_request({ "age_min" : 20, "sex" : "F", "is_reg_member" : False,
+                                           "sort_by" : "age", "order" : "desc" }, 0b11)
+        assert query.key == (0b11, 20, None, "F", False, "age", "desc")
+        assert WorkerQuery.from_request({}).is_day_mask_only()
+        assert not query.is_day_mask_only()
+
+    def test_from_request_invalid(self):
+        """
+        Test case on function `WorkerQuery.from_request(data, day_mask)` with invalid parameters.
+        """
+        for data, name in [ ({ "age_min" : -1 }, "age_min"), ({ "age_max" : "30" }, "age_max"),
+                            ({ "age_min" : True }, "age_min"), ({ "sex" : 1 }, "sex"),
+                            ({ "is_reg_member" : "yes" }, "is_reg_member"),
+                            ({ "sort_by" : "work_days" }, "sort_by"), ({ "order" : "up" }, "order") ]:
+            with self.assertRaises(ValueError) as context:
+                WorkerQuery.from_request(data)
+            assert str(context.exception) == f"Invalid value for parameter {name}!"
+        with self.assertRaises(ValueError):
+            WorkerQuery.from_request([])
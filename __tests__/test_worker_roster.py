@@ -0,0 +1,232 @@
+import unittest
+from worker_roster import WorkerRoster
+from worker_query import WorkerQuery
+from worker_columns import WorkerColumns
+import io
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+
+class TestWorkerRoster(unittest.TestCase):
+    """
+    Test case(s) for the module `WorkerRoster`.
+    """
+
+    workers = {
+        "workers" : [
+            {
+                "name" : "Chan Tai Man",
+                "sex" : "M",
+                "is_reg_member" : True,
+                "age" : 56,
+                "work_days" : [ "MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY" ]
+            }
+        ]
+    }
+
+    def setUp(self):
+        """
+        Setup before test run.
+        """
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "worker_list.json")
+        self.write_data_file(TestWorkerRoster.workers)
+        self.roster = WorkerRoster(self.path)
+
+    def tearDown(self):
+        """
+        Tear down after test run.
+        """
+        self.tempdir.cleanup()
+
+    def write_data_file(self, data):
+        """
+        Writes the data file, bumping its modification time so that the change is always detected.
+        """
+        with open(self.path, "w", encoding="utf8") as data_file:
+            json.dump(data, data_file)
+        stat = os.stat(self.path)
+        mtime_ns = getattr(self, "last_mtime_ns", stat.st_mtime_ns) + 1_000_000_000
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+        self.last_mtime_ns = mtime_ns
+
+    def test_get_loads_once(self):
+        """
+        Test case on function `get()` where the data file is unchanged between calls.
+        """
+        assert self.roster.get() == TestWorkerRoster.workers
+        assert self.roster.get_snapshot() is self.roster.get_snapshot()
+        self.assertEqual({ "hits" : 2, "reloads" : 1 }, self.roster.stats())
+
+    def test_get_reloads_on_change(self):
+        """
+        Test case on function `get()` where the data file is changed after the first load.
+        """
+        assert self.roster.get() == TestWorkerRoster.workers
+        self.write_data_file({ "workers" : [] })
+        assert self.roster.get() == { "workers" : [] }
+        self.assertEqual({ "hits" : 0, "reloads" : 2 }, self.roster.stats())
+
+    def test_invalidate(self):
+        """
+        Test case on function `invalidate()`.
+        """
+        self.roster.get()
+        self.roster.invalidate()
+        self.roster.get()
+        self.assertEqual({ "hits" : 0, "reloads" : 2 }, self.roster.stats())
+
+    def test_encode_days(self):
+        """
+        Test case on function `encode_days(days)`.
+        """
+        assert WorkerRoster.encode_days([]) == 0
+        assert WorkerRoster.encode_days([ "MONDAY" ]) == 0b0000001
+        assert WorkerRoster.encode_days([ "SUNDAY", "MONDAY" ]) == 0b1000001
+        assert WorkerRoster.encode_days(WorkerRoster.days_of_week) == 0b1111111
+        assert WorkerRoster.encode_days([ "HOLIDAY" ]) == 0
+
+    def test_columns(self):
+        """
+        Test case on the worker dicts materialized from `WorkerColumns`.
+        """
+        workers = TestWorkerRoster.workers["workers"] + [
+            { "name" : "Ma Siu Ling", "sex" : "F", "is_reg_member" : False, "age" : 22, "work_days" : [ "FRIDAY", "MONDAY" ] }
+        ]
+        columns = WorkerColumns.from_workers(workers)
+        assert len(columns) == 2
+        assert columns.get(0) == workers[0]
+        assert columns.get(1) == workers[1] # Work days in the order given.
+        assert list(columns.all()) == [ columns.get(0), columns.get(1) ]
+        assert list(columns.all()[1:]) == [ columns.get(1) ]
+        assert columns.select([ 1, 0 ])[0] == columns.get(1)
+        assert columns.sex_values == [ "M", "F" ]
+
+    def test_columns_rows(self):
+        """
+        Test case on workers that `WorkerColumns` does not represent exactly, which are kept as given.
+        """
+        workers = [
+            { "name" : "A", "sex" : "M", "is_reg_member" : True, "age" : 56, "work_days" : [ "MONDAY", "FRIDAY" ] },
+            { "name" : "B", "sex" : "F", "is_reg_member" : False, "age" : 22, "work_days" : [ "FRIDAY", "MONDAY" ] },
+            { "name" : "C", "sex" : "F", "is_reg_member" : False, "age" : 0, "work_days" : [ "MONDAY", "HOLIDAY" ] },
+            { "name" : "D", "sex" : "M", "is_reg_member" : True, "age" : 65535, "work_days" : [ "MONDAY", "MONDAY" ] },
+            { "name" : "E", "sex" : "M", "is_reg_member" : True, "age" : 31, "work_days" : [], "phone" : "1234" }
+        ]
+        columns = WorkerColumns.from_workers(workers)
+        assert sorted(columns.rows) == [ 1, 2, 3, 4 ]
+        assert list(columns.all()) == workers
+        assert list(columns.day_mask) == [ 0b0010001, 0b0010001, 0b0000001, 0b0000001, 0 ]
+        assert list(columns.age) == [ 56, 22, 0, 65535, 31 ]
+        columns.get(1)["work_days"].append("SUNDAY") # Materialized as a copy.
+        assert columns.get(1) == workers[1]
+
+    def test_columns_invalid(self):
+        """
+        Test case on workers that `WorkerColumns` cannot hold.
+        """
+        valid = { "name" : "A", "sex" : "M", "is_reg_member" : True, "age" : 56, "work_days" : [ "MONDAY" ] }
+        for changes, message in [
+                ({ "age" : None }, "age must be an integer from 0 to 65535"),
+                ({ "age" : -1 }, "age must be an integer from 0 to 65535"),
+                ({ "age" : 65536 }, "age must be an integer from 0 to 65535"),
+                ({ "age" : True }, "age must be an integer from 0 to 65535"),
+                ({ "name" : 1 }, "name and sex must be strings"),
+                ({ "is_reg_member" : "yes" }, "is_reg_member must be a boolean"),
+                ({ "work_days" : "MONDAY" }, "work_days must be an array of strings"),
+                ({ "work_days" : [ 1 ] }, "work_days must be an array of strings") ]:
+            with self.assertRaises(ValueError) as context:
+                WorkerColumns.from_workers([ valid, dict(valid, **changes) ])
+            assert str(context.exception) == f"Invalid worker at position 1: {message}"
+
+        missing = dict(valid)
+        del missing["sex"], missing["work_days"]
+        for worker, message in [ (missing, "missing sex, work_days"), ([], "not an object") ]:
+            with self.assertRaises(ValueError) as context:
+                WorkerColumns.from_workers([ worker ])
+            assert str(context.exception) == f"Invalid worker at position 0: {message}"
+
+    def test_find_workers(self):
+        """
+        Test case on function `Snapshot.find_workers(query)` where only the work days are queried.
+        """
+        workers = [
+            { "name" : "A", "sex" : "M", "is_reg_member" : True, "age" : 20, "work_days" : [ "MONDAY", "WEDNESDAY", "FRIDAY" ] },
+            { "name" : "B", "sex" : "M", "is_reg_member" : True, "age" : 20, "work_days" : [ "SATURDAY", "SUNDAY" ] },
+            { "name" : "C", "sex" : "M", "is_reg_member" : True, "age" : 20, "work_days" : [ "MONDAY", "FRIDAY" ] },
+            { "name" : "D", "sex" : "M", "is_reg_member" : True, "age" : 20, "work_days" : [ "MONDAY", "WEDNESDAY", "FRIDAY" ] }
+        ]
+        snapshot = WorkerRoster.Snapshot(None, WorkerColumns.from_workers(workers))
+
+        def find(days):
+            query = WorkerQuery(WorkerRoster.encode_days(days))
+            return [ worker["name"] for worker in snapshot.find_workers(query) ]
+
+        assert find([]) == [ "A", "B", "C", "D" ]
+        assert find([ "MONDAY", "FRIDAY" ]) == [ "A", "C", "D" ]
+        assert find([ "WEDNESDAY" ]) == [ "A", "D" ]
+        assert find([ "SUNDAY" ]) == [ "B" ]
+        assert find([ "TUESDAY" ]) == []
+
+    def test_get_encoded(self):
+        """
+        Test case on function `Snapshot.get_encoded(query, encode)`.
+        """
+        snapshot = self.roster.get_snapshot()
+        encode_calls = []
+
+        def encode(data):
+            encode_calls.append(data)
+            return json.dumps(data).encode("utf8")
+
+        body, etag = snapshot.get_encoded(WorkerQuery(), encode)
+        assert json.loads(body) == TestWorkerRoster.workers
+        assert snapshot.get_encoded(WorkerQuery(), encode) == (body, etag)
+        assert len(encode_calls) == 1
+
+        body, _ = snapshot.get_encoded(WorkerQuery(WorkerRoster.encode_days([ "SUNDAY" ])), encode)
+        assert json.loads(body) == { "workers" : [] }
+        body, _ = snapshot.get_encoded(WorkerQuery(age_min=50), encode)
+        assert json.loads(body) == TestWorkerRoster.workers
+        assert len(encode_calls) == 3
+
+        with patch.object(WorkerRoster, "encoded_max_entries", 2):
+            snapshot = WorkerRoster.Snapshot(snapshot.signature, snapshot.columns)
+        for age_min in [ 1, 2, 3, 1 ]:
+            snapshot.get_encoded(WorkerQuery(age_min=age_min), encode)
+        assert len(encode_calls) == 7 # The body of age_min 1 was evicted.
+        assert snapshot.encoded.stats()["entries"] == 2
+
+    def test_iter_workers(self):
+        """
+        Test case on function `iter_workers(data_file, chunk_size)`.
+        """
+        text = '{ "version" : 12345, "other" : [ "]", { "a" : 1 } ], ' \
+               '"workers" : [ { "name" : "A" }, 23456, { "name" : "[B]" } ], "after" : 1 }'
+        for chunk_size in [ 1, 2, 3, 7, 1024 ]:
+            workers = list(WorkerRoster.iter_workers(io.StringIO(text), chunk_size))
+            self.assertEqual([ { "name" : "A" }, 23456, { "name" : "[B]" } ], workers)
+
+        assert list(WorkerRoster.iter_workers(io.StringIO('{ "workers" : [] }'))) == []
+        assert list(WorkerRoster.iter_workers(io.StringIO('{}'))) == []
+        assert list(WorkerRoster.iter_workers(io.StringIO('{ "workers" : [ 1 ] }\n'))) == [ 1 ]
+
+    def test_iter_workers_invalid(self):
+        """
+        Test case on function `iter_workers(data_file, chunk_size)` with malformed data files,
+        and the positions of the errors in the file.
+        """
+        for text, message in [
+                ('{ "workers" : [ { "name" : "A" }', "Unexpected end of worker data file at character 32!"),
+                ('{"workers":[]', "Unexpected end of worker data file at character 13!"),
+                ('{"workers":[1]} trailing', "Unexpected data after the worker data at character 16 of the worker data file!"),
+                ('{"workers":[1]}{}', "Unexpected data after the worker data at character 15 of the worker data file!"),
+                ('{"workers":[1], "after" : [ 1, ] }', "Expecting value at character 31 of the worker data file!"),
+                ('{"workers":[1 2]}', "Expected ',' at character 14 of the worker data file!"),
+                ('{ 1 : 2 }', "Expected a member name at character 2 of the worker data file!") ]:
+            for chunk_size in [ 1, 3, 1024 ]:
+                with self.assertRaises(ValueError) as context:
+                    list(WorkerRoster.iter_workers(io.StringIO(text), chunk_size))
+                assert str(context.exception) == message, (text, chunk_size, str(context.exception))
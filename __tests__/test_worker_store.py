@@ -0,0 +1,215 @@
+import unittest
+from unittest.mock import patch
+from worker_store import WorkerStore, PostgresWorkerStore
+from worker_roster import WorkerRoster
+from worker_columns import WorkerColumns
+from worker_query import WorkerQuery
+import os
+import threading
+import time
+
+
+class FakeConnectionPool():
+    """
+    Stand-in for `psycopg2.pool.ThreadedConnectionPool`.
+
+    Its connections answer the prepared statements of `PostgresWorkerStore` from in-memory rows,
+    and record the SQL executed on them.
+    Like the real pool, `getconn()` fails when all the `pool_max` connections are in use.
+    """
+
+    rows = []
+
+    class Connection():
+
+        def __init__(self):
+            self.statements = []
+            self.prepared = {}
+            self.autocommit = False
+
+        def cursor(self):
+            return FakeConnectionPool.Cursor(self)
+
+    class Cursor():
+
+        def __init__(self, connection):
+            self.connection = connection
+            self.result = None
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def execute(self, sql, params=None):
+            self.connection.statements.append(sql)
+            if sql.startswith("PREPARE"):
+                name, prepared_sql = sql[len("PREPARE "):].split(" AS ", 1)
+                self.connection.prepared[name] = prepared_sql
+            if sql.startswith("EXECUTE"):
+                sql = self.connection.prepared[sql.split()[1]]
+                masks, age_min, age_max, sex, is_reg_member, limit, offset = params
+                self.result = [ row for row in FakeConnectionPool.rows
+                                if row[4] in masks
+                                and (age_min is None or row[3] >= age_min) and (age_max is None or row[3] <= age_max)
+                                and (sex is None or row[1] == sex) and (is_reg_member is None or row[2] == is_reg_member) ]
+                if "ORDER BY age DESC" in sql:
+                    self.result.sort(key=lambda row: row[3], reverse=True)
+                assert sql.endswith("LIMIT $6 OFFSET $7")
+                self.result = self.result[offset:None if limit is None else offset + limit]
+
+        def fetchall(self):
+            return self.result
+
+    def __init__(self, pool_min, pool_max, dsn):
+        self.connections = [ FakeConnectionPool.Connection() ]
+        self.pool_max = pool_max
+        self.in_use = 0
+        self.max_in_use = 0
+
+    def getconn(self):
+        from psycopg2.pool import PoolError
+        if self.in_use >= self.pool_max:
+            raise PoolError("connection pool exhausted")
+        self.in_use += 1
+        self.max_in_use = max(self.max_in_use, self.in_use)
+        time.sleep(0.01) # Lets the other threads run while the connection is in use.
+        return self.connections[0]
+
+    def putconn(self, connection, close=False):
+        self.in_use -= 1
+
+
+class DiscardingConnectionPool(FakeConnectionPool):
+    """
+    Stand-in for a pool that closes every connection returned to it, as psycopg2's does beyond `minconn`.
+    """
+
+    def getconn(self):
+        super().getconn()
+        return FakeConnectionPool.Connection()
+
+
+class TestWorkerStore(unittest.TestCase):
+    """
+    Test case(s) for the modules `WorkerStore` and `PostgresWorkerStore`.
+    """
+
+    workers = [
+        { "name" : "Chan Tai Man", "sex" : "M", "is_reg_member" : True, "age" : 56,
+          "work_days" : [ "MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY" ] },
+        { "name" : "Ma Siu Ling", "sex" : "F", "is_reg_member" : False, "age" : 22,
+          "work_days" : [ "MONDAY", "WEDNESDAY", "FRIDAY" ] },
+        { "name" : "Three Cheung", "sex" : "M", "is_reg_member" : False, "age" : 31,
+          "work_days" : [ "SATURDAY", "SUNDAY" ] }
+    ]
+
+    def setUp(self):
+        """
+        Setup before test run.
+        """
+        FakeConnectionPool.rows = [ (worker["name"], worker["sex"], worker["is_reg_member"], worker["age"],
+                                     WorkerColumns.encode_days(worker["work_days"]), None)
+                                    for worker in TestWorkerStore.workers ]
+
+    def test_create(self):
+        """
+        Test case on function `WorkerStore.create(config)`.
+        """
+        assert isinstance(WorkerStore.create({ "WORKER_DATA_FILE" : "data/worker_list.json" }), WorkerRoster)
+        assert isinstance(WorkerStore.create({ "WORKER_STORE_BACKEND" : "postgres", "WORKER_DATABASE_URL" : "" }),
+                          PostgresWorkerStore)
+        with self.assertRaises(ValueError):
+            WorkerStore.create({ "WORKER_STORE_BACKEND" : "mongodb" })
+
+    def test_superset_masks(self):
+        """
+        Test case on the day masks pushed down to the database.
+        """
+        assert PostgresWorkerStore.superset_masks[0] == list(range(128))
+        assert PostgresWorkerStore.superset_masks[127] == [ 127 ]
+        assert PostgresWorkerStore.superset_masks[0b1000001] == [ 0b1000001 | (bits << 1) for bits in range(32) ]
+
+    @patch("psycopg2.pool.ThreadedConnectionPool", new=FakeConnectionPool)
+    def test_find_workers(self):
+        """
+        Test case on function `PostgresWorkerStore.find_workers(query)`.
+        """
+        store = PostgresWorkerStore("postgresql://localhost/test")
+        snapshot = store.get_snapshot()
+        assert snapshot.find_workers(WorkerQuery()) == TestWorkerStore.workers
+        assert snapshot.find_workers(WorkerQuery(WorkerColumns.encode_days([ "MONDAY" ]))) == TestWorkerStore.workers[0:2]
+        assert snapshot.find_workers(WorkerQuery(age_max=40, sort_by="age", order="desc")) \
+            == [ TestWorkerStore.workers[2], TestWorkerStore.workers[1] ]
+
+        statements = store._pool.connections[0].statements
+        assert len([ sql for sql in statements if sql.startswith("PREPARE find_workers_id_asc AS") ]) == 1
+        assert len([ sql for sql in statements if sql.startswith("EXECUTE find_workers_id_asc") ]) == 2
+        assert "ORDER BY age DESC, id DESC" in [ sql for sql in statements if sql.startswith("PREPARE find_workers_age_desc") ][0]
+        assert 'ORDER BY name COLLATE "C" DESC, id DESC' in store.get_statement(WorkerQuery(sort_by="name", order="desc"))[1]
+        assert store.stats() == { "queries" : 3 }
+
+    @patch("psycopg2.pool.ThreadedConnectionPool", new=DiscardingConnectionPool)
+    def test_discarded_connections(self):
+        """
+        Test case on the prepared statements of the connections closed by the pool, which are not kept.
+        """
+        store = PostgresWorkerStore("postgresql://localhost/test")
+        for _ in range(3):
+            assert store.find_workers(WorkerQuery()) == TestWorkerStore.workers
+        assert len(store._prepared) == 0
+        assert store.pool_min == store.pool_max == 4
+
+    @patch("psycopg2.pool.ThreadedConnectionPool", new=FakeConnectionPool)
+    def test_find_page(self):
+        """
+        Test case on function `PostgresWorkerStore.Snapshot.find_page(query, start, limit)`.
+        """
+        snapshot = PostgresWorkerStore("postgresql://localhost/test").get_snapshot()
+        assert snapshot.find_page(WorkerQuery(), 0, 2) == (TestWorkerStore.workers[0:2], 2)
+        assert snapshot.find_page(WorkerQuery(), 2, 2) == (TestWorkerStore.workers[2:], None)
+        assert snapshot.find_page(WorkerQuery(), 1, 2) == (TestWorkerStore.workers[1:], None)
+        assert snapshot.find_page(WorkerQuery(), 1) == (TestWorkerStore.workers[1:], None)
+        assert snapshot.find_page(WorkerQuery(), 5, 2) == ([], None)
+
+    @patch("psycopg2.pool.ThreadedConnectionPool", new=FakeConnectionPool)
+    def test_more_threads_than_connections(self):
+        """
+        Test case on more concurrent queries than connections in the pool, which wait for a connection.
+        """
+        store = PostgresWorkerStore("postgresql://localhost/test", pool_max=2)
+        results = []
+        threads = [ threading.Thread(target=lambda: results.append(store.find_workers(WorkerQuery()))) for _ in range(8) ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == [ TestWorkerStore.workers ] * 8
+        assert store._pool.max_in_use == 2
+
+    @patch("psycopg2.pool.ThreadedConnectionPool", new=FakeConnectionPool)
+    def test_get_encoded(self):
+        """
+        Test case on function `PostgresWorkerStore.Snapshot.get_encoded(query, encode)`.
+        """
+        snapshot = PostgresWorkerStore("postgresql://localhost/test").get_snapshot()
+        body, etag = snapshot.get_encoded(WorkerQuery(sex="F"), lambda data: str(data).encode("utf8"))
+        assert body == str({ "workers" : TestWorkerStore.workers[1:2] }).encode("utf8")
+        assert snapshot.get_encoded(WorkerQuery(sex="F"), lambda data: str(data).encode("utf8"))[1] == etag
+
+    @unittest.skipUnless(os.environ.get("TEST_DATABASE_URL"), "TEST_DATABASE_URL is not set.")
+    def test_postgres(self):
+        """
+        Test case against a real PostgreSQL database, at environment variable `TEST_DATABASE_URL`.
+
+        The table `workers` of the database is replaced.
+        """
+        store = PostgresWorkerStore(os.environ["TEST_DATABASE_URL"])
+        store.import_workers(WorkerColumns.from_workers(TestWorkerStore.workers))
+        snapshot = store.get_snapshot()
+        assert snapshot.find_workers(WorkerQuery()) == TestWorkerStore.workers
+        assert snapshot.find_workers(WorkerQuery(WorkerColumns.encode_days([ "WEDNESDAY" ]), sort_by="name", order="desc")) \
+            == [ TestWorkerStore.workers[1], TestWorkerStore.workers[0] ]
+        assert snapshot.find_workers(WorkerQuery(age_min=30, is_reg_member=False)) == TestWorkerStore.workers[2:]
+        assert snapshot.find_page(WorkerQuery(sort_by="age"), 1, 1) == (TestWorkerStore.workers[2:], 2)
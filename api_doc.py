@@ -0,0 +1,127 @@
+import re
+import sys
+from flask import Flask, jsonify, request
+from static_assets import StaticAssets
+
+class ApiDoc():
+    """
+    Serves the API documentation (OpenAPI a.k.a. Swagger UI) of an app, in the same way as `swagger_ui.flask_api_doc()`.
+
+    1. `swagger_ui` is imported, and its document set up, only on the first request to the documentation,
+    unless `eager` is set. So a process that never serves the documentation (eg. most gunicorn workers) never loads it.
+    2. The page is rendered, and the OpenAPI document file is parsed, once per process rather than once per request.
+    3. The static files of the page (eg. `swagger-ui-bundle.js`) are served by `StaticAssets`,
+    from a build directory with their precompressed variants if `static_dir` is set.
+    The page links to them by URLs versioned by their content hashes, so that browsers cache them as immutable.
+    """
+
+    modes = ( "eager", "lazy", "disabled" )
+
+    def __init__(self, config_path: str, url_prefix: str, title: str, static_dir: str = None):
+        """
+        :param config_path: Path of the OpenAPI document file, in YAML or JSON.
+        :param url_prefix: Path of the documentation page.
+        :param title: Title of the documentation page.
+        :param static_dir: The build directory of the static files (see `build_static()`).
+                           `None` to serve them uncompressed from `swagger_ui`.
+        """
+        self.config_path = config_path
+        self.url_prefix = url_prefix.rstrip('/')
+        self.title = title
+        self.static_dir = static_dir
+        self.document = None
+        self.page = None
+        self.config = None
+        self.static_assets = None
+
+    def init_app(self, app: Flask, mode: str = "lazy"):
+        """
+        Adds the documentation endpoints to an app.
+
+        :param app: The app.
+        :param mode: `eager` to load the documentation now, `lazy` to load it on its first request,
+                     or `disabled` to not serve it at all.
+        """
+        if mode not in ApiDoc.modes:
+            raise ValueError(f"Invalid API doc mode: {mode}")
+        if mode == "disabled":
+            return
+        app.add_url_rule(self.url_prefix, 'api_doc', self.get_page)
+        app.add_url_rule(self.url_prefix + '/', 'api_doc_slash', self.get_page)
+        app.add_url_rule(self.url_prefix + '/swagger.json', 'api_doc_config', self.get_config)
+        app.add_url_rule(self.url_prefix + '/static/<path:filename>', 'api_doc_static', self.get_static)
+        if mode == "eager":
+            self.load()
+
+    def load(self):
+        """
+        Sets up the `swagger_ui` document, and parses the OpenAPI document file, if not done yet.
+        """
+        if self.document is None:
+            from swagger_ui.core import ApplicationDocument
+
+            document = ApplicationDocument(None, config_path=self.config_path, url_prefix=self.url_prefix, title=self.title,
+                                           host_inject=False)
+            self.config = document.get_config(None)
+            if self.static_dir:
+                self.static_assets = StaticAssets(self.static_dir, built=True)
+            else:
+                self.static_assets = StaticAssets(document.static_dir)
+            self.page = self.version_static_urls(document.doc_html)
+            self.document = document
+
+    def version_static_urls(self, page: str) -> str:
+        """
+        Adds the content hash of each static file linked by a page to its URL, eg. `.../static/index.css?v=<hash>`.
+
+        :param page: The page.
+        """
+        def add_version(match):
+            version = self.static_assets.get_version(match[2])
+            return match[0] if version is None else f"{match[1]}{match[2]}?v={version}"
+
+        static_url = re.escape(self.url_prefix + '/static/')
+        return re.sub(f'({static_url})([^"\'?#]+)', add_version, page)
+
+    def get_page(self):
+        """
+        Returns the documentation page.
+        """
+        self.load()
+        return self.page
+
+    def get_config(self):
+        """
+        Returns the OpenAPI document, with the host of the request added if the document has none.
+        """
+        self.load()
+        config = self.config
+        if 'host' not in config:
+            config = dict(config, host=request.host)
+        return jsonify(config)
+
+    def get_static(self, filename: str):
+        """
+        Returns a static file (script, style sheet or image) of the documentation page.
+
+        :param filename: Path of the file in the static directory of `swagger_ui`.
+        """
+        self.load()
+        return self.static_assets.send(filename, request.args.get('v'))
+
+    def build_static(build_dir: str) -> dict:
+        """
+        Build step: copies the static files of `swagger_ui` into a build directory with their precompressed variants
+        (see `StaticAssets.build()`), except those of the Swagger editor, which is not served. Returns the manifest of the files.
+
+        :param build_dir: The build directory.
+        """
+        from swagger_ui.utils import SWAGGER_UI_PY_ROOT
+        return StaticAssets.build(str(SWAGGER_UI_PY_ROOT.joinpath('static')), build_dir, exclude=("swagger-editor",))
+
+if __name__ == "__main__":
+    # Build step: python api_doc.py <build directory>
+    build_dir = sys.argv[1]
+    manifest = ApiDoc.build_static(build_dir)
+    variants = sum(len(entry["encodings"]) for entry in manifest.values())
+    print(f"Copied {len(manifest)} static file(s) with {variants} compressed variant(s) into {build_dir}.")
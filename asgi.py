@@ -0,0 +1,102 @@
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import RoutingException
+from App import application as wsgi_application, delayed_endpoints
+from devtest_helper import DevtestHelper
+
+class AsgiApp():
+    """
+    Serves the app under an ASGI server, eg. `uvicorn asgi:application`.
+
+    1. The simulated delay of an endpoint (see `DevtestHelper`) is awaited with `asyncio.sleep()`
+    before the request is passed to the Flask app, so a delayed request holds no thread or worker while it waits.
+    2. The Flask app then handles the request in a thread of the event loop's thread pool,
+    so requests are handled concurrently rather than one at a time.
+    """
+
+    class WsgiInstance(WsgiToAsgiInstance):
+        """
+        Runs the WSGI app in any thread of the thread pool,
+        instead of the single thread shared by all requests as `WsgiToAsgiInstance` does.
+
+        `run_wsgi_app()` is overridden as a whole (with the public `build_environ()` and `start_response()`),
+        so that it does not depend on how `WsgiToAsgiInstance` wraps its own.
+        """
+
+        @sync_to_async(thread_sensitive=False)
+        def run_wsgi_app(self, body):
+            try:
+                environ = self.build_environ(self.scope, body)
+            except ValueError: # Too many duplicate headers.
+                self.sync_send({ 'type' : 'http.response.start', 'status' : 400,
+                                 'headers' : [ (b'content-type', b'text/plain') ] })
+                self.sync_send({ 'type' : 'http.response.body', 'body' : b'Bad Request: Too many duplicate headers' })
+                return
+            output = self.wsgi_application(environ, self.start_response)
+            try:
+                bytes_sent = 0
+                for data in output:
+                    if not self.response_started:
+                        self.response_started = True
+                        self.sync_send(self.response_start)
+                    if self.response_content_length is not None: # Send no more than the Content-Length.
+                        data = data[:self.response_content_length - bytes_sent]
+                    self.sync_send({ 'type' : 'http.response.body', 'body' : data, 'more_body' : True })
+                    bytes_sent += len(data)
+                    if bytes_sent == self.response_content_length:
+                        break
+            finally:
+                if hasattr(output, 'close'):
+                    output.close()
+            if not self.response_started:
+                self.response_started = True
+                self.sync_send(self.response_start)
+            self.sync_send({ 'type' : 'http.response.body' })
+
+    class Wsgi(WsgiToAsgi):
+        async def __call__(self, scope, receive, send):
+            await AsgiApp.WsgiInstance(self.wsgi_application, self.duplicate_header_limit)(scope, receive, send)
+
+    def __init__(self, wsgi_app):
+        """
+        :param wsgi_app: The Flask app.
+        """
+        self.wsgi = AsgiApp.Wsgi(wsgi_app)
+        self.url_adapter = wsgi_app.url_map.bind('')
+
+    def get_delay_key(self, scope) -> str:
+        """
+        Returns the key of the simulated delay of the requested endpoint (see `delayed_endpoints` in `App.py`),
+        or None if it has none. The endpoint is matched with the URL map of the Flask app.
+
+        :param scope: The ASGI scope of the request.
+        """
+        try:
+            endpoint, _ = self.url_adapter.match(scope.get('path'), scope.get('method'))
+        except (HTTPException, RoutingException): # Not found, method not allowed or redirected.
+            return None
+        return delayed_endpoints.get(endpoint)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.handle_lifespan(receive, send)
+            return
+        delay_key = self.get_delay_key(scope)
+        if delay_key is not None:
+            await DevtestHelper.simulate_delay_async(delay_key)
+        await self.wsgi(scope, receive, send)
+
+    async def handle_lifespan(self, receive, send):
+        """
+        Acknowledges the startup and shutdown events of the ASGI server. The app has nothing to set up or tear down.
+        """
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({ 'type' : 'lifespan.startup.complete' })
+            elif message['type'] == 'lifespan.shutdown':
+                await send({ 'type' : 'lifespan.shutdown.complete' })
+                return
+
+application = AsgiApp(wsgi_application)
@@ -0,0 +1 @@
+# This file exists to let the benchmark scripts import modules at the root directory of this project.
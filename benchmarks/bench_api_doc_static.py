@@ -0,0 +1,69 @@
+"""
+Benchmark: bytes sent and server time of loading the API documentation page (the page and its static files).
+
+Compares the static files served uncompressed from `swagger_ui` with those served from a build directory
+(`static_dir` in section `[ApiDoc]` of `config.ini`), for:
+1. A first visit with an empty browser cache.
+2. A repeat visit, where the browser revalidates the cached files (unversioned URLs),
+or uses them without asking (versioned URLs cached as immutable).
+
+Usage (at the root directory of this project):
+    python -m benchmarks.bench_api_doc_static [build directory]
+Without a build directory, one is built into a temporary directory first (which takes a while with brotli).
+"""
+import os
+import re
+import sys
+import tempfile
+import time
+
+os.environ["LOG_LEVEL"] = "WARNING"
+from flask import Flask
+from api_doc import ApiDoc
+
+accept_encoding = "gzip, deflate, br"
+
+def load_page(client, cache: dict) -> tuple:
+    """
+    Loads the documentation page and its static files as a browser would, with a cache of the responses by URL.
+    Returns the number of requests, the bytes of the response bodies, and the server time in ms.
+    """
+    requests = 0
+    sent = 0
+    start = time.perf_counter()
+    page = client.get('/api/doc', headers={ "Accept-Encoding" : accept_encoding })
+    requests += 1
+    sent += len(page.data)
+    for url in re.findall(r'"(/api/doc/static/[^"]+)"', page.get_data(as_text=True)):
+        cached = cache.get(url)
+        if cached is not None and cached.cache_control.immutable:
+            continue
+        headers = { "Accept-Encoding" : accept_encoding }
+        if cached is not None:
+            headers["If-None-Match"] = cached.headers["ETag"]
+        response = client.get(url, headers=headers)
+        requests += 1
+        sent += len(response.data)
+        if response.status_code == 200:
+            cache[url] = response
+    return requests, sent, (time.perf_counter() - start) * 1000
+
+def measure(static_dir: str):
+    app = Flask(__name__)
+    ApiDoc(config_path='./api/doc/swagger.yaml', url_prefix='/api/doc', title='Benchmark', static_dir=static_dir).init_app(app, "eager")
+    client = app.test_client()
+    cache = {}
+    for visit in [ "first visit", "repeat visit" ]:
+        requests, sent, elapsed = load_page(client, cache)
+        label = f"{'build directory' if static_dir else 'swagger_ui'}, {visit}"
+        print(f"{label:<32} {requests:>8} {sent / 1024:10.1f} KB {elapsed:8.1f} ms")
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as temp_dir:
+        build_dir = sys.argv[1] if len(sys.argv) > 1 else None
+        if build_dir is None:
+            build_dir = temp_dir
+            ApiDoc.build_static(build_dir)
+        print(f"{'':<32} {'requests':>8} {'sent':>13} {'time':>11}")
+        measure(None)
+        measure(build_dir)
@@ -0,0 +1,47 @@
+"""
+Micro-benchmark: batch date calculation of `DateCalculator`.
+
+Compares, for a payroll-like batch of 200,000 (date, weeks) pairs over 365 distinct dates:
+1. The per-item calculation of `/calculateDate`: `strptime`, `timedelta` and `strftime` for each pair.
+2. `DateCalculator.add_weeks()` without NumPy (ordinal arithmetic).
+3. `DateCalculator.add_weeks()` with NumPy (vectorized), if installed.
+
+Usage (at the root directory of this project):
+    python -m benchmarks.bench_calculate_dates
+"""
+import importlib.util
+import random
+import timeit
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+from date_calculator import DateCalculator
+
+size = 200000
+random.seed(1)
+first_day = date(2024, 1, 1).toordinal()
+dates = [ date.fromordinal(first_day + random.randrange(365)).isoformat() for _ in range(size) ]
+weeks = [ random.randrange(-52, 53) for _ in range(size) ]
+
+def run_per_item():
+    return [ (datetime.strptime(value, "%Y-%m-%d") + timedelta(weeks=num_of_weeks)).strftime("%Y-%m-%d")
+             for value, num_of_weeks in zip(dates, weeks) ]
+
+def run_ordinal():
+    with patch('date_calculator.DateCalculator.add_days_vectorized', side_effect=ImportError):
+        return DateCalculator.add_weeks(dates, weeks)
+
+def run_numpy():
+    return DateCalculator.add_weeks(dates, weeks)
+
+if __name__ == "__main__":
+    assert run_per_item() == run_ordinal()
+    candidates = [ ("per item", run_per_item), ("ordinal", run_ordinal) ]
+    if importlib.util.find_spec("numpy"):
+        assert run_numpy() == run_ordinal()
+        candidates.append(("numpy (vectorized)", run_numpy))
+
+    print(f"{size} (date, weeks) pairs:")
+    for label, run in candidates:
+        number, seconds = timeit.Timer(run).autorange()
+        print(f"{label:<20} {seconds / number * 1000:8.1f} ms per run")
@@ -0,0 +1,58 @@
+"""
+Benchmark: CPU time vs. bytes sent of compressing the JSON responses by `ResponseCompression`.
+
+For the response bodies of some endpoints, compares no compression with gzip and brotli at several levels:
+the compressed size (% of the body) and the time to compress it.
+Then compares whole requests through the Flask test client without vs. with compression (the configured levels).
+
+Usage (at the root directory of this project):
+    python -m benchmarks.bench_compression
+"""
+import os
+import timeit
+
+os.environ["LOG_LEVEL"] = "WARNING"
+from App import application
+from response_compression import ResponseCompression
+
+client = application.test_client()
+requests = [
+    ("/getSumoHonbashoSchedule", { "year" : 2024 }),
+    ("/getSumoHonbashoScheduleRange (10 y)", { "from_year" : 2024, "to_year" : 2033 }),
+    ("/getSumoHonbashoScheduleRange (100 y)", { "from_year" : 2024, "to_year" : 2123 })
+]
+levels = [ ("gzip", 1), ("gzip", 6), ("gzip", 9), ("br", 1), ("br", 4), ("br", 11) ]
+
+def get(label: str, query: dict, accept_encoding: str = None):
+    path = label.split(" ")[0]
+    return client.get(path, query_string=query, headers={ "Accept-Encoding" : accept_encoding } if accept_encoding else {})
+
+def measure(run) -> float:
+    number, seconds = timeit.Timer(run).autorange()
+    return min(timeit.repeat(run, number=number, repeat=3)) / number * 1e6
+
+def create_compressor(encoding: str, level: int):
+    middleware = ResponseCompression(None, gzip_level=level, brotli_quality=level)
+    return lambda data: middleware.create_compressor(encoding)(data, finish=True)
+
+if __name__ == "__main__":
+    try:
+        import brotli
+    except ImportError:
+        levels = [ (encoding, level) for encoding, level in levels if encoding != "br" ]
+
+    print(f"{'':<38} {'size':>10}" + "".join(f" {encoding + ' ' + str(level):>16}" for encoding, level in levels))
+    for label, query in requests:
+        body = get(label, query).data
+        sizes = []
+        for encoding, level in levels:
+            compress = create_compressor(encoding, level)
+            sizes.append(f"{len(compress(body)) / len(body):5.1%} {measure(lambda: compress(body)):6.0f} us")
+        print(f"{label:<38} {len(body):8d} B" + "".join(f" {size:>16}" for size in sizes))
+
+    print(f"\n{'':<38} {'uncompressed':>18} {'compressed':>18}")
+    for label, query in requests:
+        plain = measure(lambda: get(label, query))
+        compressed = measure(lambda: get(label, query, "gzip, deflate, br"))
+        response = get(label, query, "gzip, deflate, br")
+        print(f"{label:<38} {plain:15.0f} us {compressed:15.0f} us  ({response.content_encoding}, {len(response.data)} B)")
@@ -0,0 +1,72 @@
+"""
+Micro-benchmark: date parsing and formatting of `DateCodec`.
+
+Compares `datetime.strptime()`/`strftime()` with `DateCodec` for:
+1. Parsing and formatting a single date.
+2. The date work of one `/calculateDate` request (1 parse, 1 format).
+3. The date work of one `/getSumoHonbashoSchedule` request (90 formats).
+4. Whole requests to both endpoints through the Flask test client.
+
+Usage (at the root directory of this project):
+    python -m benchmarks.bench_date_codec
+"""
+import os
+import timeit
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+os.environ["LOG_LEVEL"] = "WARNING" # Keeps the per-request debug logging out of the measurements.
+from App import application
+from date_codec import DateCodec
+from honbasho_calendar import HonbashoCalendar
+
+date_format = "%Y-%m-%d"
+schedule_dates = [ day for basho in HonbashoCalendar.calculate_schedule(2024) for day in basho["dates"] ]
+
+def strptime_parse(value: str):
+    return datetime.strptime(value, date_format).date()
+
+def strftime_format(day) -> str:
+    return day.strftime(date_format)
+
+def calculate_date_work(parse, format):
+    return format(parse("2024-05-27") + timedelta(weeks=10))
+
+def honbasho_schedule_work(format):
+    return list(map(format, schedule_dates))
+
+client = application.test_client()
+
+def calculate_date_request():
+    return client.post('/calculateDate', json={ "date" : "2024-05-27", "weeks" : 10 })
+
+def honbasho_schedule_request():
+    return client.get('/getSumoHonbashoSchedule', query_string={ "year" : 2024 })
+
+def measure(run) -> float:
+    number, seconds = timeit.Timer(run).autorange()
+    return seconds / number * 1e6
+
+if __name__ == "__main__":
+    assert calculate_date_work(strptime_parse, strftime_format) == calculate_date_work(DateCodec.parse, DateCodec.format)
+    assert honbasho_schedule_work(strftime_format) == honbasho_schedule_work(DateCodec.format)
+
+    print(f"{'':<36} {'strptime/strftime':>18} {'DateCodec':>12}")
+    rows = [
+        ("parse 1 date", lambda: strptime_parse("2024-05-27"), lambda: DateCodec.parse("2024-05-27")),
+        ("format 1 date", lambda: strftime_format(schedule_dates[0]), lambda: DateCodec.format(schedule_dates[0])),
+        ("/calculateDate date work", lambda: calculate_date_work(strptime_parse, strftime_format),
+                                     lambda: calculate_date_work(DateCodec.parse, DateCodec.format)),
+        ("/getSumoHonbashoSchedule date work", lambda: honbasho_schedule_work(strftime_format),
+                                               lambda: honbasho_schedule_work(DateCodec.format))
+    ]
+    for label, before, after in rows:
+        print(f"{label:<36} {measure(before):15.2f} us {measure(after):9.2f} us")
+
+    for label, run in [ ("/calculateDate request", calculate_date_request),
+                        ("/getSumoHonbashoSchedule request", honbasho_schedule_request) ]:
+        after = measure(run)
+        with patch('date_codec.DateCodec.parse', strptime_parse), \
+                patch('date_codec.DateCodec.format', strftime_format):
+            before = measure(run)
+        print(f"{label:<36} {before:15.2f} us {after:9.2f} us")
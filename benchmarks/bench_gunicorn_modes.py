@@ -0,0 +1,98 @@
+"""
+Throughput benchmark: the gunicorn worker models of `gunicorn.conf.py`.
+
+Starts the app under gunicorn in each mode (overriding config.ini by `GUNICORN_*` environment variables),
+then sends requests to `/getSumoHonbashoSchedule` and `/calculateDate` from concurrent keep-alive clients
+for a fixed time, and reports the requests answered per second.
+Modes that need a package that is not installed (eg. gevent) are skipped.
+
+Usage (at the root directory of this project):
+    python -m benchmarks.bench_gunicorn_modes [seconds per mode] [concurrent clients]
+"""
+import http.client
+import importlib.util
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+clients = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+
+modes = [
+    ("1 sync worker (old default)", { "GUNICORN_WORKERS" : "1", "GUNICORN_WORKER_CLASS" : "sync", "GUNICORN_THREADS" : "1",
+                                      "GUNICORN_PRELOAD_APP" : "false", "GUNICORN_MAX_REQUESTS" : "0" }),
+    ("auto sync workers", { "GUNICORN_WORKER_CLASS" : "sync", "GUNICORN_THREADS" : "1" }),
+    ("auto gthread workers x 4", { "GUNICORN_WORKER_CLASS" : "gthread", "GUNICORN_THREADS" : "4" }),
+    ("auto gevent workers", { "GUNICORN_WORKER_CLASS" : "gevent" })
+]
+
+def get_free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_server(env: dict, port: int) -> subprocess.Popen:
+    env = dict(os.environ, LOG_LEVEL="WARNING", GUNICORN_BIND=f"127.0.0.1:{port}", **env)
+    server = subprocess.Popen([ sys.executable, "-m", "gunicorn", "App:application" ], env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(100):
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/healthcheck")
+            connection.getresponse().read()
+            return server
+        except OSError:
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError("Server did not start.")
+
+def run_load(port: int) -> float:
+    deadline = time.perf_counter() + seconds
+    counts = []
+    body = json.dumps({ "date" : "2024-05-27", "weeks" : 10 })
+
+    def client():
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        count = 0
+        while time.perf_counter() < deadline:
+            try:
+                if count % 2 == 0:
+                    connection.request("GET", "/getSumoHonbashoSchedule?year=2024")
+                else:
+                    connection.request("POST", "/calculateDate", body, { "Content-Type" : "application/json" })
+                response = connection.getresponse()
+                response.read()
+            except (http.client.HTTPException, ConnectionError):
+                # The server closed the keep-alive connection, eg. a worker restarted after `max_requests`.
+                connection.close()
+                continue
+            assert response.status == 200
+            if response.getheader("Connection", "").lower() == "close":
+                connection.close()
+            count += 1
+        counts.append(count)
+
+    threads = [ threading.Thread(target=client) for _ in range(clients) ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / seconds
+
+if __name__ == "__main__":
+    print(f"{clients} concurrent keep-alive clients, {seconds:g} seconds per mode, {os.cpu_count()} CPU(s):")
+    for label, env in modes:
+        if env.get("GUNICORN_WORKER_CLASS") == "gevent" and not importlib.util.find_spec("gevent"):
+            print(f"{label:<30} skipped (gevent is not installed)")
+            continue
+        port = get_free_port()
+        server = start_server(env, port)
+        try:
+            print(f"{label:<30} {run_load(port):8.0f} requests/s")
+        finally:
+            server.terminate()
+            server.wait()
@@ -0,0 +1,48 @@
+"""
+Micro-benchmark: tournament date calculation of `HonbashoCalendar`.
+
+Compares, for all the tournaments of 2012 to 2100:
+1. The previous implementation, which walks a `calendar.monthcalendar` matrix.
+2. `HonbashoCalendar.calculate_dates()`, which finds the 2nd Sunday by weekday arithmetic.
+3. `HonbashoCalendar.calculate_schedules()`, vectorized with NumPy (if installed).
+
+Usage (at the root directory of this project):
+    python -m benchmarks.bench_honbasho_dates
+"""
+import calendar
+import importlib.util
+import timeit
+from datetime import date
+
+from honbasho_calendar import HonbashoCalendar
+
+years = range(2012, 2101)
+
+def monthcalendar_dates(year: int, basho: HonbashoCalendar.Basho) -> list:
+    month = basho.value
+    cal = calendar.monthcalendar(year, month)
+    dates = [ date(year, month, cal[1][calendar.SUNDAY]) ]
+    for w in range(2, 4):
+        for day in cal[w]:
+            dates.append(date(year, month, day))
+    return dates
+
+def run_monthcalendar():
+    return [ monthcalendar_dates(year, basho) for year in years for basho in HonbashoCalendar.Basho ]
+
+def run_arithmetic():
+    return [ HonbashoCalendar.calculate_dates(year, basho) for year in years for basho in HonbashoCalendar.Basho ]
+
+def run_numpy():
+    return HonbashoCalendar.calculate_schedules(years[0], years[-1])
+
+if __name__ == "__main__":
+    assert run_monthcalendar() == run_arithmetic()
+    candidates = [ ("monthcalendar", run_monthcalendar), ("arithmetic", run_arithmetic) ]
+    if importlib.util.find_spec("numpy"):
+        candidates.append(("numpy (vectorized)", run_numpy))
+
+    print(f"All tournaments of {years[0]} to {years[-1]} ({len(years) * 6} tournaments):")
+    for label, run in candidates:
+        number, seconds = timeit.Timer(run).autorange()
+        print(f"{label:<20} {seconds / number * 1000:8.3f} ms per run")
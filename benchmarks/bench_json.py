@@ -0,0 +1,71 @@
+"""
+Benchmark: the stdlib `json` (Flask's `DefaultJSONProvider`) vs. `orjson` (`OrjsonProvider`) as the JSON provider of the app.
+
+1. Encoding: `response()` of the response data of some endpoints, per call.
+2. Decoding: `loads()` of request bodies of `/getWorkers` and `/calculateDate`, and of the worker list, per call.
+3. Whole requests through the Flask test client, with each provider installed in the app.
+
+Usage (at the root directory of this project):
+    python -m benchmarks.bench_json
+"""
+import os
+import timeit
+
+os.environ["LOG_LEVEL"] = "WARNING"
+from flask.json.provider import DefaultJSONProvider
+from App import application
+from json_provider import OrjsonProvider
+
+client = application.test_client()
+providers = [ ("stdlib", DefaultJSONProvider(application)), ("orjson", OrjsonProvider(application)) ]
+
+def measure(run) -> float:
+    number, seconds = timeit.Timer(run).autorange()
+    return min(timeit.repeat(run, number=number, repeat=3)) / number * 1e6
+
+def get_response_data(path: str, query: dict) -> object:
+    return DefaultJSONProvider(application).loads(client.get(path, query_string=query).data)
+
+def print_row(label: str, times: list):
+    print(f"{label:<40}" + "".join(f" {time:12.1f} us" for time in times) + f" {times[0] / times[-1]:8.1f}x")
+
+if __name__ == "__main__":
+    encode_data = [
+        ("/calculateDate", { "result" : "2024-01-28" }),
+        ("/getSumoHonbashoSchedule", get_response_data('/getSumoHonbashoSchedule', { "year" : 2024 })),
+        ("/getSumoHonbashoScheduleRange (100 y)",
+         get_response_data('/getSumoHonbashoScheduleRange', { "from_year" : 2024, "to_year" : 2123 })),
+        ("/getWorkers (all)", client.post('/getWorkers', json={}).json)
+    ]
+    with open("data/worker_list.json", "rb") as data_file:
+        worker_list = data_file.read()
+    decode_data = [
+        ("/calculateDate request", b'{"date":"2024-01-14","weeks":2}'),
+        ("/getWorkers request", b'{"work_days":["MONDAY","WEDNESDAY"],"age_min":20,"sort_by":"age"}'),
+        (f"worker list ({len(worker_list)} B)", worker_list)
+    ]
+    requests = [
+        ("/calculateDate", lambda: client.post('/calculateDate', json={ "date" : "2024-01-14", "weeks" : 2 })),
+        ("/getWorkers", lambda: client.post('/getWorkers', json={ "work_days" : [ "MONDAY", "WEDNESDAY" ], "age_min" : 20 })),
+        ("/getSumoHonbashoSchedule", lambda: client.get('/getSumoHonbashoSchedule', query_string={ "year" : 2024 })),
+        ("/getSumoHonbashoScheduleRange (100 y)", lambda: client.get('/getSumoHonbashoScheduleRange',
+                                                                     query_string={ "from_year" : 2024, "to_year" : 2123 }))
+    ]
+
+    print(f"{'Encode':<40}" + "".join(f" {name:>15}" for name, provider in providers) + f" {'speedup':>9}")
+    for label, data in encode_data:
+        assert providers[0][1].response(data).get_data() == providers[1][1].response(data).get_data()
+        print_row(label, [ measure(lambda: provider.response(data)) for name, provider in providers ])
+
+    print(f"\n{'Decode':<40}")
+    for label, data in decode_data:
+        print_row(label, [ measure(lambda: provider.loads(data)) for name, provider in providers ])
+
+    print(f"\n{'Request':<40}")
+    times = {}
+    for name, provider in providers:
+        application.json = provider
+        for label, run in requests:
+            times.setdefault(label, []).append(measure(run))
+    for label, run in requests:
+        print_row(label, times[label])
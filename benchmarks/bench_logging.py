@@ -0,0 +1,97 @@
+"""
+Micro-benchmark: cost of the debug logging of the endpoints at log level INFO.
+
+Compares eager formatting (the message is built with an f-string before the log call, as before)
+with deferred formatting (`%`-style arguments, formatted only if the message is logged) for:
+1. The debug message of `calculate_schedule()`, which formats the whole schedule of a year.
+2. Whole requests to `/getWorkers`, `/timestwo` and `/calculateDate` through the Flask test client.
+Eager formatting is simulated by formatting the message before passing it to the logger.
+
+Also compares the time taken by the calling thread to log one INFO message with a `StreamHandler`
+vs. through a `QueueHandler` (`queue = true` in `config.ini`),
+to a file and to a slow stream (eg. a pipe to a busy log collector) that takes 1 ms per write.
+
+Usage (at the root directory of this project):
+    python -m benchmarks.bench_logging
+"""
+import logging
+import os
+import tempfile
+import time
+import timeit
+from unittest.mock import patch
+
+os.environ["LOG_LEVEL"] = "INFO"
+os.environ["LOG_QUEUE"] = "false"
+from App import application
+import flaskapp
+from honbasho_calendar import HonbashoCalendar
+
+client = application.test_client()
+schedule = HonbashoCalendar.calculate_schedule(2024)
+debug = application.logger.debug
+
+def eager_debug(msg, *args, **kwargs):
+    debug(msg % args if args else msg, **kwargs)
+
+def get_workers_request():
+    return client.post('/getWorkers', json={ "work_days" : [ "MONDAY", "WEDNESDAY" ], "age_min" : 20 })
+
+def timestwo_request():
+    return client.post('/timestwo', data={ "num" : 21 })
+
+def calculate_date_request():
+    return client.post('/calculateDate', json={ "date" : "2024-05-27", "weeks" : 10 })
+
+class SlowStream():
+    def write(self, text: str):
+        time.sleep(0.001)
+
+    def flush(self):
+        pass
+
+def measure(run) -> float:
+    number, seconds = timeit.Timer(run).autorange()
+    return min(timeit.repeat(run, number=number, repeat=5)) / number * 1e6
+
+def measure_handler(handler: logging.Handler, number: int) -> float:
+    logger = logging.getLogger("bench_logging")
+    logger.propagate = False
+    logger.handlers = [ handler ]
+    try:
+        run = lambda: logger.info("Request data: %s", { "work_days" : [ "MONDAY", "WEDNESDAY" ] })
+        return timeit.timeit(run, number=number) / number * 1e6
+    finally:
+        logger.handlers = []
+
+if __name__ == "__main__":
+    print(f"{'':<28} {'eager':>10} {'deferred':>11}")
+    year = 2024
+    before = measure(lambda: logging.debug(f"Schedule for year {year}:\n{schedule}"))
+    after = measure(lambda: logging.debug("Schedule for year %d:\n%s", year, schedule))
+    print(f"{'calculate_schedule message':<28} {before:7.2f} us {after:8.2f} us")
+
+    for label, run in [ ("/getWorkers request", get_workers_request),
+                        ("/timestwo request", timestwo_request),
+                        ("/calculateDate request", calculate_date_request) ]:
+        assert run().status_code == 200
+        after = measure(run)
+        with patch.object(application.logger, 'debug', eager_debug):
+            before = measure(run)
+        print(f"{label:<28} {before:7.2f} us {after:8.2f} us")
+
+    print(f"\n{'log 1 INFO message':<28} {'stream':>10} {'queue':>11}")
+    root = logging.getLogger()
+    root_handlers = root.handlers
+    with tempfile.TemporaryFile("w") as log_file:
+        for label, stream, number in [ ("to a file", log_file, 100000), ("to a slow stream", SlowStream(), 500) ]:
+            stream_handler = logging.StreamHandler(stream)
+            root.handlers = [ stream_handler ]
+            try:
+                direct = measure_handler(stream_handler, number)
+                flaskapp.start_queue_logging()
+                queued = measure_handler(root.handlers[0], number)
+            finally:
+                flaskapp.stop_queue_logging()
+                root.handlers = root_handlers
+            print(f"{label:<28} {direct:7.2f} us {queued:8.2f} us")
@@ -0,0 +1,79 @@
+"""
+Benchmark: requests to the cached endpoints without vs. with the response cache.
+
+1. Whole requests to each cached endpoint through the Flask test client: uncached (the view runs),
+a hit in the cache of the process, and a hit in the shared directory (as a process that has not cached it yet sees it).
+2. A mix of requests with repeated inputs, at several hit rates, uncached vs. cached.
+
+All the cacheable endpoints are cached here, whatever `endpoints` in section `[ResponseCache]` of `config.ini` is.
+
+Usage (at the root directory of this project):
+    python -m benchmarks.bench_response_cache
+"""
+import os
+import random
+import tempfile
+import timeit
+
+os.environ["LOG_LEVEL"] = "WARNING"
+os.environ["RESPONSE_CACHE_BACKEND"] = "local"
+os.environ["RESPONSE_CACHE_ENDPOINTS"] = "all"
+import App
+from App import application
+from response_cache import ResponseCache
+
+client = application.test_client()
+requests = [
+    ("/calculateDate", "calculate_date", lambda: client.post('/calculateDate', json={ "date" : "2024-01-14", "weeks" : 2 })),
+    ("/timestwo", "multiply_by_two", lambda: client.post('/timestwo', data={ "num" : 21 })),
+    ("/timestwo (1000 integers)", "multiply_by_two", lambda: client.post('/timestwo', json=list(range(1000)))),
+    ("/getSumoHonbashoSchedule", "get_honbasho_schedule",
+     lambda: client.get('/getSumoHonbashoSchedule', query_string={ "year" : 2024 })),
+    ("/greeting/<name>", "personal_greeting", lambda: client.get('/greeting/World'))
+]
+
+def measure(run) -> float:
+    number, seconds = timeit.Timer(run).autorange()
+    return min(timeit.repeat(run, number=number, repeat=3)) / number * 1e6
+
+def measure_uncached(endpoint: str, run) -> float:
+    """
+    Measures requests to the view of an endpoint as it is without the cache.
+    """
+    cached_view = application.view_functions[endpoint]
+    application.view_functions[endpoint] = cached_view.__wrapped__
+    try:
+        return measure(run)
+    finally:
+        application.view_functions[endpoint] = cached_view
+
+if __name__ == "__main__":
+    cache = App.response_cache
+    print(f"{'':<32} {'uncached':>12} {'local hit':>12} {'shared hit':>12}")
+    with tempfile.TemporaryDirectory() as shared_dir:
+        for label, endpoint, run in requests:
+            uncached = measure_uncached(endpoint, run)
+            cache.clear()
+            run()
+            local_hit = measure(run)
+            cache.shared = ResponseCache(shared_dir=shared_dir).shared
+            run()
+            shared_hit = measure(lambda: (cache.local.clear(), run())) # Not cached in this process yet.
+            cache.shared = None
+            print(f"{label:<32} {uncached:9.1f} us {local_hit:9.1f} us {shared_hit:9.1f} us")
+
+    print(f"\n{'/calculateDate, 1000 requests of':<32} {'uncached':>12} {'cached':>12} {'hits':>8}")
+    dates = [ f"2024-{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 29) ]
+    all_inputs = [ { "date" : date, "weeks" : weeks } for date in dates for weeks in range(10) ]
+    for distinct in [ 10, 100, 1000 ]:
+        inputs = random.sample(all_inputs, distinct)
+        mix = [ random.choice(inputs) for _ in range(1000) ]
+        def run_mix():
+            for data in mix:
+                client.post('/calculateDate', json=data)
+        uncached = measure_uncached("calculate_date", run_mix) / len(mix)
+        cache.clear()
+        run_mix()
+        hits = cache.stats()["hits"] / len(mix)
+        cached = measure(lambda: (cache.clear(), run_mix())) / len(mix) # Each run starts with an empty cache.
+        print(f"{f'{distinct} distinct inputs':<32} {uncached:9.1f} us {cached:9.1f} us {hits:8.0%}")
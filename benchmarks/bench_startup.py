@@ -0,0 +1,87 @@
+"""
+Startup benchmark: time taken to import `App.py` (ie. to boot a worker), measured with `python -X importtime`.
+
+Each configuration is measured in fresh processes, and the median of the runs is reported:
+1. The API documentation loaded at startup (`eager`) vs. on its first request (`lazy`) vs. `disabled`.
+2. With and without the request metrics (which import `prometheus_client`).
+Also reports the slowest top-level imports of the default configuration.
+
+To track the boot time over time, pass a CSV file as the argument:
+a row with the date, the git revision and the median of each configuration is appended to it.
+
+Usage (at the root directory of this project):
+    python -m benchmarks.bench_startup [results.csv]
+"""
+import csv
+import os
+import re
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+runs = 9
+configurations = [
+    ("api doc eager, metrics on", { "API_DOC_MODE" : "eager", "METRICS_ENABLED" : "true" }),
+    ("api doc lazy, metrics on", { "API_DOC_MODE" : "lazy", "METRICS_ENABLED" : "true" }),
+    ("api doc lazy, metrics off", { "API_DOC_MODE" : "lazy", "METRICS_ENABLED" : "false" }),
+    ("api doc disabled, metrics off", { "API_DOC_MODE" : "disabled", "METRICS_ENABLED" : "false" })
+]
+importtime_line = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+def import_app(env: dict) -> list:
+    """
+    Imports `App.py` in a new process, and returns its `-X importtime` lines as (self us, cumulative us, depth, module).
+    The app's own start-up work (eg. loading the API documentation in `eager` mode) is counted in the self time of `App`.
+    """
+    result = subprocess.run([ sys.executable, "-X", "importtime", "-c", "import App" ],
+                            env=dict(os.environ, LOG_LEVEL="WARNING", **env), capture_output=True, text=True, check=True)
+    lines = []
+    for match in importtime_line.finditer(result.stderr):
+        lines.append((int(match[1]), int(match[2]), len(match[3]) // 2, match[4]))
+    return lines
+
+def measure(env: dict) -> float:
+    """
+    Returns the median time (ms) to import `App.py`.
+    """
+    import_app(env) # Warms up the bytecode cache.
+    return statistics.median(
+        next(cumulative for _, cumulative, _, module in import_app(env) if module == "App") / 1000
+        for _ in range(runs))
+
+def get_revision() -> str:
+    try:
+        return subprocess.run([ "git", "rev-parse", "--short", "HEAD" ], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+if __name__ == "__main__":
+    results = {}
+    for label, env in configurations:
+        results[label] = measure(env)
+        print(f"{label:<32} {results[label]:8.1f} ms")
+
+    print("\nSlowest top-level imports of App (api doc lazy, metrics on):")
+    lines = import_app(configurations[1][1])
+    top_level = []
+    for _, cumulative, depth, module in lines:
+        if depth == 0:
+            if module == "App":
+                break
+            top_level = [] # The imports of an earlier top-level module, eg. `site`.
+        elif depth == 1:
+            top_level.append((cumulative, module))
+    for cumulative, module in sorted(top_level, reverse=True)[:8]:
+        print(f"  {module:<30} {cumulative / 1000:8.1f} ms")
+
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+        new_file = not os.path.exists(path)
+        with open(path, "a", newline="") as results_file:
+            writer = csv.writer(results_file)
+            if new_file:
+                writer.writerow([ "date", "revision" ] + [ label for label, _ in configurations ])
+            writer.writerow([ datetime.now(timezone.utc).isoformat(timespec="seconds"), get_revision() ]
+                            + [ f"{results[label]:.1f}" for label, _ in configurations ])
+        print(f"\nAppended the results to {path}")
@@ -0,0 +1,52 @@
+"""
+Micro-benchmark: throughput of `/timestwo`, with and without the per-request HTTP overhead.
+
+Measures the integers multiplied per second:
+1. One form request per integer (the single mode), through the Flask test client.
+2. One batch request of 100,000 integers, as a JSON array and as packed binary, through the Flask test client.
+3. The compute path alone (`IntegerBatch`), without HTTP.
+
+Usage (at the root directory of this project):
+    python -m benchmarks.bench_timestwo
+"""
+import os
+import random
+import struct
+import timeit
+
+os.environ["LOG_LEVEL"] = "WARNING" # Keeps the per-request debug logging out of the measurements.
+from App import application
+from integer_batch import IntegerBatch
+
+size = 100000
+random.seed(1)
+nums = [ random.randrange(-2 ** 40, 2 ** 40) for _ in range(size) ]
+big_nums = [ num << 64 for num in nums ]
+packed = struct.pack(f"<{size}q", *nums)
+client = application.test_client()
+
+def run_single():
+    return client.post('/timestwo', data={ "num" : nums[0] })
+
+def run_json():
+    return client.post('/timestwo', json=nums)
+
+def run_packed():
+    return client.post('/timestwo', data=packed, content_type="application/octet-stream")
+
+def measure(run, count: int) -> float:
+    number, seconds = timeit.Timer(run).autorange()
+    return count * number / seconds
+
+if __name__ == "__main__":
+    assert run_json().get_json() == [ num * 2 for num in nums ]
+    print(f"{'':<36} {'integers/s':>14}")
+    for label, run, count in [
+        ("HTTP, one form request each", run_single, 1),
+        ("HTTP, JSON array batch", run_json, size),
+        ("HTTP, packed int64 batch", run_packed, size),
+        ("compute, JSON array (int64)", lambda: IntegerBatch.double(nums), size),
+        ("compute, JSON array (big ints)", lambda: IntegerBatch.double(big_nums), size),
+        ("compute, packed int64", lambda: IntegerBatch.double_packed(packed), size)
+    ]:
+        print(f"{label:<36} {measure(run, count):14,.0f}")
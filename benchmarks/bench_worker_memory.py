@@ -0,0 +1,114 @@
+"""
+Memory benchmark: worker roster held as dicts (`json.load`) vs. `WorkerColumns` vs. a whole `WorkerRoster.Snapshot`.
+
+Generates a synthetic worker data file and measures, with `tracemalloc`,
+the memory retained by the loaded roster and the peak memory while loading it.
+A snapshot holds the indexes of the roster besides its columns: the day-mask index, the bitmaps of `WorkerIndex`,
+the age prefix bitmaps (`younger_than`) and the sort orders and ranks. Their sizes are listed one by one.
+The snapshot of the compiled binary file (`WorkerBinary`) is measured too:
+its memory-mapped sections are not allocated by Python, and are not included.
+
+Usage (at the root directory of this project):
+    python -m benchmarks.bench_worker_memory [rows]
+"""
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from worker_binary import WorkerBinary
+from worker_columns import WorkerColumns
+from worker_roster import WorkerRoster
+
+first_names = [ "Tai Man", "Siu Ling", "Ka Ho", "Wing Yan", "Chi Keung", "Mei Ling", "Kwok Wai", "Hoi Yee" ]
+last_names = [ "Chan", "Ma", "Cheung", "Lee", "Wong", "Ho", "Lau", "Ng" ]
+
+def write_data_file(path: str, rows: int):
+    """
+    Writes a synthetic worker data file.
+    """
+    rng = random.Random(42)
+    with open(path, "w", encoding="utf8") as data_file:
+        data_file.write('{ "workers" : [\n')
+        for i in range(rows):
+            worker = {
+                "name" : f"{rng.choice(last_names)} {rng.choice(first_names)} {i}",
+                "sex" : rng.choice("MF"),
+                "is_reg_member" : rng.random() < 0.5,
+                "age" : rng.randint(18, 65),
+                "work_days" : [ day for day in WorkerColumns.days_of_week if rng.random() < 0.5 ]
+            }
+            data_file.write(("" if i == 0 else ",\n") + json.dumps(worker))
+        data_file.write("\n] }\n")
+
+def load_dicts(path: str):
+    with open(path, encoding="utf8") as data_file:
+        return json.load(data_file)
+
+def load_columns(path: str):
+    with open(path, encoding="utf8") as data_file:
+        return WorkerColumns.from_workers(WorkerRoster.iter_workers(data_file))
+
+def load_snapshot(path: str):
+    return WorkerRoster.Snapshot(None, load_columns(path))
+
+def load_compiled_snapshot(path: str):
+    return WorkerRoster.Snapshot(None, WorkerBinary.load(path))
+
+def get_size(value) -> int:
+    """
+    Returns the size of an index: a bitmap, an array, or a list or dict of them (with the dict keys left out).
+    """
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(get_size(item) for item in value.values())
+    if isinstance(value, list):
+        return sys.getsizeof(value) + sum(get_size(item) for item in value)
+    return sys.getsizeof(value)
+
+def measure(label: str, load, path: str):
+    """
+    Loads the data file and prints the retained and peak memory. Returns the loaded roster.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    roster = load(path)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<16} retained: {retained / 2**20:9.1f} MiB   peak: {peak / 2**20:9.1f} MiB   load time: {elapsed:6.2f} s")
+    return roster
+
+def print_indexes(snapshot: WorkerRoster.Snapshot):
+    """
+    Prints the size of each index of a snapshot.
+    """
+    query_index = snapshot.query_index
+    for label, index in [ ("day-mask index", snapshot.index),
+                          *((f"bitmaps: {column}", query_index.bitmaps[column]) for column in query_index.bitmaps),
+                          ("younger_than", query_index.younger_than),
+                          ("sort orders", query_index.sort_orders),
+                          ("sort ranks", query_index.sort_ranks) ]:
+        print(f"  {label:<22} {get_size(index) / 2**20:9.1f} MiB")
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "worker_list.json")
+        write_data_file(path, rows)
+        print(f"Rows: {rows:,}   data file: {os.path.getsize(path) / 2**20:.1f} MiB")
+        measure("dicts", load_dicts, path)
+        measure("WorkerColumns", load_columns, path)
+        snapshot = measure("Snapshot", load_snapshot, path)
+        print_indexes(snapshot)
+
+        binary_path = os.path.join(tempdir, "worker_list.bin")
+        WorkerBinary.compile(snapshot.columns, binary_path)
+        del snapshot
+        print(f"Compiled file: {os.path.getsize(binary_path) / 2**20:.1f} MiB")
+        snapshot = measure("Snapshot (.bin)", load_compiled_snapshot, binary_path)
+        del snapshot
@@ -0,0 +1,48 @@
+"""
+Query benchmark: worker store backends "file" (`WorkerRoster`) vs. "postgres" (`PostgresWorkerStore`).
+
+Generates a synthetic worker list, loads it into both backends, and times the same queries against each.
+The table `workers` of the database is replaced.
+
+Usage (at the root directory of this project):
+    python -m benchmarks.bench_worker_store <database connection string> [rows]
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+from benchmarks.bench_worker_memory import write_data_file
+from worker_columns import WorkerColumns
+from worker_query import WorkerQuery
+from worker_roster import WorkerRoster
+from worker_store import PostgresWorkerStore
+
+queries = {
+    "all workers" : WorkerQuery(),
+    "work_days=[MONDAY, FRIDAY]" : WorkerQuery(WorkerColumns.encode_days([ "MONDAY", "FRIDAY" ])),
+    "age 30-40, F, member" : WorkerQuery(age_min=30, age_max=40, sex="F", is_reg_member=True),
+    "work_days=[SUNDAY], sort by age desc" : WorkerQuery(WorkerColumns.encode_days([ "SUNDAY" ]), sort_by="age", order="desc")
+}
+
+if __name__ == "__main__":
+    dsn = sys.argv[1]
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "worker_list.json")
+        write_data_file(path, rows)
+        roster = WorkerRoster(path)
+        roster.get_snapshot()
+        with open(path, encoding="utf8") as data_file:
+            store = PostgresWorkerStore(dsn)
+            store.import_workers(WorkerColumns.from_workers(WorkerRoster.iter_workers(data_file)))
+
+        print(f"Rows: {rows:,}. Average time per query, materializing all workers found:")
+        for label, query in queries.items():
+            results = {}
+            for backend, snapshot_of in [ ("file", roster.get_snapshot), ("postgres", store.get_snapshot) ]:
+                number = 5
+                seconds = timeit.timeit(lambda: list(snapshot_of().find_workers(query)), number=number) / number
+                results[backend] = seconds
+            found = len(roster.get_snapshot().find_workers(query))
+            print(f"{label:<40} ({found:>7,} found)   file: {results['file'] * 1000:8.2f} ms   postgres: {results['postgres'] * 1000:8.2f} ms")
@@ -0,0 +1,68 @@
+"""
+Load test: concurrent requests to an endpoint with a simulated delay, under WSGI vs. ASGI serving.
+
+Starts the app with `SIM_DELAY_HONBASHO_SCHEDULE` set (1 second by default) under:
+1. gunicorn with sync workers (`App:application`), where each delayed request holds a worker while it waits.
+2. uvicorn (`asgi:application`), where the delay is awaited by the event loop.
+Then sends a burst of concurrent requests to `/getSumoHonbashoSchedule` to each server
+and reports the time until all of them are answered.
+
+Usage (at the root directory of this project):
+    python -m benchmarks.load_delayed_requests [concurrent requests] [gunicorn workers]
+"""
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+delay = 1
+requests = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+workers = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+
+def get_free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_server(command: list, port: int) -> subprocess.Popen:
+    env = dict(os.environ, SIM_DELAY_HONBASHO_SCHEDULE=str(delay), LOG_LEVEL="WARNING")
+    server = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/healthcheck", timeout=1)
+            return server
+        except OSError:
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError(f"Server did not start: {' '.join(command)}")
+
+def run_burst(port: int) -> float:
+    url = f"http://127.0.0.1:{port}/getSumoHonbashoSchedule?year=2024"
+    def get(_):
+        with urllib.request.urlopen(url, timeout=requests * delay + 30) as response:
+            assert response.status == 200
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=requests) as executor:
+        list(executor.map(get, range(requests)))
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    servers = [
+        (f"gunicorn, {workers} sync workers", lambda port: [ sys.executable, "-m", "gunicorn", "App:application",
+                                                            f"--bind=127.0.0.1:{port}", f"--workers={workers}",
+                                                            f"--timeout={requests * delay + 30}" ]),
+        ("uvicorn (ASGI)", lambda port: [ sys.executable, "-m", "uvicorn", "asgi:application",
+                                          "--host=127.0.0.1", f"--port={port}", "--log-level=warning" ])
+    ]
+    print(f"{requests} concurrent requests, {delay} second simulated delay each:")
+    for label, command in servers:
+        port = get_free_port()
+        server = start_server(command(port), port)
+        try:
+            print(f"{label:<28} {run_burst(port):6.2f} s")
+        finally:
+            server.terminate()
+            server.wait()
@@ -0,0 +1,117 @@
+from datetime import date
+from date_codec import DateCodec
+
+class DateCalculator():
+    """
+    Calculates dates a number of weeks before/after given dates, in batches.
+
+    1. All the items of a batch are validated up front.
+    An invalid item gets its own error, and does not fail the other items.
+    2. Each distinct date string is parsed once per batch.
+    3. The dates are calculated as date ordinals (see `date.toordinal()`),
+    with NumPy in one vectorized operation if it is installed and the batch is large enough.
+    """
+
+    min_ordinal = date.min.toordinal()
+    max_ordinal = date.max.toordinal()
+    max_weeks = (max_ordinal - min_ordinal) // 7 # Any more weeks than this are out of range from every date.
+    epoch_ordinal = date(1970, 1, 1).toordinal() # Day 0 of NumPy `datetime64[D]`.
+    vectorize_min_size = 64 # Batches smaller than this are calculated without NumPy.
+
+    def add_weeks(dates: list, weeks: list) -> list:
+        """
+        Calculates the date a number of weeks before/after each of a batch of dates.
+
+        Returns one item per input pair, in input order:
+        the calculated date as a string in YYYY-MM-DD format, or a `ValueError` with the error message if the pair is invalid.
+
+        :param dates: The dates, as strings in YYYY-MM-DD format. `None` if the date of a pair is missing.
+        :param weeks: The number of weeks (negative for past dates) of each date. `None` if missing.
+        """
+
+        results = [ None ] * len(dates)
+        parsed = {}
+        positions = []
+        ordinals = []
+        offsets = []
+        for i, (value, num_of_weeks) in enumerate(zip(dates, weeks)):
+            if value is None:
+                results[i] = ValueError("'date' is missing from request!")
+                continue
+            ordinal = parsed.get(value) if isinstance(value, str) else None
+            if ordinal is None:
+                ordinal = DateCalculator.parse_ordinal(value)
+                if isinstance(value, str):
+                    parsed[value] = ordinal
+            if isinstance(ordinal, ValueError):
+                results[i] = ordinal
+            elif num_of_weeks is None:
+                results[i] = ValueError("'weeks' is missing from request!")
+            elif not isinstance(num_of_weeks, int):
+                results[i] = ValueError("'weeks' must be an integer!")
+            elif abs(num_of_weeks) > DateCalculator.max_weeks:
+                results[i] = ValueError("The calculated date is out of range!")
+            else:
+                positions.append(i)
+                ordinals.append(ordinal)
+                offsets.append(num_of_weeks * 7)
+
+        calculated = None
+        if len(positions) >= DateCalculator.vectorize_min_size:
+            try:
+                calculated = DateCalculator.add_days_vectorized(ordinals, offsets)
+            except ImportError:
+                pass
+        if calculated is None:
+            calculated = list(map(DateCalculator.add_days, ordinals, offsets))
+        for i, result in zip(positions, calculated):
+            results[i] = result
+        return results
+
+    def parse_ordinal(value):
+        """
+        Parses a date string in YYYY-MM-DD format into a date ordinal.
+        Returns a `ValueError` with the error message if the value is not such a date.
+
+        :param value: The date string.
+        """
+
+        try:
+            return DateCodec.parse(value).toordinal()
+        except (TypeError, ValueError):
+            return ValueError("'date' must be in YYYY-MM-DD format!")
+
+    def add_days(ordinal: int, days: int):
+        """
+        Calculates the date a number of days after a date ordinal, as a string in YYYY-MM-DD format.
+        Returns a `ValueError` if the calculated date is out of range.
+
+        :param ordinal: The date ordinal.
+        :param days: The number of days.
+        """
+
+        ordinal += days
+        if not DateCalculator.min_ordinal <= ordinal <= DateCalculator.max_ordinal:
+            return ValueError("The calculated date is out of range!")
+        return DateCodec.format(date.fromordinal(ordinal))
+
+    def add_days_vectorized(ordinals: list, days: list) -> list:
+        """
+        Same as calling `add_days()` on each pair of a batch, in one vectorized operation with NumPy.
+
+        Raises `ImportError` if NumPy is not installed.
+
+        :param ordinals: The date ordinals.
+        :param days: The number of days of each date ordinal.
+        """
+
+        import numpy
+
+        calculated = numpy.array(ordinals, dtype="int64") + numpy.array(days, dtype="int64")
+        in_range = (calculated >= DateCalculator.min_ordinal) & (calculated <= DateCalculator.max_ordinal)
+        formatted = numpy.where(in_range, calculated, DateCalculator.epoch_ordinal) - DateCalculator.epoch_ordinal
+        results = formatted.astype("datetime64[D]").astype("U10").tolist()
+        if not in_range.all():
+            for i in numpy.flatnonzero(~in_range).tolist():
+                results[i] = ValueError("The calculated date is out of range!")
+        return results
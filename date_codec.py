@@ -0,0 +1,40 @@
+from datetime import date, datetime
+
+class DateCodec():
+    """
+    Parses and formats the dates of request and response data, in YYYY-MM-DD format.
+
+    `datetime.strptime()` and `strftime()` go through the locale-aware `time` formatting machinery,
+    which is slow for a fixed format. Instead:
+    1. A 10-character ASCII string is parsed by `date.fromisoformat()`.
+    Any other string, or one that `date.fromisoformat()` rejects, falls back to `datetime.strptime()`,
+    so that exactly the same strings are accepted (eg. "2024-5-7") and rejected as before.
+    2. Dates are formatted by `date.isoformat()`, which always zero-pads the year to 4 digits.
+    """
+
+    date_format = "%Y-%m-%d"
+
+    def parse(value: str) -> date:
+        """
+        Parses a date string in YYYY-MM-DD format.
+
+        Raises `ValueError` if the string is not such a date, and `TypeError` if it is not a string.
+
+        :param value: The date string.
+        """
+
+        if isinstance(value, str) and len(value) == 10 and value.isascii() and value[4] == "-" and value[7] == "-":
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                pass
+        return datetime.strptime(value, DateCodec.date_format).date()
+
+    def format(day: date) -> str:
+        """
+        Formats a date in YYYY-MM-DD format.
+
+        :param day: The date.
+        """
+
+        return day.isoformat()
@@ -1,3 +1,5 @@
+import asyncio
+import contextvars
 import os
 import time
 import logging
@@ -13,16 +15,33 @@ class DevtestHelper():
     mock_delay_times = {
         'HONBASHO_SCHEDULE':  int(os.environ.get('SIM_DELAY_HONBASHO_SCHEDULE', 0))
     }
+    # Set when the delay of the current request has already been simulated by `simulate_delay_async()`.
+    delay_simulated = contextvars.ContextVar('delay_simulated', default=False)
 
     def simulate_delay(key: str):
         '''
         Simulates a delayed webservice response for the time (in seconds) configured by
         environment variable `SIM_DELAY_<key>`.
 
-        Simulation is performed only if the delay time is configured.
+        Simulation is performed only if the delay time is configured,
+        and has not already been performed by `simulate_delay_async()` for the current request.
         '''
         mock_delay_time = DevtestHelper.mock_delay_times[key]
-        if mock_delay_time > 0:
-            logging.info(f'[simulate_delay] Simulating delay: {mock_delay_time} second(s) [{key}]')
+        if mock_delay_time > 0 and not DevtestHelper.delay_simulated.get():
+            logging.info('[simulate_delay] Simulating delay: %s second(s) [%s]', mock_delay_time, key)
             time.sleep(mock_delay_time)
-            logging.info(f'[simulate_delay] Delay simulation end [{key}]')
\ No newline at end of file
+            logging.info('[simulate_delay] Delay simulation end [%s]', key)
+
+    async def simulate_delay_async(key: str):
+        '''
+        Same as `simulate_delay()`, but waits with `asyncio.sleep()` so that the event loop keeps serving other requests.
+
+        Marks the delay as simulated in the current context,
+        so that `simulate_delay()` does not delay the same request again.
+        '''
+        mock_delay_time = DevtestHelper.mock_delay_times[key]
+        if mock_delay_time > 0:
+            logging.info('[simulate_delay_async] Simulating delay: %s second(s) [%s]', mock_delay_time, key)
+            await asyncio.sleep(mock_delay_time)
+            logging.info('[simulate_delay_async] Delay simulation end [%s]', key)
+        DevtestHelper.delay_simulated.set(True)
@@ -1,9 +1,13 @@
 from flask import Flask
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener
 
+import atexit
 import configparser
 from dotenv import load_dotenv
+import logging
 import os
+import queue
 
 
 def create_app():
@@ -18,8 +22,75 @@ def create_app():
 
     log_level = os.environ.get('LOG_LEVEL', config['Logging'].get('log_level'))
     log_format = config['Logging'].get('format')
+    log_queue = os.environ.get('LOG_QUEUE', config['Logging'].get('queue')).lower() == 'true'
 
-    dictConfig({
+    dictConfig(get_logging_config(log_level, log_format))
+    if log_queue:
+        start_queue_logging()
+    
+    app = Flask(__name__)
+    app.config['WORKER_STORE_BACKEND'] = os.environ.get('WORKER_STORE_BACKEND', config['Workers'].get('backend'))
+    app.config['WORKER_DATA_FILE'] = os.environ.get('WORKER_DATA_FILE', config['Workers'].get('data_file'))
+    app.config['WORKER_DATABASE_URL'] = os.environ.get('WORKER_DATABASE_URL', config['Workers'].get('database_url'))
+    app.config['WORKER_DB_POOL_MIN'] = int(os.environ.get('WORKER_DB_POOL_MIN', config['Workers'].get('db_pool_min')))
+    app.config['WORKER_DB_POOL_MAX'] = int(os.environ.get('WORKER_DB_POOL_MAX', config['Workers'].get('db_pool_max')))
+    app.config['HONBASHO_PRECOMPUTE'] = os.environ.get('HONBASHO_PRECOMPUTE',
+                                                       config['HonbashoCalendar'].get('precompute')).lower() == 'true'
+    app.config['API_DOC_MODE'] = os.environ.get('API_DOC_MODE', config['ApiDoc'].get('mode')).lower()
+    app.config['API_DOC_STATIC_DIR'] = os.environ.get('API_DOC_STATIC_DIR', config['ApiDoc'].get('static_dir')) or None
+    app.config['COMPRESSION_ENABLED'] = os.environ.get('COMPRESSION_ENABLED',
+                                                       config['Compression'].get('enabled')).lower() == 'true'
+    app.config['COMPRESSION_MIN_SIZE'] = int(os.environ.get('COMPRESSION_MIN_SIZE', config['Compression'].get('min_size')))
+    app.config['COMPRESSION_GZIP_LEVEL'] = int(os.environ.get('COMPRESSION_GZIP_LEVEL', config['Compression'].get('gzip_level')))
+    app.config['COMPRESSION_BROTLI_QUALITY'] = int(os.environ.get('COMPRESSION_BROTLI_QUALITY',
+                                                                  config['Compression'].get('brotli_quality')))
+    app.config['JSON_PROVIDER'] = os.environ.get('JSON_PROVIDER', config['JSON'].get('provider')).lower()
+    install_json_provider(app, app.config['JSON_PROVIDER'])
+    app.config['RESPONSE_CACHE_ENABLED'] = os.environ.get('RESPONSE_CACHE_ENABLED',
+                                                          config['ResponseCache'].get('enabled')).lower() == 'true'
+    app.config['RESPONSE_CACHE_BACKEND'] = os.environ.get('RESPONSE_CACHE_BACKEND', config['ResponseCache'].get('backend'))
+    app.config['RESPONSE_CACHE_SHARED_DIR'] = os.environ.get('RESPONSE_CACHE_SHARED_DIR', config['ResponseCache'].get('shared_dir'))
+    app.config['RESPONSE_CACHE_MAX_ENTRIES'] = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES',
+                                                                  config['ResponseCache'].get('max_entries')))
+    app.config['RESPONSE_CACHE_MAX_BYTES'] = int(os.environ.get('RESPONSE_CACHE_MAX_BYTES', config['ResponseCache'].get('max_bytes')))
+    app.config['RESPONSE_CACHE_TTL'] = float(os.environ.get('RESPONSE_CACHE_TTL', config['ResponseCache'].get('ttl')))
+    response_cache_endpoints = os.environ.get('RESPONSE_CACHE_ENDPOINTS', config['ResponseCache'].get('endpoints'))
+    app.config['RESPONSE_CACHE_ENDPOINTS'] = None if response_cache_endpoints.strip() == 'all' \
+        else [ endpoint.strip() for endpoint in response_cache_endpoints.split(',') if endpoint.strip() ]
+    app.config['METRICS_ENABLED'] = os.environ.get('METRICS_ENABLED', config['Metrics'].get('enabled')).lower() == 'true'
+    app.logger.debug('Configurations:-\nLog level: %s\nLog format: %s\nLog queue: %s\nWorker store: %s\nJSON provider: %s',
+                     log_level, log_format, log_queue, app.config["WORKER_STORE_BACKEND"], type(app.json).__name__)
+    return app
+
+def install_json_provider(app: Flask, provider: str):
+    """
+    Installs the JSON provider (`app.json`) of an app, which encodes the responses and decodes `request.json`.
+
+    :param provider: "orjson" for `OrjsonProvider`, "stdlib" for Flask's default provider (stdlib `json`),
+                     or "auto" for `OrjsonProvider` if `orjson` is installed, else the default provider.
+    """
+
+    if provider not in ( "auto", "orjson", "stdlib" ):
+        raise ValueError(f'Invalid JSON provider "{provider}": must be auto, orjson or stdlib.')
+    if provider == "stdlib":
+        return
+    try:
+        from json_provider import OrjsonProvider
+    except ImportError:
+        if provider == "orjson":
+            raise
+        return
+    app.json = OrjsonProvider(app)
+
+def get_logging_config(log_level: str, log_format: str) -> dict:
+    """
+    Returns the logging configuration for `dictConfig()`.
+
+    :param log_level: Level of the root logger, eg. INFO.
+    :param log_format: Format of the log messages.
+    """
+
+    return {
         'version': 1,
         'formatters': {'default': {
             'format': log_format,
@@ -33,9 +104,46 @@ def create_app():
             'level': log_level,
             'handlers': ['wsgi']
         }
-    })
-    
-    app = Flask(__name__)
-    app.logger.debug(os.environ)
-    app.logger.debug(f'Configurations:-\nLog level: {log_level}\nLog format: {log_format}')
-    return app
\ No newline at end of file
+    }
+
+queue_listener = None
+
+def start_queue_logging():
+    """
+    Moves the handlers of the root logger behind a queue, so that logging a message only puts it on the queue,
+    and the handlers write it out in the thread of a `QueueListener`.
+
+    The listener is restarted in a forked process (eg. a gunicorn worker), which does not inherit its thread,
+    and is stopped at exit after writing out the queued messages.
+    """
+
+    global queue_listener
+    stop_queue_logging()
+    root = logging.getLogger()
+    records = queue.SimpleQueue()
+    queue_listener = QueueListener(records, *root.handlers, respect_handler_level=True)
+    root.handlers = [ QueueHandler(records) ]
+    queue_listener.start()
+
+def restart_queue_logging():
+    """
+    Starts a new thread of the `QueueListener`, if any, in a forked process.
+    """
+
+    global queue_listener
+    if queue_listener is not None:
+        queue_listener = QueueListener(queue_listener.queue, *queue_listener.handlers, respect_handler_level=True)
+        queue_listener.start()
+
+def stop_queue_logging():
+    """
+    Stops the `QueueListener`, if any, after it has written out the queued messages.
+    """
+
+    global queue_listener
+    if queue_listener is not None:
+        queue_listener.stop()
+        queue_listener = None
+
+os.register_at_fork(after_in_child=restart_queue_logging)
+atexit.register(stop_queue_logging)
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+The gunicorn configurations, loaded by gunicorn when it is started at the root directory of this project,
+eg. `gunicorn 'App:application'`.
+
+The settings are read from section [Gunicorn] of config.ini,
+and each of them may be overridden by environment variable `GUNICORN_<setting name in upper case>`, eg. `GUNICORN_WORKERS`.
+See <https://docs.gunicorn.org/en/stable/settings.html> for what the settings do.
+"""
+import configparser
+import glob
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+app_config = configparser.ConfigParser()
+app_config.read('config.ini')
+
+def get_setting(name: str) -> str:
+    '''
+    Returns a setting from the environment variable `GUNICORN_<name>`, or from config.ini if it is not set.
+    '''
+    return os.environ.get(f'GUNICORN_{name.upper()}', app_config['Gunicorn'].get(name))
+
+def get_cpu_count() -> int:
+    '''
+    Returns the number of CPUs that this process may run on, which may be less than those of the machine (eg. in a container):
+    the CPUs it is pinned to, or its cgroup CPU quota rounded up, whichever is fewer.
+    '''
+    if hasattr(os, 'sched_getaffinity'):
+        count = len(os.sched_getaffinity(0))
+    else:
+        count = os.cpu_count() or 1
+    limit = get_cgroup_cpu_limit()
+    return min(count, limit) if limit is not None else count
+
+def get_cgroup_cpu_limit(cgroup_dir: str = '/sys/fs/cgroup') -> int:
+    '''
+    Returns the CPU quota of the cgroup of this process (eg. `docker run --cpus`) rounded up to whole CPUs,
+    or `None` if it has none: `cpu.max` of cgroup v2, or `cpu.cfs_quota_us`/`cpu.cfs_period_us` of cgroup v1.
+    '''
+    try:
+        with open(os.path.join(cgroup_dir, 'cpu.max')) as limit_file:
+            quota, period = limit_file.read().split()[:2]
+        if quota == 'max':
+            return None
+        return max(-(-int(quota) // int(period)), 1)
+    except (OSError, ValueError):
+        pass
+    for cpu_dir in ( 'cpu', 'cpu,cpuacct' ):
+        try:
+            with open(os.path.join(cgroup_dir, cpu_dir, 'cpu.cfs_quota_us')) as quota_file, \
+                    open(os.path.join(cgroup_dir, cpu_dir, 'cpu.cfs_period_us')) as period_file:
+                quota, period = int(quota_file.read()), int(period_file.read())
+        except (OSError, ValueError):
+            continue
+        return max(-(-quota // period), 1) if quota > 0 else None
+    return None
+
+bind = get_setting('bind')
+workers = get_cpu_count() * 2 + 1 if get_setting('workers') == 'auto' else int(get_setting('workers'))
+worker_class = get_setting('worker_class')
+threads = int(get_setting('threads'))
+worker_connections = int(get_setting('worker_connections'))
+preload_app = get_setting('preload_app').lower() == 'true'
+keepalive = int(get_setting('keepalive'))
+timeout = int(get_setting('timeout'))
+max_requests = int(get_setting('max_requests'))
+max_requests_jitter = int(get_setting('max_requests_jitter'))
+
+# Must be set before the app (and so `prometheus_client`) is loaded.
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', get_setting('prometheus_multiproc_dir'))
+
+def on_starting(server):
+    '''
+    Creates the metrics directory of `prometheus_client`, or removes the metrics left in it by a previous run.
+    Removes the responses left in the shared directory of the response cache by a previous run too,
+    as they may be outdated by a new version of the app.
+    '''
+    metrics_dir = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    os.makedirs(metrics_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(metrics_dir, '*.db')):
+        os.remove(path)
+
+    cache_dir = os.environ.get('RESPONSE_CACHE_SHARED_DIR', app_config['ResponseCache'].get('shared_dir'))
+    if os.environ.get('RESPONSE_CACHE_BACKEND', app_config['ResponseCache'].get('backend')) == 'shared' \
+            and os.path.isdir(cache_dir):
+        for filename in os.listdir(cache_dir):
+            os.remove(os.path.join(cache_dir, filename))
+
+def when_ready(server):
+    '''
+    With `preload_app`, the app has been loaded in the master process before the workers are forked.
+    Loads the worker roster there too, so that the workers share it copy-on-write
+    rather than each loading its own copy on its first request.
+    '''
+    if preload_app:
+        from App import worker_store
+        worker_store.get_snapshot()
+        server.log.info('Worker store loaded before forking the workers.')
+
+def child_exit(server, worker):
+    '''
+    Removes the in-flight request gauges of an exited worker from the aggregated metrics,
+    and archives its other metrics files, so that the metrics directory does not grow as the workers are restarted.
+    '''
+    from request_metrics import RequestMetrics
+    RequestMetrics.mark_process_dead(worker.pid)
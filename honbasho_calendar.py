@@ -1,5 +1,7 @@
 import calendar
-from datetime import date
+from array import array
+import bisect
+from datetime import date, MAXYEAR
 from enum import Enum
 import logging
 
@@ -10,8 +12,20 @@ class HonbashoCalendar():
     1. 6 (six) tournaments are held every year, in odd-number months.
     2. A tournament starts on the 2nd Sunday of a month and lasts for 15 (fifteen) consecutive days.
     Therefore the last day of a tournament will be on the 4th Sunday of the month.
+
+    Schedules are memoized per year, so repeated lookups of a year are not recalculated.
+    For the supported year range (`min_year` to `max_year`), `precompute()` may also build
+    a compact table of the day-1 date of every tournament, from which the other days are derived.
+    As the table is in chronological order, it is also the index searched by `find_basho()`.
     """
 
+    min_year = 2012
+    max_year = MAXYEAR
+    days = 15
+
+    schedules = {} # Memoized schedules by year.
+    day_one_table = None # Day-1 date ordinals, by (year - min_year) * 6 + tournament index. Built by `precompute()`.
+
     class Basho(Enum):
         """
         The tournaments in a year.
@@ -49,31 +63,182 @@ class HonbashoCalendar():
         """
         Determines the tournament schedule for a given year.
 
+        The schedule is calculated on the first call for each year and memoized.
+        The returned list is shared by all callers and must not be modified.
+
         :param year: The specified year.
         """
 
-        schedule = []
-        for basho in HonbashoCalendar.Basho:
-            schedule.append({
-                "basho" : basho,
-                "dates" : HonbashoCalendar.get_dates(year, basho)
-            })
-        logging.debug(f"Schedule for year {year}:\n{schedule}")
+        schedule = HonbashoCalendar.schedules.get(year)
+        if schedule is None:
+            schedule = []
+            for basho in HonbashoCalendar.Basho:
+                schedule.append({
+                    "basho" : basho,
+                    "dates" : HonbashoCalendar.get_dates(year, basho)
+                })
+            logging.debug("Schedule for year %d:\n%s", year, schedule)
+            HonbashoCalendar.schedules[year] = schedule
         return schedule
-    
+
+    def calculate_schedule_range(from_year: int, to_year: int) -> list:
+        """
+        Determines the tournament schedules of a span of years, in the same format as `calculate_schedule()`.
+
+        The years not memoized yet are calculated in one batch by `calculate_schedules()` if NumPy is installed,
+        and then memoized.
+
+        :param from_year: The first year, inclusive.
+        :param to_year: The last year, inclusive.
+        """
+
+        years = range(from_year, to_year + 1)
+        missing = [ year for year in years if year not in HonbashoCalendar.schedules ]
+        if len(missing) > 1 and HonbashoCalendar.day_one_table is None:
+            try:
+                dates = HonbashoCalendar.calculate_schedules(missing[0], missing[-1]).tolist()
+            except ImportError:
+                dates = None
+            if dates is not None:
+                for year in missing:
+                    HonbashoCalendar.schedules[year] = [
+                        { "basho" : basho, "dates" : basho_dates }
+                        for basho, basho_dates in zip(HonbashoCalendar.Basho, dates[year - missing[0]])
+                    ]
+        return [ HonbashoCalendar.calculate_schedule(year) for year in years ]
+
+    def precompute():
+        """
+        Builds the table of the day-1 dates of all the tournaments in the supported year range,
+        which `get_dates()` uses from then on.
+
+        The table holds one integer (date ordinal) per tournament, ie. about 190 KB for 2012 to 9999.
+        """
+
+        if HonbashoCalendar.day_one_table is None:
+            table = array("i")
+            for year in range(HonbashoCalendar.min_year, HonbashoCalendar.max_year + 1):
+                for basho in HonbashoCalendar.Basho:
+                    table.append(HonbashoCalendar.get_day_one_ordinal(year, basho))
+            HonbashoCalendar.day_one_table = table
+            logging.info("Precomputed the day-1 dates of %d tournaments.", len(table))
+
+    def find_basho(day: date) -> dict:
+        """
+        Finds the tournament held on a date, and the next tournament after it.
+
+        Returns a dict with:
+        1. `current`: The tournament held on the date, as a dict with `year`, `basho`, `day_one` (date of day 1)
+        and `day` (day number, 1 to 15); `None` if there is no tournament on the date.
+        2. `next`: The next tournament starting after the date, as a dict with `year`, `basho` and `day_one`;
+        `None` if it would be after `max_year`.
+
+        Only the tournaments from `min_year` are indexed, so no date before that has a current tournament.
+
+        The precomputed day-1 table (see `precompute()`, called if not done yet) is binary-searched,
+        so each lookup takes O(log n) time.
+
+        :param day: The date.
+        """
+
+        HonbashoCalendar.precompute()
+        table = HonbashoCalendar.day_one_table
+        ordinal = day.toordinal()
+        index = bisect.bisect_right(table, ordinal) - 1
+        current = None
+        if index >= 0 and ordinal < table[index] + HonbashoCalendar.days:
+            current = HonbashoCalendar.get_table_entry(index)
+            current["day"] = ordinal - table[index] + 1
+        return {
+            "current" : current,
+            "next" : HonbashoCalendar.get_table_entry(index + 1) if index + 1 < len(table) else None
+        }
+
+    def find_bashos(days) -> list:
+        """
+        Finds the current and next tournaments of each of a batch of dates. See `find_basho()`.
+
+        :param days: Iterable of the dates.
+        """
+
+        return [ HonbashoCalendar.find_basho(day) for day in days ]
+
+    def get_table_entry(index: int) -> dict:
+        """
+        Returns the tournament at an index of the precomputed day-1 table,
+        as a dict with `year`, `basho` and `day_one`.
+
+        :param index: The index.
+        """
+
+        year, basho_index = divmod(index, 6)
+        return {
+            "year" : HonbashoCalendar.min_year + year,
+            "basho" : HonbashoCalendar.bashos[basho_index],
+            "day_one" : date.fromordinal(HonbashoCalendar.day_one_table[index])
+        }
+
     def get_dates(year: int, basho: Basho) -> list:
         """
         Gets the tournament dates (in chronical order) of a specific tournament in a given year.
 
+        If `precompute()` has been called and the year is in the supported range,
+        the dates are derived from the precomputed day-1 date.
+
+        :param year: The specified year.
+        :param basho: The specified tournament.
+        """
+
+        table = HonbashoCalendar.day_one_table
+        if table is not None and HonbashoCalendar.min_year <= year <= HonbashoCalendar.max_year:
+            day_one = table[(year - HonbashoCalendar.min_year) * 6 + basho.value // 2]
+            return list(map(date.fromordinal, range(day_one, day_one + HonbashoCalendar.days)))
+        return HonbashoCalendar.calculate_dates(year, basho)
+
+    def calculate_dates(year: int, basho: Basho) -> list:
+        """
+        Calculates the tournament dates (in chronical order) of a specific tournament in a given year.
+
+        :param year: The specified year.
+        :param basho: The specified tournament.
+        """
+
+        day_one = HonbashoCalendar.get_day_one_ordinal(year, basho)
+        return list(map(date.fromordinal, range(day_one, day_one + HonbashoCalendar.days)))
+
+    def get_day_one_ordinal(year: int, basho: Basho) -> int:
+        """
+        Calculates the date ordinal (see `date.toordinal()`) of day 1 of a specific tournament in a given year,
+        ie. the 2nd Sunday of the month.
+
         :param year: The specified year.
         :param basho: The specified tournament.
         """
 
-        month = basho.value
+        first_of_month = date(year, basho.value, 1)
+        days_to_first_sunday = (calendar.SUNDAY - first_of_month.weekday()) % 7
+        return first_of_month.toordinal() + days_to_first_sunday + 7
+
+    def calculate_schedules(from_year: int, to_year: int):
+        """
+        Calculates the dates of all the tournaments of a span of years at once, with NumPy.
+
+        Returns a `numpy.ndarray` of `datetime64[D]` with shape (number of years, 6, 15),
+        ie. the dates of each tournament (in `Basho` order) of each year.
+
+        Raises `ImportError` if NumPy is not installed.
+
+        :param from_year: The first year, inclusive.
+        :param to_year: The last year, inclusive.
+        """
+
+        import numpy
+
+        years = numpy.arange(from_year, to_year + 1)
+        months = numpy.array([ basho.value for basho in HonbashoCalendar.Basho ])
+        first_of_month = ((years[:, None] - 1970) * 12 + (months[None, :] - 1)).astype("datetime64[M]").astype("datetime64[D]")
+        weekday = (first_of_month.astype("int64") + 3) % 7 # 1970-01-01 was a Thursday (3).
+        day_one = first_of_month + (calendar.SUNDAY - weekday) % 7 + 7
+        return day_one[:, :, None] + numpy.arange(HonbashoCalendar.days)
 
-        cal = calendar.monthcalendar(year, month)
-        dates = [ date(year, month, cal[1][calendar.SUNDAY]) ] # Day 1 = 2nd Sunday of the month
-        for w in range(2, 4):
-            for day in cal[w]:
-                dates.append(date(year, month, day))
-        return dates
\ No newline at end of file
+HonbashoCalendar.bashos = list(HonbashoCalendar.Basho) # The tournaments in `Basho` order, by index.
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta, timezone
+import hashlib
+from honbasho_calendar import HonbashoCalendar
+
+class HonbashoICalendar():
+    """
+    Renders the Ozumo Honbasho (Grand Sumo Tournament) schedule of a year as an iCalendar (.ics) feed.
+
+    1. Each tournament is an all-day event from day 1 to day 15.
+    2. The feed of each year is rendered once and cached as bytes, together with its ETag.
+    3. The output depends only on the year, so that all processes produce the same bytes and ETag.
+    """
+
+    mimetype = "text/calendar"
+    product_id = "-//cc-wong//python-webservice-demo//EN"
+    uid_domain = "python-webservice-demo"
+    # When the rendered output last changed, ie. the Last-Modified time of every feed
+    # (and the DTSTAMP of every event). Must be updated whenever the output changes.
+    last_modified = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+    feeds = {} # Cached feeds by year, as (body, etag).
+
+    def get_feed(year: int) -> tuple:
+        """
+        Returns the iCalendar feed of a year and its strong ETag, as a tuple `(body, etag)`.
+        The feed is rendered on the first call for each year only.
+
+        :param year: The specified year.
+        """
+
+        feed = HonbashoICalendar.feeds.get(year)
+        if feed is None:
+            body = HonbashoICalendar.render(year)
+            feed = (body, hashlib.sha1(body).hexdigest())
+            HonbashoICalendar.feeds[year] = feed
+        return feed
+
+    def render(year: int) -> bytes:
+        """
+        Renders the iCalendar feed of a year.
+
+        :param year: The specified year.
+        """
+
+        timestamp = HonbashoICalendar.last_modified.strftime("%Y%m%dT%H%M%SZ")
+        lines = [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{HonbashoICalendar.product_id}",
+            "CALSCALE:GREGORIAN",
+            f"X-WR-CALNAME:Grand Sumo Tournaments {year}"
+        ]
+        for basho in HonbashoCalendar.calculate_schedule(year):
+            label = basho["basho"]
+            dates = basho["dates"]
+            lines += [
+                "BEGIN:VEVENT",
+                f"UID:{year}-{label.get_name()}@{HonbashoICalendar.uid_domain}",
+                f"DTSTAMP:{timestamp}",
+                f"DTSTART;VALUE=DATE:{dates[0].strftime('%Y%m%d')}",
+                f"DTEND;VALUE=DATE:{(dates[-1] + timedelta(days=1)).strftime('%Y%m%d')}", # Exclusive end date
+                f"SUMMARY:{label.get_name().capitalize()} Basho {year}",
+                f"DESCRIPTION:Grand Sumo Tournament in {label.get_month_name()} {year}\\, {len(dates)} days.",
+                "TRANSP:TRANSPARENT",
+                "END:VEVENT"
+            ]
+        lines.append("END:VCALENDAR")
+        return ("\r\n".join(lines) + "\r\n").encode("utf8")
@@ -0,0 +1,80 @@
+from array import array
+import sys
+
+class IntegerBatch():
+    """
+    Multiplies batches of integers by 2, for the batch mode of `/timestwo`.
+
+    1. If every result fits in a signed 64-bit integer, the batch is multiplied as one NumPy `int64` array
+    (if NumPy is installed).
+    2. Otherwise the batch is multiplied as Python integers, which have arbitrary precision.
+    3. A packed binary batch is a sequence of little-endian signed 64-bit integers,
+    and its results are packed the same way, so it can only hold results that fit in 64 bits.
+    """
+
+    int64_min = -(1 << 63)
+    int64_max = (1 << 63) - 1
+    item_size = 8
+
+    def double(nums: list) -> list:
+        """
+        Multiplies each of a batch of integers by 2.
+
+        :param nums: The integers.
+        """
+
+        try:
+            return IntegerBatch.double_int64(nums)
+        except (ImportError, OverflowError):
+            return [ num * 2 for num in nums ]
+
+    def double_int64(nums: list) -> list:
+        """
+        Multiplies each of a batch of integers by 2 with NumPy.
+
+        Raises `OverflowError` if a result does not fit in a signed 64-bit integer,
+        and `ImportError` if NumPy is not installed.
+
+        :param nums: The integers.
+        """
+
+        import numpy
+
+        values = numpy.fromiter(nums, dtype="int64", count=len(nums))
+        if values.size > 0 and (values.min() < IntegerBatch.int64_min // 2 or values.max() > IntegerBatch.int64_max // 2):
+            raise OverflowError("The results do not fit in 64-bit integers.")
+        return (values * 2).tolist()
+
+    def double_packed(data: bytes) -> bytes:
+        """
+        Multiplies each of a packed binary batch of integers by 2.
+
+        Raises `ValueError` if the data is not a whole number of 64-bit integers,
+        or if a result does not fit in a signed 64-bit integer.
+
+        :param data: The integers, packed as little-endian signed 64-bit integers.
+        """
+
+        if len(data) % IntegerBatch.item_size != 0:
+            raise ValueError("The request data must be a sequence of 64-bit integers.")
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+
+        if numpy is not None:
+            nums = numpy.frombuffer(data, dtype="<i8")
+            if nums.size > 0 and (nums.min() < IntegerBatch.int64_min // 2 or nums.max() > IntegerBatch.int64_max // 2):
+                raise ValueError("The results must fit in 64-bit integers.")
+            return (nums * 2).astype("<i8").tobytes()
+
+        nums = array("q")
+        nums.frombytes(data)
+        if sys.byteorder != "little":
+            nums.byteswap()
+        if nums and (min(nums) < IntegerBatch.int64_min // 2 or max(nums) > IntegerBatch.int64_max // 2):
+            raise ValueError("The results must fit in 64-bit integers.")
+        results = array("q", [ num * 2 for num in nums ])
+        if sys.byteorder != "little":
+            results.byteswap()
+        return results.tobytes()
@@ -0,0 +1,85 @@
+import threading
+import time
+from collections import OrderedDict
+
+class LruCache():
+    """
+    Cached entries of a process, evicted in least recently used order beyond a number of entries or a total size,
+    eg. the cached responses of `ResponseCache` and the encoded bodies of `WorkerRoster.Snapshot`.
+    Thread-safe, for the threads of a gthread worker.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        """
+        :param max_entries: The maximum number of entries.
+        :param max_bytes: The maximum total size (bytes) of the entries.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict() # key -> (entry, expiry time, size), the most recently used last.
+        self.bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns the entry of a key, or `None` if it is not cached or has expired.
+        """
+        with self.lock:
+            item = self.entries.get(key)
+            if item is None:
+                return None
+            entry, expires, size = item
+            if expires is not None and expires <= time.time():
+                del self.entries[key]
+                self.bytes -= size
+                self.expirations += 1
+                return None
+            self.entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry, size: int, expires: float = None):
+        """
+        Caches an entry until the time `expires` (`None` for no expiry),
+        and evicts the least recently used entries beyond the limits.
+        An entry larger than `max_bytes` is not cached.
+
+        :param key: The key, any hashable value.
+        :param entry: The entry.
+        :param size: The size (bytes) of the entry, as counted against `max_bytes`.
+        :param expires: The time (as `time.time()`) at which the entry expires, or `None`.
+        """
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[2]
+            self.entries[key] = ( entry, expires, size )
+            self.bytes += size
+            while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+                self.bytes -= self.entries.popitem(last=False)[1][2]
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Removes all the entries, and resets the counters.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the number and size of the entries, and the eviction and expiration counters.
+        """
+        with self.lock:
+            return {
+                "entries" : len(self.entries),
+                "bytes" : self.bytes,
+                "evictions" : self.evictions,
+                "expirations" : self.expirations
+            }
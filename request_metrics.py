@@ -0,0 +1,127 @@
+import os
+import time
+from flask import Flask, g, request
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, REGISTRY, CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client import multiprocess
+from prometheus_client.mmap_dict import MmapedDict
+
+class RequestMetrics():
+    """
+    Collects request metrics of every endpoint of the app, and exposes them in Prometheus text format.
+
+    1. Request count (by status code), latency and response size histograms, and in-flight requests,
+    labelled by HTTP method and route (eg. "/greeting/<name>") so that the number of label values is bounded.
+    2. The metrics are collected by request hooks of the app, so that no route needs to be changed.
+    3. If environment variable `PROMETHEUS_MULTIPROC_DIR` is set (eg. by `gunicorn.conf.py`),
+    each process writes its metrics to files in that directory, and `/metrics` aggregates those of all the processes.
+
+    The latency of a streamed response is the time until the response starts,
+    and the size of a streamed response without a `Content-Length` is not recorded, as it is unknown until the stream ends.
+    """
+
+    unmatched_route = "<unmatched>" # The route label of requests that match no route, eg. 404.
+    archived_types = ( "counter", "histogram", "summary" ) # Metric types whose files are archived by `mark_process_dead()`.
+
+    requests_total = Counter('http_requests_total', 'Number of requests handled.',
+                             [ 'method', 'route', 'status' ])
+    request_duration = Histogram('http_request_duration_seconds', 'Time taken to handle a request, in seconds.',
+                                 [ 'method', 'route' ],
+                                 buckets=(.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10))
+    response_size = Histogram('http_response_size_bytes', 'Size of a response body, in bytes.',
+                              [ 'method', 'route' ],
+                              buckets=(100, 1000, 10000, 100000, 1000000, 10000000))
+    requests_in_progress = Gauge('http_requests_in_progress', 'Number of requests being handled.',
+                                 [ 'method', 'route' ], multiprocess_mode='livesum')
+
+    def init_app(app: Flask, path: str = '/metrics'):
+        """
+        Adds the request hooks and the metrics endpoint to an app.
+
+        :param app: The app.
+        :param path: Path of the metrics endpoint.
+        """
+        app.before_request(RequestMetrics.before_request)
+        app.after_request(RequestMetrics.after_request)
+        app.teardown_request(RequestMetrics.teardown_request)
+        app.add_url_rule(path, 'metrics', RequestMetrics.metrics)
+
+    def get_route() -> str:
+        """
+        Returns the route label of the current request.
+        """
+        return request.url_rule.rule if request.url_rule is not None else RequestMetrics.unmatched_route
+
+    def before_request():
+        """
+        Starts timing the current request, and counts it as in progress.
+        """
+        g.metrics_start = time.perf_counter()
+        g.metrics_in_progress = RequestMetrics.requests_in_progress.labels(request.method, RequestMetrics.get_route())
+        g.metrics_in_progress.inc()
+
+    def after_request(response):
+        """
+        Records the status code and the body size of the response.
+        """
+        g.metrics_status = response.status_code
+        size = response.content_length
+        if size is None and not response.is_streamed: # Measuring a streamed body would read it all into memory.
+            size = response.calculate_content_length()
+        if size is not None:
+            RequestMetrics.response_size.labels(request.method, RequestMetrics.get_route()).observe(size)
+        return response
+
+    def teardown_request(exception):
+        """
+        Records the count and the latency of the current request, which failed with status 500
+        if no response has been recorded, and counts it as no longer in progress.
+        """
+        start = g.pop('metrics_start', None)
+        if start is None:
+            return
+        route = RequestMetrics.get_route()
+        RequestMetrics.request_duration.labels(request.method, route).observe(time.perf_counter() - start)
+        RequestMetrics.requests_total.labels(request.method, route, str(g.pop('metrics_status', 500))).inc()
+        g.pop('metrics_in_progress').dec()
+
+    def metrics():
+        """
+        Returns the metrics in Prometheus text format,
+        aggregated across all the processes if `PROMETHEUS_MULTIPROC_DIR` is set.
+        """
+        if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        else:
+            registry = REGISTRY
+        try:
+            output = generate_latest(registry)
+        except FileNotFoundError: # The files of an exited process were archived while they were being read.
+            output = generate_latest(registry)
+        return output, 200, { 'Content-Type' : CONTENT_TYPE_LATEST }
+
+    def mark_process_dead(pid: int, path: str = None):
+        """
+        Removes the metrics files of an exited process (eg. a gunicorn worker restarted after `max_requests`),
+        so that the directory does not grow with every restarted process.
+
+        Its in-flight request gauges are dropped (`multiprocess.mark_process_dead()`),
+        and its counters and histograms are added into a file of each type, named "<type>_archive.db",
+        so that the totals of `/metrics` do not change.
+
+        :param pid: The process ID.
+        :param path: The metrics directory, by default `PROMETHEUS_MULTIPROC_DIR`.
+        """
+        path = path or os.environ['PROMETHEUS_MULTIPROC_DIR']
+        multiprocess.mark_process_dead(pid, path)
+        for typ in RequestMetrics.archived_types:
+            filename = os.path.join(path, f"{typ}_{pid}.db")
+            if not os.path.exists(filename):
+                continue
+            archive = MmapedDict(os.path.join(path, f"{typ}_archive.db"))
+            try:
+                for key, value, timestamp, _ in MmapedDict.read_all_values_from_file(filename):
+                    archive.write_value(key, archive.read_value(key)[0] + value, timestamp)
+            finally:
+                archive.close()
+            os.remove(filename)
@@ -0,0 +1,363 @@
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from flask import current_app, request
+from lru_cache import LruCache
+
+class ResponseCache():
+    """
+    Caches the responses of the endpoints that are pure functions of their requests,
+    eg. `/calculateDate` and `/greeting/<name>`. An endpoint opts in by the decorator `cached()`,
+    and is cached if it is one of the configured `endpoints`.
+
+    1. The key of a response is the endpoint, the URL arguments, the query arguments (sorted),
+    the request body (as JSON with sorted keys, sorted form fields, or the raw bytes) and the headers listed in `vary`.
+    So requests that differ only in the order of their arguments or keys share the cached response.
+    2. Only complete 200 responses without cookies are cached, each until its TTL expires.
+    The least recently used responses are evicted when there are more than `max_entries` of them,
+    or when they take more than `max_bytes`.
+    3. A cached response with an ETag or a Last-Modified time is still answered with 304 (Not Modified)
+    for a matching conditional request.
+    4. With a `shared_dir`, the responses are also stored in files in that directory (see `SharedDirectoryCache`),
+    so that the processes of the app (eg. gunicorn workers) share the responses that any of them has cached.
+
+    The request hooks of the app (eg. CORS, metrics) still run on a cached response, as they wrap the view.
+    """
+
+    backends = ( "local", "shared" )
+    entry_excluded_headers = ( "Content-Type", "Content-Length", "Date" )
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 16 * 1024 * 1024, ttl: float = 3600,
+                 shared_dir: str = None, enabled: bool = True, endpoints: tuple = None):
+        """
+        :param max_entries: The maximum number of cached responses (of each process).
+        :param max_bytes: The maximum size (bytes) of the cached responses (of each process), including their headers.
+        :param ttl: The default time (seconds) for which a response is cached. `None` to cache it until it is evicted.
+        :param shared_dir: The directory of the responses shared by the processes, or `None` to cache them per process.
+        :param enabled: `False` to leave the endpoints uncached, ie. `cached()` returns the views as they are.
+        :param endpoints: Names of the endpoints to cache (of those decorated by `cached()`), or `None` for all of them.
+                          A cache hit costs about as much as a view that only formats its arguments (see
+                          `benchmarks/bench_response_cache.py`), so such views are better left uncached.
+        """
+        self.ttl = ttl
+        self.enabled = enabled
+        self.endpoints = set(endpoints) if endpoints is not None else None
+        self.local = LruCache(max_entries, max_bytes)
+        self.shared = SharedDirectoryCache(shared_dir, max_entries, max_bytes) if shared_dir else None
+        self.lock = threading.Lock()
+        self.endpoint_stats = {}
+
+    def create(config: dict):
+        """
+        Creates the response cache configured in the app configurations.
+
+        :param config: The app configurations, ie. `application.config`.
+        """
+        backend = config.get("RESPONSE_CACHE_BACKEND", "local")
+        if backend not in ResponseCache.backends:
+            raise ValueError(f"Unknown response cache backend: {backend}")
+        return ResponseCache(config.get("RESPONSE_CACHE_MAX_ENTRIES", 10000),
+                             config.get("RESPONSE_CACHE_MAX_BYTES", 16 * 1024 * 1024),
+                             config.get("RESPONSE_CACHE_TTL", 3600) or None,
+                             config["RESPONSE_CACHE_SHARED_DIR"] if backend == "shared" else None,
+                             config.get("RESPONSE_CACHE_ENABLED", True), config.get("RESPONSE_CACHE_ENDPOINTS"))
+
+    def cached(self, ttl: float = None, vary: tuple = ()):
+        """
+        Returns a decorator of a view that caches its responses, if it is one of the configured `endpoints`.
+        Apply it below `route()`, so that the route is added with the cached view (and the endpoint named after the view).
+
+        :param ttl: The time (seconds) for which a response of the view is cached, instead of the default TTL.
+        :param vary: Names of the request headers that the response depends on, eg. ("Accept",) for a view
+                     that negotiates its content type. They are added to the `Vary` header of the responses.
+        """
+        def decorator(view):
+            if not self.enabled or (self.endpoints is not None and view.__name__ not in self.endpoints):
+                return view
+
+            @functools.wraps(view)
+            def cached_view(*args, **kwargs):
+                key = self.get_key(vary)
+                entry = self.get(key)
+                if entry is None:
+                    response = current_app.make_response(view(*args, **kwargs))
+                    if vary:
+                        response.vary.update(vary) # Stored in the entry, so cached responses vary as well.
+                    entry = ResponseCache.to_entry(response)
+                    if entry is None:
+                        return response
+                    self.set(key, entry, ttl if ttl is not None else self.ttl)
+                return self.to_response(entry)
+            return cached_view
+        return decorator
+
+    def get_key(self, vary: tuple = ()) -> str:
+        """
+        Returns the cache key of the current request: the endpoint and a hash of the normalized request.
+
+        :param vary: Names of the request headers to include.
+        """
+        current = request._get_current_object() # Each access to the `request` proxy takes about 1 us.
+        parts = [ sorted(current.view_args.items()), sorted(current.args.items(multi=True)),
+                  [ current.headers.get(name, "") for name in vary ] ]
+        if current.method in ( "GET", "HEAD" ): # The body of a GET request has no meaning.
+            return f"{current.endpoint}-{hashlib.sha256(repr(parts).encode()).hexdigest()}"
+
+        mimetype = current.mimetype
+        parts += [ current.method, mimetype ]
+        data = current.get_json(silent=True) if current.is_json else None
+        is_form = mimetype in ( "application/x-www-form-urlencoded", "multipart/form-data" )
+        if data is not None:
+            parts.append(current_app.json.dumps(data, separators=( ",", ":" )))
+        elif is_form:
+            parts.append(sorted(current.form.items(multi=True)))
+        digest = hashlib.sha256(repr(parts).encode())
+        if data is None and not is_form:
+            digest.update(current.get_data())
+        return f"{current.endpoint}-{digest.hexdigest()}"
+
+    def to_entry(response) -> tuple:
+        """
+        Returns the cache entry `(status, content type, other headers, body)` of a response,
+        or `None` if it is not cacheable.
+        `Content-Length` is left out, as it is set from the body, and `Date`, as it is the time of the original response.
+        """
+        if response.status_code != 200 or response.is_streamed or "Set-Cookie" in response.headers \
+                or response.cache_control.no_store:
+            return None
+        headers = [ ( name, value ) for name, value in response.headers.items()
+                    if name not in ResponseCache.entry_excluded_headers ]
+        return ( response.status_code, response.content_type, headers, response.get_data() )
+
+    def to_response(self, entry: tuple):
+        """
+        Builds a response of the current request from a cache entry.
+        A conditional request is answered with 304 (Not Modified) if it matches the ETag or Last-Modified time of the entry.
+        """
+        status, content_type, headers, body = entry
+        response = current_app.response_class(body, status=status, content_type=content_type)
+        if headers:
+            response.headers.extend(headers)
+        environ = request.environ
+        if "HTTP_IF_NONE_MATCH" in environ or "HTTP_IF_MODIFIED_SINCE" in environ:
+            response = response.make_conditional(request)
+        return response
+
+    def get_entry_size(key: str, entry: tuple) -> int:
+        """
+        Returns the approximate size (bytes) of a cache entry: its key, headers and body.
+        """
+        status, content_type, headers, body = entry
+        return len(key) + len(content_type or "") + sum(len(name) + len(value) for name, value in headers) + len(body)
+
+    def get(self, key: str) -> tuple:
+        """
+        Returns the cached entry of a key, from this process or else from the shared directory,
+        or `None` if it is not cached. Counts the hit or miss of the endpoint.
+        """
+        entry = self.local.get(key)
+        result = "hits"
+        if entry is None and self.shared is not None:
+            entry, expires = self.shared.get(key)
+            if entry is not None:
+                self.local.set(key, entry, ResponseCache.get_entry_size(key, entry), expires)
+                result = "shared_hits"
+        if entry is None:
+            result = "misses"
+        endpoint = key.rsplit("-", 1)[0]
+        with self.lock:
+            stats = self.endpoint_stats.setdefault(endpoint, { "hits" : 0, "shared_hits" : 0, "misses" : 0 })
+            stats[result] += 1
+        return entry
+
+    def set(self, key: str, entry: tuple, ttl: float = None):
+        """
+        Caches an entry for `ttl` seconds (`None` for no expiry).
+        """
+        expires = time.time() + ttl if ttl is not None else None
+        self.local.set(key, entry, ResponseCache.get_entry_size(key, entry), expires)
+        if self.shared is not None:
+            self.shared.set(key, entry, expires)
+
+    def clear(self):
+        """
+        Removes all the cached responses, and resets the counters.
+        """
+        self.local.clear()
+        if self.shared is not None:
+            self.shared.clear()
+        with self.lock:
+            self.endpoint_stats = {}
+
+    def stats(self) -> dict:
+        """
+        Returns the counters of this process: hits and misses by endpoint,
+        and the entries, bytes, evictions and expirations of the local (and the shared) cache.
+        """
+        with self.lock:
+            endpoints = { endpoint : dict(stats) for endpoint, stats in self.endpoint_stats.items() }
+        result = {
+            "hits" : sum(stats["hits"] for stats in endpoints.values()),
+            "shared_hits" : sum(stats["shared_hits"] for stats in endpoints.values()),
+            "misses" : sum(stats["misses"] for stats in endpoints.values()),
+            "endpoints" : endpoints,
+            "local" : self.local.stats()
+        }
+        if self.shared is not None:
+            result["shared"] = self.shared.stats()
+        return result
+
+
+class SharedDirectoryCache():
+    """
+    The cached responses shared by the processes of the app, one file per entry in a directory
+    (eg. under `/dev/shm`, which is in memory), named by its key.
+
+    1. A file is written to a temporary file and renamed, so that no process reads a partly written entry.
+    2. Reading an entry touches its file, so that the modification times order the entries by their last use.
+    3. Every `prune_interval` writes (of a process), the expired entries are removed,
+    and the least recently used ones beyond `max_entries` and `max_bytes`.
+    So the directory may exceed the limits by up to that many entries of each process in between.
+
+    The directory should be emptied when the app is (re)deployed, as `gunicorn.conf.py` does.
+    """
+
+    prune_interval = 64
+
+    def __init__(self, directory: str, max_entries: int, max_bytes: int):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.writes = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.lock = threading.Lock()
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def get(self, key: str) -> tuple:
+        """
+        Returns the entry of a key and its expiry time, or `(None, None)` if it is not cached or has expired.
+        """
+        path = os.path.join(self.directory, key)
+        try:
+            with open(path, "rb") as entry_file:
+                header = json.loads(entry_file.readline())
+                body = entry_file.read()
+        except (OSError, ValueError):
+            return None, None
+        expires = header["expires"]
+        if expires is not None and expires <= time.time():
+            self.remove(path)
+            with self.lock:
+                self.expirations += 1
+            return None, None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return ( header["status"], header["content_type"], [ tuple(item) for item in header["headers"] ], body ), expires
+
+    def set(self, key: str, entry: tuple, expires: float = None):
+        """
+        Writes an entry until the time `expires` (`None` for no expiry), and prunes the directory every `prune_interval` writes.
+        """
+        status, content_type, headers, body = entry
+        if ResponseCache.get_entry_size(key, entry) > self.max_bytes:
+            return
+        header = json.dumps({ "status" : status, "content_type" : content_type, "headers" : headers,
+                              "expires" : expires }).encode()
+        with tempfile.NamedTemporaryFile(dir=self.directory, prefix=".", delete=False) as entry_file:
+            entry_file.write(header + b"\n" + body)
+        os.replace(entry_file.name, os.path.join(self.directory, key))
+        with self.lock:
+            self.writes += 1
+            prune = self.writes % SharedDirectoryCache.prune_interval == 0
+        if prune:
+            self.prune()
+
+    def list_entries(self) -> list:
+        """
+        Returns the (path, size, modification time) of the entries, the least recently used first.
+        """
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for item in scan:
+                if item.name.startswith("."):
+                    continue
+                try:
+                    stat = item.stat()
+                except OSError:
+                    continue
+                entries.append(( item.path, stat.st_size, stat.st_mtime ))
+        entries.sort(key=lambda item: item[2])
+        return entries
+
+    def prune(self):
+        """
+        Removes the expired entries, and the least recently used ones beyond `max_entries` and `max_bytes`.
+        """
+        entries = []
+        now = time.time()
+        for path, size, mtime in self.list_entries():
+            try:
+                with open(path, "rb") as entry_file:
+                    expires = json.loads(entry_file.readline())["expires"]
+            except (OSError, ValueError):
+                continue
+            if expires is not None and expires <= now:
+                self.remove(path)
+                with self.lock:
+                    self.expirations += 1
+            else:
+                entries.append(( path, size ))
+        total = sum(size for path, size in entries)
+        for path, size in entries[:max(len(entries) - self.max_entries, 0)]:
+            self.remove(path)
+            total -= size
+            with self.lock:
+                self.evictions += 1
+        for path, size in entries[max(len(entries) - self.max_entries, 0):]:
+            if total <= self.max_bytes:
+                break
+            self.remove(path)
+            total -= size
+            with self.lock:
+                self.evictions += 1
+
+    def remove(self, path: str):
+        """
+        Removes the file of an entry, if another process has not removed it already.
+        """
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        """
+        Removes all the entries, and resets the counters of this process.
+        """
+        for path, size, mtime in self.list_entries():
+            self.remove(path)
+        with self.lock:
+            self.writes = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the number and size of the entries in the directory,
+        and the eviction and expiration counters of this process.
+        """
+        entries = self.list_entries()
+        with self.lock:
+            return {
+                "entries" : len(entries),
+                "bytes" : sum(size for path, size, mtime in entries),
+                "evictions" : self.evictions,
+                "expirations" : self.expirations
+            }
@@ -0,0 +1,180 @@
+import zlib
+from werkzeug.datastructures import Headers
+from werkzeug.http import parse_accept_header, parse_etags, quote_etag, unquote_etag
+
+class ResponseCompression():
+    """
+    WSGI middleware that compresses response bodies with brotli (if the `brotli` package is installed) or gzip,
+    whichever the request accepts best (`Accept-Encoding`).
+
+    A response is compressed only if:
+    1. It is a compressible type (eg. JSON, text), and has no `Content-Encoding` yet (eg. a precompressed static file).
+    2. It has a body of at least `min_size` bytes.
+    A streamed response (one without a `Content-Length`) is of unknown size, and is not compressed
+    unless the view opts it in by `allow_streaming()`. It is then compressed chunk by chunk, and each chunk is flushed,
+    so it is still sent as it is generated.
+
+    Every response that would be compressed for a request that accepts compression gets `Vary: Accept-Encoding`,
+    also when it is not compressed (eg. the request does not accept compression, or is a HEAD request),
+    so that a shared cache does not serve one variant to a client that asked for the other.
+
+    The ETag of a compressed response gets a suffix of the encoding (eg. "<etag>-gzip"),
+    which is stripped from the `If-None-Match` header of a request before the app sees it.
+
+    The app must call `start_response()` before it returns the body, as a Flask app does.
+    """
+
+    compressible_types = ( "text/", "application/json", "application/x-ndjson", "application/javascript",
+                           "application/xml", "image/svg+xml" )
+    stream_key = "response_compression.stream" # Key of the WSGI environ that opts a streamed response in.
+
+    def __init__(self, app, min_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        """
+        :param app: The WSGI app, eg. `wsgi_app` of a Flask app.
+        :param min_size: The minimum size (bytes) of a response body to compress.
+        :param gzip_level: Compression level of gzip, 1 (fastest) to 9 (smallest).
+        :param brotli_quality: Compression quality of brotli, 0 (fastest) to 11 (smallest).
+        """
+        self.app = app
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        try:
+            import brotli
+            self.encodings = [ "br", "gzip" ]
+        except ImportError:
+            self.encodings = [ "gzip" ]
+
+    def allow_streaming(environ: dict):
+        """
+        Opts a streamed response of the current request in to compression.
+
+        :param environ: The WSGI environ of the request, eg. `request.environ` of Flask.
+        """
+        environ[ResponseCompression.stream_key] = True
+
+    def __call__(self, environ, start_response):
+        encoding = None
+        if environ.get("REQUEST_METHOD") != "HEAD":
+            encoding = parse_accept_header(environ.get("HTTP_ACCEPT_ENCODING")).best_match(self.encodings)
+        if encoding is None:
+            def varying_start_response(status, headers, exc_info=None):
+                headers = Headers(headers)
+                if self.get_action(environ, status, headers) is not None:
+                    ResponseCompression.add_vary(headers)
+                return start_response(status, headers.to_wsgi_list(), exc_info)
+            return self.app(environ, varying_start_response)
+
+        # The ETags of the compressed responses that the client has cached, without the suffix.
+        suffix = "-" + encoding
+        stripped = set()
+        if environ.get("HTTP_IF_NONE_MATCH"):
+            etags = parse_etags(environ["HTTP_IF_NONE_MATCH"])
+            stripped = { etag[:-len(suffix)] for etag in etags.as_set(include_weak=True) if etag.endswith(suffix) }
+            if stripped:
+                environ["HTTP_IF_NONE_MATCH"] += "".join(", " + quote_etag(etag) for etag in stripped)
+
+        state = {}
+        def compressing_start_response(status, headers, exc_info=None):
+            headers = Headers(headers)
+            action = self.get_action(environ, status, headers)
+            if action is not None:
+                ResponseCompression.add_vary(headers)
+            etag, weak = unquote_etag(headers.get("ETag"))
+            if etag is not None and (action == "compress" or etag in stripped):
+                headers["ETag"] = quote_etag(etag + suffix, weak)
+            if action != "compress":
+                return start_response(status, headers.to_wsgi_list(), exc_info)
+
+            headers["Content-Encoding"] = encoding
+            if "Content-Length" not in headers: # Streamed: compressed chunk by chunk.
+                state["stream"] = True
+                return start_response(status, headers.to_wsgi_list(), exc_info)
+            # Buffered: sent after the body is compressed, with its new length.
+            del headers["Content-Length"]
+            state["start"] = (status, headers, exc_info)
+            return state.setdefault("buffer", []).append
+
+        body = self.app(environ, compressing_start_response)
+        if state.get("stream"):
+            return self.compress_stream(body, self.create_compressor(encoding))
+        if "start" not in state:
+            return body
+        try:
+            data = b"".join(state["buffer"] + list(body))
+        finally:
+            if hasattr(body, "close"):
+                body.close()
+        compressor = self.create_compressor(encoding)
+        data = compressor(data, finish=True)
+        status, headers, exc_info = state["start"]
+        headers["Content-Length"] = str(len(data))
+        start_response(status, headers.to_wsgi_list(), exc_info)
+        return [ data ]
+
+    def get_action(self, environ: dict, status: str, headers: Headers) -> str:
+        """
+        Returns "compress" if a response is to be compressed,
+        "vary" if it would be compressed for a request that accepts compression, or `None` if it is not compressible.
+
+        :param environ: The WSGI environ of the request.
+        :param status: Status of the response.
+        :param headers: Headers of the response.
+        """
+        if "Content-Encoding" in headers or "no-transform" in headers.get("Cache-Control", ""):
+            return None
+        if not headers.get("Content-Type", "").startswith(ResponseCompression.compressible_types):
+            return None
+        length = headers.get("Content-Length", type=int)
+        if length is None and environ.get(ResponseCompression.stream_key) is None:
+            return None
+        if length is not None and length < self.min_size:
+            return None
+        code = int(status.split(" ", 1)[0])
+        if code < 200 or code in (204, 206, 304):
+            return "vary"
+        return "compress"
+
+    def add_vary(headers: Headers):
+        """
+        Adds `Accept-Encoding` to the `Vary` header of a response, unless it is already there.
+
+        :param headers: Headers of the response.
+        """
+        vary = headers.get("Vary")
+        if vary is None:
+            headers["Vary"] = "Accept-Encoding"
+        elif "accept-encoding" not in { value.strip().lower() for value in vary.split(",") } and vary.strip() != "*":
+            headers["Vary"] = f"{vary}, Accept-Encoding"
+
+    def create_compressor(self, encoding: str):
+        """
+        Returns a function `compress(chunk, finish)` that compresses the next chunk of a body,
+        and either flushes it (so that the chunk can be sent at once) or finishes the compressed body.
+
+        :param encoding: "br" or "gzip".
+        """
+        if encoding == "br":
+            import brotli
+            compressor = brotli.Compressor(quality=self.brotli_quality)
+            def compress(chunk: bytes, finish: bool = False) -> bytes:
+                return compressor.process(chunk) + (compressor.finish() if finish else compressor.flush())
+            return compress
+
+        compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS) # gzip format
+        def compress(chunk: bytes, finish: bool = False) -> bytes:
+            return compressor.compress(chunk) + compressor.flush(zlib.Z_FINISH if finish else zlib.Z_SYNC_FLUSH)
+        return compress
+
+    def compress_stream(self, body, compressor):
+        """
+        Compresses a streamed body chunk by chunk.
+        """
+        try:
+            for chunk in body:
+                if chunk:
+                    yield compressor(chunk)
+            yield compressor(b"", finish=True)
+        finally:
+            if hasattr(body, "close"):
+                body.close()
@@ -0,0 +1,157 @@
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+from flask import request, send_file
+from werkzeug.exceptions import NotFound
+from werkzeug.security import safe_join
+
+class StaticAssets():
+    """
+    Serves a directory of static files, eg. the scripts and style sheets of the API documentation page.
+
+    1. At build time, `build()` copies the files into a build directory,
+    with a gzip (and brotli, if the `brotli` package is installed) compressed variant of each text file,
+    and a manifest of the content hash and the variants of each file.
+    2. A file of a build directory is served in the encoding that the request accepts best (`Accept-Encoding`)
+    among its variants, so it is never compressed per request.
+    3. Each file has a strong ETag from its content hash.
+    A URL versioned by the hash (see `get_version()`) changes whenever the file does, so it is cached as `immutable`.
+    Any other URL is revalidated by the ETag on every use.
+
+    Without a build directory, the files are served as they are from their directory, and hashed on their first request.
+    """
+
+    manifest_name = "manifest.json"
+    compressed_types = ( ".js", ".css", ".map", ".html", ".json", ".svg", ".txt" )
+    min_compress_size = 1024 # Smaller files are not worth compressing.
+    encodings = { "br" : ".br", "gzip" : ".gz" } # Content coding and file suffix of the variants, in order of preference.
+    immutable_max_age = 365 * 24 * 60 * 60
+
+    def __init__(self, directory: str, built: bool = False):
+        """
+        :param directory: The directory of the files.
+        :param built: Whether the directory is a build directory created by `build()`.
+        """
+        self.directory = os.path.abspath(directory)
+        self.manifest = {}
+        self.built = built
+        if built:
+            with open(os.path.join(directory, StaticAssets.manifest_name), encoding="utf8") as manifest_file:
+                self.manifest = json.load(manifest_file)
+
+    def get_entry(self, filename: str) -> dict:
+        """
+        Returns the content hash and the variants of a file, `None` if there is no such file.
+
+        :param filename: Path of the file in the directory.
+        """
+        entry = self.manifest.get(filename)
+        if entry is None and not self.built:
+            path = safe_join(self.directory, filename)
+            if path is None or not os.path.isfile(path):
+                return None
+            with open(path, "rb") as asset_file:
+                entry = { "hash" : StaticAssets.hash(asset_file.read()), "encodings" : [] }
+            self.manifest[filename] = entry
+        return entry
+
+    def get_version(self, filename: str) -> str:
+        """
+        Returns the version of a file for its URL (ie. its content hash), `None` if there is no such file.
+
+        :param filename: Path of the file in the directory.
+        """
+        entry = self.get_entry(filename)
+        return entry["hash"] if entry is not None else None
+
+    def send(self, filename: str, version: str = None):
+        """
+        Returns the response of a file for the current request.
+
+        Raises `NotFound` if there is no such file.
+
+        :param filename: Path of the file in the directory.
+        :param version: The version requested by the URL, if any.
+        """
+        entry = self.get_entry(filename)
+        if entry is None:
+            raise NotFound()
+        encoding = request.accept_encodings.best_match(entry["encodings"]) if entry["encodings"] else None
+        path = safe_join(self.directory, filename + (StaticAssets.encodings[encoding] if encoding else ""))
+        etag = entry["hash"] + ("-" + encoding if encoding else "")
+        immutable = version == entry["hash"]
+
+        response = send_file(path, mimetype=mimetypes.guess_type(filename)[0] or "application/octet-stream",
+                             download_name=os.path.basename(filename), etag=etag, max_age=StaticAssets.immutable_max_age if immutable else None)
+        if encoding and response.status_code != 304:
+            response.content_encoding = encoding
+        if entry["encodings"]:
+            response.vary.add("Accept-Encoding")
+        if immutable:
+            response.cache_control.immutable = True
+        return response
+
+    def hash(data: bytes) -> str:
+        """
+        Returns the content hash of a file.
+
+        :param data: Content of the file.
+        """
+        return hashlib.sha256(data).hexdigest()[:16]
+
+    def compress(data: bytes, encoding: str) -> bytes:
+        """
+        Compresses the content of a file at the highest level of an encoding.
+
+        Raises `ImportError` if the encoding is "br" and the `brotli` package is not installed.
+
+        :param data: Content of the file.
+        :param encoding: "br" or "gzip".
+        """
+        if encoding == "br":
+            import brotli
+            return brotli.compress(data, quality=11)
+        return gzip.compress(data, compresslevel=9, mtime=0)
+
+    def build(source_dir: str, build_dir: str, exclude: tuple = ()) -> dict:
+        """
+        Build step: copies the files of a directory into a build directory,
+        with their compressed variants and the manifest. Returns the manifest.
+
+        A variant is only kept if it is smaller than the file.
+
+        :param source_dir: The directory of the files.
+        :param build_dir: The build directory.
+        :param exclude: Prefixes of the paths of the files not to copy.
+        """
+        manifest = {}
+        for root, _, names in os.walk(source_dir):
+            for name in sorted(names):
+                source_path = os.path.join(root, name)
+                filename = os.path.relpath(source_path, source_dir).replace(os.sep, "/")
+                if filename.startswith(exclude):
+                    continue
+                with open(source_path, "rb") as source_file:
+                    data = source_file.read()
+                target_path = os.path.join(build_dir, filename)
+                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                with open(target_path, "wb") as target_file:
+                    target_file.write(data)
+
+                entry = { "hash" : StaticAssets.hash(data), "encodings" : [] }
+                if name.endswith(StaticAssets.compressed_types) and len(data) >= StaticAssets.min_compress_size:
+                    for encoding, suffix in StaticAssets.encodings.items():
+                        try:
+                            compressed = StaticAssets.compress(data, encoding)
+                        except ImportError:
+                            continue
+                        if len(compressed) < len(data):
+                            with open(target_path + suffix, "wb") as target_file:
+                                target_file.write(compressed)
+                            entry["encodings"].append(encoding)
+                manifest[filename] = entry
+        with open(os.path.join(build_dir, StaticAssets.manifest_name), "w", encoding="utf8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=1, sort_keys=True)
+        return manifest
@@ -0,0 +1,184 @@
+from array import array
+import json
+import mmap
+import os
+import struct
+import sys
+from worker_columns import WorkerColumns
+from worker_query import WorkerQuery, WorkerIndex
+
+class WorkerBinary():
+    """
+    A fixed-layout binary format of the worker list, to be memory-mapped by the app.
+
+    The file is compiled from the JSON data file by a build step (see `compile()`).
+    Memory-mapping it instead of parsing the JSON file makes loading a near-zero-copy open,
+    and lets all the processes of the app share the same page-cache pages.
+
+    Layout (all integers are little-endian):
+    1. Header: magic `WKRB`, format version, worker count, sex value count,
+    the byte sizes of the name and sex value string tables and of the rows, the number of positions in the day mask index,
+    and the number of distinct values of each of `WorkerIndex.bitmap_columns`, as unsigned 32-bit integers.
+    2. Name offsets: (count + 1) unsigned 32-bit integers; name `i` is bytes `offsets[i]` to `offsets[i + 1]` of the name table.
+    3. Ages: count unsigned 16-bit integers.
+    4. Sex codes, membership flags and day masks: count unsigned bytes each.
+    5. Name string table (UTF-8), then the sex values (UTF-8, separated by NUL).
+    6. The `rows` of the columns (the workers that the columns do not represent exactly), as a JSON object
+    of the workers by position (UTF-8). Empty if there are none.
+    7. The day mask index of `WorkerRoster`: 129 unsigned 32-bit offsets into the positions that follow them;
+    the positions of mask `m` are `positions[offsets[m]:offsets[m + 1]]`.
+    8. The sort order and then the sort ranks of `WorkerIndex` for each of `WorkerQuery.sort_fields`:
+    count unsigned 32-bit integers each.
+    9. The bitmaps of `WorkerIndex` for each of `WorkerIndex.bitmap_columns`: the distinct values
+    as unsigned 32-bit integers, then the bitmap of each value, (count + 7) // 8 bytes each.
+
+    Each section starts at a multiple of 4 bytes.
+    The columns of a loaded file are `memoryview`s of the mapping, used as the columns of a `WorkerColumns`,
+    and so are the positions of the day mask index and the sort orders and ranks (in `indexes` of the columns),
+    which are therefore shared by the processes too. The bitmaps are copied into each process,
+    as a query operates on them as Python integers (one bit per worker and distinct value).
+
+    A compiled file must be replaced (eg. by `os.replace()`), never rewritten in place,
+    as processes may still have the old file mapped.
+    """
+
+    magic = b"WKRB"
+    version = 3
+    header = struct.Struct("<4s11I")
+
+    class Strings():
+        """
+        Read-only sequence of the strings in a string table, decoded on access.
+        """
+
+        def __init__(self, offsets, table):
+            """
+            :param offsets: The (count + 1) offsets of the strings in the table.
+            :param table: The string table (UTF-8).
+            """
+            self.offsets = offsets
+            self.table = table
+
+        def __len__(self):
+            return len(self.offsets) - 1
+
+        def __getitem__(self, index: int) -> str:
+            if index < 0:
+                index += len(self)
+            return str(self.table[self.offsets[index]:self.offsets[index + 1]], "utf8")
+
+    def compile(columns: WorkerColumns, binary_path: str):
+        """
+        Writes the worker list into a binary file.
+
+        The file is written to a temporary file first and then moved to `binary_path`,
+        so that a running app sees either the old or the new file.
+
+        :param columns: The worker list.
+        :param binary_path: Path to the binary file.
+        """
+        names = bytearray()
+        name_offsets = array("I", [ 0 ])
+        for name in columns.name:
+            names += name.encode("utf8")
+            name_offsets.append(len(names))
+        sex_values = "\0".join(columns.sex_values).encode("utf8")
+        rows = json.dumps(columns.rows, ensure_ascii=False, separators=( ",", ":" )).encode("utf8") if columns.rows else b""
+
+        from worker_roster import WorkerRoster # worker_roster imports this module.
+        day_mask_offsets = array("I", [ 0 ])
+        day_mask_positions = array("I")
+        for positions in WorkerRoster.build_index(columns.day_mask):
+            day_mask_positions.extend(positions)
+            day_mask_offsets.append(len(day_mask_positions))
+        index = WorkerIndex(columns)
+        bitmap_size = (len(columns) + 7) // 8
+
+        sections = [ name_offsets, array("H", columns.age),
+                     array("B", columns.sex), array("B", columns.is_reg_member), array("B", columns.day_mask),
+                     names, sex_values, rows, day_mask_offsets, day_mask_positions ]
+        for field in WorkerQuery.sort_fields:
+            sections += [ array("I", index.sort_orders[field]), array("I", index.sort_ranks[field]) ]
+        for column in WorkerIndex.bitmap_columns:
+            bitmaps = index.bitmaps[column]
+            sections.append(array("I", bitmaps))
+            sections += [ bitmaps[value].to_bytes(bitmap_size, "little") for value in bitmaps ]
+        temp_path = f"{binary_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as binary_file:
+            binary_file.write(WorkerBinary.header.pack(WorkerBinary.magic, WorkerBinary.version, len(columns),
+                                                       len(columns.sex_values), len(names), len(sex_values), len(rows),
+                                                       len(day_mask_positions),
+                                                       *[ len(index.bitmaps[column]) for column in WorkerIndex.bitmap_columns ]))
+            for section in sections:
+                if isinstance(section, array) and sys.byteorder != "little":
+                    section = array(section.typecode, section)
+                    section.byteswap()
+                binary_file.write(section)
+                binary_file.write(b"\0" * (-binary_file.tell() % 4))
+        os.replace(temp_path, binary_path)
+
+    def load(binary_path: str) -> WorkerColumns:
+        """
+        Memory-maps a binary file as a `WorkerColumns`.
+
+        Raises `ValueError` if the file is not a binary worker list of the supported version.
+
+        :param binary_path: Path to the binary file.
+        """
+        if sys.byteorder != "little":
+            raise ValueError("Binary worker lists can only be memory-mapped on little-endian platforms!")
+        with open(binary_path, "rb") as binary_file:
+            mapping = mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapping) < WorkerBinary.header.size or mapping[0:4] != WorkerBinary.magic \
+                or WorkerBinary.header.unpack_from(mapping)[1] != WorkerBinary.version:
+            mapping.close()
+            raise ValueError(f"{binary_path} is not a binary worker list of version {WorkerBinary.version}!")
+        view = memoryview(mapping)
+        _, _, count, sex_count, names_size, sex_values_size, rows_size, day_mask_size, *bitmap_counts \
+            = WorkerBinary.header.unpack_from(view)
+
+        offset = WorkerBinary.header.size
+        def section(size: int, format: str = "B"):
+            nonlocal offset
+            item_size = struct.calcsize(format)
+            result = view[offset:offset + size * item_size].cast(format)
+            offset += size * item_size
+            offset += -offset % 4
+            return result
+
+        columns = WorkerColumns()
+        name_offsets = section(count + 1, "I")
+        columns.age = section(count, "H")
+        columns.sex = section(count)
+        columns.is_reg_member = section(count)
+        columns.day_mask = section(count)
+        columns.name = WorkerBinary.Strings(name_offsets, section(names_size))
+        columns.sex_values = str(section(sex_values_size), "utf8").split("\0") if sex_count > 0 else []
+        if rows_size > 0:
+            columns.rows = { int(position) : row for position, row in json.loads(section(rows_size).tobytes()).items() }
+        day_mask_offsets = section(WorkerColumns.mask_count + 1, "I")
+        day_mask_positions = section(day_mask_size, "I")
+        columns.indexes["day_masks"] = [ day_mask_positions[day_mask_offsets[mask]:day_mask_offsets[mask + 1]]
+                                         for mask in range(WorkerColumns.mask_count) ]
+        columns.indexes["sort_orders"] = {}
+        columns.indexes["sort_ranks"] = {}
+        for field in WorkerQuery.sort_fields:
+            columns.indexes["sort_orders"][field] = section(count, "I")
+            columns.indexes["sort_ranks"][field] = section(count, "I")
+        columns.indexes["bitmaps"] = {}
+        for column, bitmap_count in zip(WorkerIndex.bitmap_columns, bitmap_counts):
+            values = section(bitmap_count, "I")
+            columns.indexes["bitmaps"][column] = { value : int.from_bytes(section((count + 7) // 8), "little")
+                                                   for value in values }
+        columns.mapping = mapping # Keeps the file mapped for as long as the columns are in use.
+        return columns
+
+if __name__ == "__main__":
+    # Build step: python worker_binary.py <JSON data file> <binary file>
+    from worker_roster import WorkerRoster
+
+    json_path, binary_path = sys.argv[1:3]
+    with open(json_path, encoding="utf8") as data_file:
+        columns = WorkerColumns.from_workers(WorkerRoster.iter_workers(data_file))
+    WorkerBinary.compile(columns, binary_path)
+    print(f"Compiled {len(columns)} worker(s) from {json_path} into {binary_path}.")
@@ -0,0 +1,178 @@
+from array import array
+import sys
+
+class WorkerColumns():
+    """
+    A compact, column-oriented store of the worker list.
+
+    Each field is held in its own column instead of one dict per worker:
+    1. `name`: list of interned strings.
+    2. `sex`: array of unsigned bytes, each an index into `sex_values`.
+    3. `is_reg_member`: array of unsigned bytes (1 = True, 0 = False).
+    4. `age`: array of unsigned shorts.
+    5. `day_mask`: array of unsigned bytes, the work days encoded as a 7-bit mask (bit 0 = Monday).
+
+    Worker dicts are materialized only when the workers are read, eg. for serialization.
+    A worker that the columns do not represent exactly (ie. with fields other than the above,
+    or with work days that are not distinct days of week in week order) is also kept as given in `rows`,
+    and is materialized as such; its columns still hold the values that it is indexed by.
+    A worker without one of the above fields, or with a value that does not fit its column, is rejected.
+    """
+
+    fields = ( "name", "sex", "is_reg_member", "age", "work_days" )
+    max_age = 65535
+
+    days_of_week = ( "MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY" )
+    day_bits = { day : 1 << i for i, day in enumerate(days_of_week) }
+    mask_count = 1 << len(days_of_week)
+    mask_days = [] # The day-of-week names of each day mask, in week order. Populated below the class.
+
+    class Selection():
+        """
+        A read-only sequence of the workers at some positions of a `WorkerColumns`.
+
+        Workers are materialized as dicts only when accessed,
+        and slicing a selection does not materialize any worker.
+        """
+
+        def __init__(self, columns, positions):
+            """
+            :param columns: The columns.
+            :param positions: Sequence of the positions of the selected workers.
+            """
+            self.columns = columns
+            self.positions = positions
+
+        def __len__(self):
+            return len(self.positions)
+
+        def __getitem__(self, item):
+            if isinstance(item, slice):
+                return WorkerColumns.Selection(self.columns, self.positions[item])
+            return self.columns.get(self.positions[item])
+
+        def __iter__(self):
+            get = self.columns.get
+            for position in self.positions:
+                yield get(position)
+
+    def __init__(self):
+        self.name = []
+        self.sex = array("B")
+        self.sex_values = []
+        self.is_reg_member = array("B")
+        self.age = array("H")
+        self.day_mask = array("B")
+        self.rows = {} # The position of each worker that the columns do not represent exactly -> the worker.
+        self.indexes = {} # The indexes of the workers precomputed in a compiled file (see `WorkerBinary`), by name.
+        self._sex_codes = {}
+
+    def __len__(self):
+        return len(self.name)
+
+    def from_workers(workers):
+        """
+        Builds the columns of a worker list.
+        Raises `ValueError` with the position of the first invalid worker (see `validate()`).
+
+        :param workers: Iterable of the workers, as dicts.
+        """
+        columns = WorkerColumns()
+        for position, worker in enumerate(workers):
+            try:
+                columns.append(worker)
+            except ValueError as e:
+                raise ValueError(f"Invalid worker at position {position}: {e}") from None
+        return columns
+
+    def encode_days(days) -> int:
+        """
+        Encodes a collection of day-of-week names as a 7-bit mask.
+        Names that are not a day of week are ignored.
+
+        :param days: The day-of-week names, eg. `[ "MONDAY", "FRIDAY" ]`.
+        """
+        mask = 0
+        for day in days:
+            mask |= WorkerColumns.day_bits.get(day, 0)
+        return mask
+
+    def validate(worker: dict):
+        """
+        Raises `ValueError` with the reason if a worker cannot be held in the columns:
+        it is not an object, misses a field, or has a value of the wrong type or out of the range of its column.
+
+        :param worker: The worker, as a dict.
+        """
+        if not isinstance(worker, dict):
+            raise ValueError("not an object")
+        missing = [ field for field in WorkerColumns.fields if field not in worker ]
+        if missing:
+            raise ValueError(f"missing {', '.join(missing)}")
+        if not isinstance(worker["name"], str) or not isinstance(worker["sex"], str):
+            raise ValueError("name and sex must be strings")
+        if not isinstance(worker["is_reg_member"], bool):
+            raise ValueError("is_reg_member must be a boolean")
+        age = worker["age"]
+        if not isinstance(age, int) or isinstance(age, bool) or not 0 <= age <= WorkerColumns.max_age:
+            raise ValueError(f"age must be an integer from 0 to {WorkerColumns.max_age}")
+        if not isinstance(worker["work_days"], list) or not all(isinstance(day, str) for day in worker["work_days"]):
+            raise ValueError("work_days must be an array of strings")
+
+    def append(self, worker: dict):
+        """
+        Adds a worker to the end of the columns.
+        Raises `ValueError` if the worker cannot be held in the columns (see `validate()`).
+
+        :param worker: The worker, as a dict.
+        """
+        WorkerColumns.validate(worker)
+        day_mask = WorkerColumns.encode_days(worker["work_days"])
+        if len(worker) != len(WorkerColumns.fields) or worker["work_days"] != list(WorkerColumns.mask_days[day_mask]):
+            self.rows[len(self)] = worker
+        sex_code = self._sex_codes.get(worker["sex"])
+        if sex_code is None:
+            sex_code = len(self.sex_values)
+            self.sex_values.append(worker["sex"])
+            self._sex_codes[worker["sex"]] = sex_code
+        self.name.append(sys.intern(worker["name"]))
+        self.sex.append(sex_code)
+        self.is_reg_member.append(1 if worker["is_reg_member"] else 0)
+        self.age.append(worker["age"])
+        self.day_mask.append(day_mask)
+
+    def get(self, position: int) -> dict:
+        """
+        Materializes the worker at a position as a dict.
+
+        :param position: The position.
+        """
+        if self.rows:
+            row = self.rows.get(position)
+            if row is not None:
+                return dict(row, work_days=list(row["work_days"]))
+        return {
+            "name" : self.name[position],
+            "sex" : self.sex_values[self.sex[position]],
+            "is_reg_member" : self.is_reg_member[position] == 1,
+            "age" : self.age[position],
+            "work_days" : list(WorkerColumns.mask_days[self.day_mask[position]])
+        }
+
+    def select(self, positions):
+        """
+        Returns the workers at some positions as a `Selection`.
+
+        :param positions: Sequence of the positions.
+        """
+        return WorkerColumns.Selection(self, positions)
+
+    def all(self):
+        """
+        Returns all the workers as a `Selection`.
+        """
+        return WorkerColumns.Selection(self, range(len(self)))
+
+WorkerColumns.mask_days.extend(
+    tuple(day for day in WorkerColumns.days_of_week if mask & WorkerColumns.day_bits[day])
+    for mask in range(WorkerColumns.mask_count))
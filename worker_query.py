@@ -0,0 +1,239 @@
+import bisect
+import re
+from array import array
+
+class WorkerQuery():
+    """
+    The criteria of a query on the worker list.
+
+    All the criteria must be met by a worker for it to be included in the result.
+    Criteria that are `None` are not applied.
+    """
+
+    sort_fields = ( "name", "age" )
+    sort_orders = ( "asc", "desc" )
+
+    def __init__(self, day_mask: int = 0, age_min: int = None, age_max: int = None,
+                 sex: str = None, is_reg_member: bool = None,
+                 sort_by: str = None, order: str = "asc"):
+        """
+        :param day_mask: Mask of the days that a worker's work days must include.
+        :param age_min: Minimum age, inclusive.
+        :param age_max: Maximum age, inclusive.
+        :param sex: Sex, eg. "M".
+        :param is_reg_member: Whether the worker is a registered member.
+        :param sort_by: Field to sort the result by, one of `sort_fields`. Data file order if `None`.
+        :param order: Sort order, one of `sort_orders`.
+        """
+        self.day_mask = day_mask
+        self.age_min = age_min
+        self.age_max = age_max
+        self.sex = sex
+        self.is_reg_member = is_reg_member
+        self.sort_by = sort_by
+        self.order = order
+        self.key = (day_mask, age_min, age_max, sex, is_reg_member, sort_by, order)
+
+    def is_day_mask_only(self) -> bool:
+        """
+        Returns whether the query has no criteria other than the day mask.
+        """
+        return self.key[1:] == (None, None, None, None, None, "asc")
+
+    def from_request(data: dict, day_mask: int = 0):
+        """
+        Builds a query from the request data of `/getWorkers`.
+
+        Raises `ValueError` with the error message for the response if a parameter is invalid.
+
+        :param data: The request data.
+        :param day_mask: The day mask of the (already validated) parameter `work_days`.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("The request data must be a JSON object!")
+        for name in [ "age_min", "age_max" ]:
+            value = data.get(name)
+            if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value < 0):
+                raise ValueError(f"Invalid value for parameter {name}!")
+        if data.get("sex") is not None and not isinstance(data["sex"], str):
+            raise ValueError("Invalid value for parameter sex!")
+        if data.get("is_reg_member") is not None and not isinstance(data["is_reg_member"], bool):
+            raise ValueError("Invalid value for parameter is_reg_member!")
+        if data.get("sort_by") is not None and data["sort_by"] not in WorkerQuery.sort_fields:
+            raise ValueError("Invalid value for parameter sort_by!")
+        if data.get("order", "asc") not in WorkerQuery.sort_orders:
+            raise ValueError("Invalid value for parameter order!")
+        return WorkerQuery(day_mask, data.get("age_min"), data.get("age_max"),
+                           data.get("sex"), data.get("is_reg_member"),
+                           data.get("sort_by"), data.get("order", "asc"))
+
+
+class WorkerIndex():
+    """
+    Precomputed indexes of a worker list for answering a `WorkerQuery`.
+
+    1. Sets of workers are held as bitmaps, where bit `i` is set if the worker at position `i` of the list is in the set.
+    2. The ages are held as a sorted array of the distinct ages, plus prefix bitmaps
+    of the workers younger than each of them, so that an age range is two bisect lookups and one bitmap operation.
+    3. `sex`, `is_reg_member` and the exact work-day masks have one bitmap per distinct value.
+    4. The worker positions in sort order, and the rank of each worker in it,
+    are precomputed for each of `WorkerQuery.sort_fields`.
+    The bitmaps by value, sort orders and ranks are taken from the `indexes` of the columns if they have them
+    (ie. if they are loaded from a `WorkerBinary` file), and built from the columns otherwise.
+
+    A query is therefore answered with a few bitmap operations,
+    and its result is the positions of the matching workers in the `WorkerColumns`.
+    The bitmap operations still take time linear in the size of the list, but in C, a machine word at a time;
+    the Python work to list the result is proportional to the number of matching workers
+    (plus a scan of the sort order, for a sorted result that matches a large share of the list).
+    """
+
+    # The set bit positions of each byte value.
+    byte_bits = [ tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256) ]
+    # Runs of non-zero bytes of a bitmap, so that the zero bytes are skipped in C.
+    nonzero_runs = re.compile(rb"[^\x00]+")
+    # A sorted result is sorted by rank if it has fewer than 1 in `sort_scan_ratio` workers of the list,
+    # and taken from the precomputed sort order otherwise.
+    sort_scan_ratio = 4
+    # The columns with a bitmap of the workers of each distinct value.
+    bitmap_columns = ( "sex", "is_reg_member", "day_mask", "age" )
+
+    def __init__(self, columns):
+        """
+        :param columns: The worker list, as a `WorkerColumns`.
+        """
+        self.size = len(columns)
+        self.all = (1 << self.size) - 1
+
+        # Column -> value (code) -> bitmap.
+        self.bitmaps = columns.indexes.get("bitmaps") \
+            or { column : self.group_bitmaps(getattr(columns, column)) for column in WorkerIndex.bitmap_columns }
+        self.by_sex = { columns.sex_values[code] : bitmap for code, bitmap in self.bitmaps["sex"].items() }
+        self.by_member = { code == 1 : bitmap for code, bitmap in self.bitmaps["is_reg_member"].items() }
+        self.by_day_mask = self.bitmaps["day_mask"]
+        self.day_mask_bitmaps = {}
+
+        by_age = self.bitmaps["age"]
+        self.ages = sorted(by_age)
+        self.younger_than = [ 0 ]
+        for age in self.ages:
+            self.younger_than.append(self.younger_than[-1] | by_age[age])
+
+        self.sort_orders = columns.indexes.get("sort_orders") \
+            or { field : WorkerIndex.build_sort_order(columns, field) for field in WorkerQuery.sort_fields }
+        self.sort_ranks = columns.indexes.get("sort_ranks") \
+            or { field : WorkerIndex.build_sort_ranks(sort_order) for field, sort_order in self.sort_orders.items() }
+
+    def build_sort_order(columns, field: str) -> array:
+        """
+        Builds the worker positions sorted by a field (stable, ie. in list order for equal values).
+
+        :param columns: The worker list, as a `WorkerColumns`.
+        :param field: One of `WorkerQuery.sort_fields`.
+        """
+        return array("I", sorted(range(len(columns)), key=getattr(columns, field).__getitem__))
+
+    def build_sort_ranks(sort_order) -> array:
+        """
+        Builds the rank of each worker in a sort order, by worker position.
+
+        :param sort_order: The worker positions in sort order.
+        """
+        ranks = array("I", bytes(4 * len(sort_order)))
+        for rank, position in enumerate(sort_order):
+            ranks[position] = rank
+        return ranks
+
+    def group_bitmaps(self, values) -> dict:
+        """
+        Builds the bitmap of the positions of each distinct value.
+
+        :param values: The value of each worker, in list order.
+        """
+        groups = {}
+        for position, value in enumerate(values):
+            groups.setdefault(value, []).append(position)
+        return { value : self.to_bitmap(positions) for value, positions in groups.items() }
+
+    def to_bitmap(self, positions) -> int:
+        """
+        Converts worker positions into a bitmap.
+
+        :param positions: The positions.
+        """
+        bitmap_bytes = bytearray((self.size + 7) // 8)
+        for position in positions:
+            bitmap_bytes[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes(bitmap_bytes, "little")
+
+    def from_bitmap(self, bitmap: int) -> list:
+        """
+        Converts a bitmap into the worker positions, in ascending order.
+
+        :param bitmap: The bitmap.
+        """
+        positions = []
+        bitmap_bytes = bitmap.to_bytes((self.size + 7) // 8, "little")
+        for run in WorkerIndex.nonzero_runs.finditer(bitmap_bytes):
+            for byte_index in range(run.start(), run.end()):
+                base = byte_index << 3
+                positions.extend(base + bit for bit in WorkerIndex.byte_bits[bitmap_bytes[byte_index]])
+        return positions
+
+    def get_day_mask_bitmap(self, day_mask: int) -> int:
+        """
+        Returns the bitmap of the workers whose work days include all the days in a day mask.
+        The result is memoized per day mask.
+
+        :param day_mask: The day mask.
+        """
+        bitmap = self.day_mask_bitmaps.get(day_mask)
+        if bitmap is None:
+            bitmap = 0
+            for worker_mask, worker_bitmap in self.by_day_mask.items():
+                if worker_mask & day_mask == day_mask:
+                    bitmap |= worker_bitmap
+            self.day_mask_bitmaps[day_mask] = bitmap
+        return bitmap
+
+    def get_age_bitmap(self, age_min: int, age_max: int) -> int:
+        """
+        Returns the bitmap of the workers within an age range.
+
+        :param age_min: Minimum age, inclusive. No minimum if `None`.
+        :param age_max: Maximum age, inclusive. No maximum if `None`.
+        """
+        low = 0 if age_min is None else bisect.bisect_left(self.ages, age_min)
+        high = len(self.ages) if age_max is None else bisect.bisect_right(self.ages, age_max)
+        if low >= high:
+            return 0
+        return self.younger_than[high] & ~self.younger_than[low]
+
+    def find(self, query: WorkerQuery) -> list:
+        """
+        Returns the positions of the workers matching a query.
+
+        :param query: The query.
+        """
+        bitmap = self.all
+        if query.day_mask:
+            bitmap &= self.get_day_mask_bitmap(query.day_mask)
+        if query.age_min is not None or query.age_max is not None:
+            bitmap &= self.get_age_bitmap(query.age_min, query.age_max)
+        if query.sex is not None:
+            bitmap &= self.by_sex.get(query.sex, 0)
+        if query.is_reg_member is not None:
+            bitmap &= self.by_member.get(query.is_reg_member, 0)
+
+        if query.sort_by is None:
+            positions = self.from_bitmap(bitmap)
+        elif bitmap.bit_count() * WorkerIndex.sort_scan_ratio < self.size:
+            positions = self.from_bitmap(bitmap)
+            positions.sort(key=self.sort_ranks[query.sort_by].__getitem__)
+        else:
+            bitmap_bytes = bitmap.to_bytes((self.size + 7) // 8, "little")
+            positions = [ position for position in self.sort_orders[query.sort_by]
+                          if bitmap_bytes[position >> 3] >> (position & 7) & 1 ]
+        if query.order == "desc":
+            positions.reverse()
+        return positions
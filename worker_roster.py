@@ -0,0 +1,273 @@
+import hashlib
+import heapq
+import json
+import logging
+import os
+import threading
+from array import array
+from worker_columns import WorkerColumns
+from worker_binary import WorkerBinary
+from worker_query import WorkerQuery, WorkerIndex
+from lru_cache import LruCache
+
+class WorkerRoster():
+    """
+    Holds the worker list of a JSON data file in memory.
+
+    1. The data file is loaded once per process, on the first request for the data.
+    2. On later requests, the file is reloaded only if its signature
+    (inode, size and modification time) has changed since the last load.
+    3. A reload builds a new snapshot and swaps it in with a single assignment,
+    so that concurrent requests see either the old or the new list, never a half-loaded one.
+    4. Each worker's work days are encoded as a 7-bit mask (bit 0 = Monday) when the file is loaded,
+    and the workers matching every one of the 128 possible masks are indexed in advance.
+    5. The encoded response body of each query is cached in the snapshot,
+    so that a reload also discards the cached bodies. The least recently used bodies are evicted
+    beyond `encoded_max_entries` bodies or `encoded_max_bytes` bytes.
+    6. The data file is parsed incrementally, one worker at a time,
+    so that the whole JSON text is never held in memory.
+    7. Queries with criteria other than the work days are answered by a `WorkerIndex` of the snapshot.
+    8. The workers are held in a compact `WorkerColumns` store,
+    and the indexes hold worker positions rather than worker dicts.
+    9. A data file with extension `.bin` is a `WorkerBinary` file compiled from the JSON data file,
+    and is memory-mapped instead of parsed, with the indexes of 4 and 7 precomputed in it.
+    """
+
+    read_chunk_size = 64 * 1024
+    encoded_max_entries = 1024
+    encoded_max_bytes = 64 * 1024 * 1024
+
+    days_of_week = WorkerColumns.days_of_week
+    mask_count = WorkerColumns.mask_count
+    encode_days = WorkerColumns.encode_days
+
+    class Snapshot():
+        """
+        The worker data loaded from the data file at a point in time.
+
+        Instances are never modified after creation.
+        """
+
+        def __init__(self, signature: tuple, columns: WorkerColumns):
+            self.signature = signature
+            self.columns = columns
+            self.index = columns.indexes.get("day_masks") or WorkerRoster.build_index(columns.day_mask)
+            self.query_index = WorkerIndex(columns)
+            self.encoded = LruCache(WorkerRoster.encoded_max_entries, WorkerRoster.encoded_max_bytes)
+
+        def find_workers(self, query: WorkerQuery) -> WorkerColumns.Selection:
+            """
+            Returns the workers matching a query.
+            Unless the query specifies a sort order, the workers are in the same order as in the data file.
+
+            :param query: The query.
+            """
+            if query.is_day_mask_only():
+                return self.columns.select(self.index[query.day_mask])
+            return self.columns.select(self.query_index.find(query))
+
+        def find_page(self, query: WorkerQuery, start: int, limit: int = None) -> tuple:
+            """
+            Returns a page of the workers matching a query, as a tuple `(workers, next start)`.
+            The next start is `None` on the last page.
+
+            :param query: The query.
+            :param start: The position of the first worker of the page in the result of the query.
+            :param limit: The maximum number of workers of the page. No maximum if `None`.
+            """
+            workers = self.find_workers(query)
+            end = len(workers) if limit is None else min(start + limit, len(workers))
+            return (workers[start:end], end if end < len(workers) else None)
+
+        def get_encoded(self, query: WorkerQuery, encode) -> tuple:
+            """
+            Returns the encoded response body of the workers matching a query
+            and its strong ETag, as a tuple `(body, etag)`.
+
+            The body is encoded on the first call for each distinct query only, until it is evicted.
+
+            :param query: The query.
+            :param encode: Function that encodes the response data (a `dict`) into `bytes`.
+            """
+            encoded = self.encoded.get(query.key)
+            if encoded is None:
+                data = { "workers" : list(self.find_workers(query)) }
+                body = encode(data)
+                encoded = (body, hashlib.sha1(body).hexdigest())
+                self.encoded.set(query.key, encoded, len(body))
+            return encoded
+
+    def __init__(self, path: str):
+        """
+        :param path: Path to the JSON data file, or to its compiled `WorkerBinary` file (`.bin`).
+        """
+        self.path = path
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.reloads = 0
+
+    def get(self) -> dict:
+        """
+        Returns the worker data, reloading the data file first if it has changed.
+        The workers are materialized as dicts on every call.
+        """
+        return { "workers" : list(self.get_snapshot().columns.all()) }
+
+    def get_snapshot(self) -> Snapshot:
+        """
+        Returns the current snapshot of the worker data,
+        reloading the data file first if it has changed.
+        """
+        signature = self._get_signature()
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.signature != signature:
+            with self._lock:
+                # Another thread may have reloaded the file while this one was waiting.
+                snapshot = self._snapshot
+                if snapshot is None or snapshot.signature != signature:
+                    snapshot = self._load(signature)
+                    self._snapshot = snapshot
+                    self.reloads += 1
+                    return snapshot
+        self.hits += 1
+        return snapshot
+
+    def invalidate(self):
+        """
+        Discards the loaded snapshot so that the data file is reloaded on the next request.
+        """
+        self._snapshot = None
+
+    def stats(self) -> dict:
+        """
+        Returns the cache hit and reload counters of this roster.
+        """
+        return {
+            "hits" : self.hits,
+            "reloads" : self.reloads
+        }
+
+    def build_index(day_masks) -> list:
+        """
+        Builds the positions of the matching workers for each of the 128 possible day masks.
+
+        A worker matches a mask if the worker's own mask includes every bit of it.
+        Positions are first grouped by the workers' exact masks,
+        so that each entry is a merge of the groups that are supersets of the mask
+        rather than a scan of the whole list.
+
+        :param day_masks: The day mask of each worker, in list order.
+        """
+        groups = {}
+        for position, mask in enumerate(day_masks):
+            groups.setdefault(mask, []).append(position)
+
+        index = []
+        for mask in range(WorkerRoster.mask_count):
+            matches = [ positions for worker_mask, positions in groups.items() if worker_mask & mask == mask ]
+            index.append(array("I", heapq.merge(*matches)))
+        return index
+
+    def iter_workers(data_file, chunk_size: int = read_chunk_size):
+        """
+        Parses the worker data file incrementally, yielding the workers one at a time.
+
+        The file is read in chunks and only the text of the workers not yet parsed is buffered.
+        Members of the top-level object other than `workers` are skipped.
+        The whole file is validated, up to the end of the top-level object and of the file:
+        `ValueError` is raised with the position (character offset in the file) of the first error.
+
+        :param data_file: The data file, opened in text mode.
+        :param chunk_size: Number of characters to read from the file at a time.
+        """
+        decoder = json.JSONDecoder()
+        buffer = ""
+        pos = 0
+        consumed = 0 # Number of characters of the file before the buffer.
+        eof = False
+
+        def read_more():
+            nonlocal buffer, pos, consumed, eof
+            chunk = data_file.read(chunk_size)
+            eof = not chunk
+            consumed += pos
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return not eof
+
+        def skip_whitespace() -> bool:
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos].isspace():
+                    pos += 1
+                if pos < len(buffer):
+                    return True
+                if not read_more():
+                    return False
+
+        def next_token() -> str:
+            if not skip_whitespace():
+                raise ValueError(f"Unexpected end of worker data file at character {consumed + pos}!")
+            return buffer[pos]
+
+        def expect(token: str):
+            nonlocal pos
+            if next_token() != token:
+                raise ValueError(f"Expected '{token}' at character {consumed + pos} of the worker data file!")
+            pos += 1
+
+        def decode_value():
+            nonlocal pos
+            next_token()
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    error_pos = consumed + e.pos
+                    if eof or not read_more():
+                        raise ValueError(f"{e.msg} at character {error_pos} of the worker data file!") from None
+                    continue
+                # A value that ends with the buffer (eg. a number) may continue in the next chunk.
+                if end < len(buffer) or eof:
+                    pos = end
+                    return value
+                read_more()
+
+        expect("{")
+        if next_token() != "}":
+            while True:
+                key_pos = consumed + pos
+                key = decode_value()
+                if not isinstance(key, str):
+                    raise ValueError(f"Expected a member name at character {key_pos} of the worker data file!")
+                expect(":")
+                if key == "workers":
+                    expect("[")
+                    if next_token() != "]":
+                        while True:
+                            yield decode_value()
+                            if next_token() == "]":
+                                break
+                            expect(",")
+                    expect("]")
+                else:
+                    decode_value()
+                if next_token() == "}":
+                    break
+                expect(",")
+        expect("}")
+        if skip_whitespace():
+            raise ValueError(f"Unexpected data after the worker data at character {consumed + pos} of the worker data file!")
+
+    def _get_signature(self) -> tuple:
+        stat = os.stat(self.path)
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _load(self, signature: tuple) -> Snapshot:
+        logging.info('[WorkerRoster] Loading worker data from %s', self.path)
+        if self.path.endswith(".bin"):
+            return WorkerRoster.Snapshot(signature, WorkerBinary.load(self.path))
+        with open(self.path, encoding="utf8") as data_file:
+            columns = WorkerColumns.from_workers(WorkerRoster.iter_workers(data_file))
+        return WorkerRoster.Snapshot(signature, columns)